@@ -1,6 +1,4 @@
-def main():
-    print("Hello from clean-code-examples!")
-
+from src.lottery07.cli import main
 
 if __name__ == "__main__":
     main()
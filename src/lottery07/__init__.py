@@ -13,38 +13,68 @@ from .const import (
     LOTTO_MIN_NUMBER,
     LOTTO_NUMBER_COUNT,
     RANK_BY_MATCH_COUNT,
+    RANK_CODE_BY_MATCH_COUNT,
+    RANK_FAIL,
+    RANK_NAMES,
 )
 from .game import (
     count_match,
+    count_match_many,
+    count_ranks,
     get_rank,
+    get_rank_many,
     play_game,
+    rank_name,
     read_user_numbers,
 )
 from .generator import (
+    AntiPopularLottoGenerator,
     AutoLottoGenerator,
+    ConstrainedLottoGenerator,
     FixedLottoGenerator,
     LottoGenerator,
     ManualLottoGenerator,
+    WeightedLottoGenerator,
+    WheelLottoGenerator,
 )
 from .model import LottoNumbers, LottoResult
+from .sink import BufferedTextSink, NullSink, OutputSink, RecordSink
+from .system_ticket import SystemTicket
 
 __all__ = [
     # 게임 로직
     "read_user_numbers",
     "count_match",
+    "count_match_many",
     "get_rank",
+    "get_rank_many",
+    "rank_name",
+    "count_ranks",
     "play_game",
     # 생성 전략
     "LottoGenerator",
     "AutoLottoGenerator",
     "ManualLottoGenerator",
     "FixedLottoGenerator",
+    "AntiPopularLottoGenerator",
+    "WeightedLottoGenerator",
+    "ConstrainedLottoGenerator",
+    "WheelLottoGenerator",
     # 상수
     "LOTTO_NUMBER_COUNT",
     "LOTTO_MIN_NUMBER",
     "LOTTO_MAX_NUMBER",
     "RANK_BY_MATCH_COUNT",
+    "RANK_FAIL",
+    "RANK_NAMES",
+    "RANK_CODE_BY_MATCH_COUNT",
     # 모델
     "LottoNumbers",
     "LottoResult",
+    "SystemTicket",
+    # 출력 싱크
+    "OutputSink",
+    "BufferedTextSink",
+    "RecordSink",
+    "NullSink",
 ]
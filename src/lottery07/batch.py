@@ -0,0 +1,161 @@
+"""
+비대화형 일괄 게임 (야간 배치용)
+
+play_game()은 티켓 한 장을 input/print로 주고받지만, 일괄 모드는 티켓 파일(또는 stdin)을
+청크 단위로 읽어 모든 티켓의 결과를 파일에 씁니다. 티켓마다 프롬프트나 print 호출이 없고,
+청크 하나의 결과를 문자열/바이트로 모아 한 번에 기록합니다.
+
+출력 형식
+- csv   : ticket_id,numbers,match_count,rank
+- ndjson: {"ticket_id": 1, "numbers": [...], "match_count": 3, "rank": "4th"}
+- binary: 헤더(매직 b"LRES" + 당첨 번호 6개) 뒤에 청크마다
+          건수(uint32) + id(uint64 열) + 마스크(uint64 열) + 일치 개수(uint8 열) + 등수 코드(uint8 열), 리틀 엔디안
+
+명령행에서는 통합 CLI의 play 하위 명령(python main.py play)으로 실행합니다.
+"""
+
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Iterator, TextIO
+
+from src.lottery07.const import RANK_NAMES
+from src.lottery07.generator import LottoGenerator
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import (
+    DEFAULT_CHUNK_SIZE,
+    WINNER_HEADER,
+    SettlementReport,
+    format_winner,
+    parse_ticket_chunk,
+    read_ticket_chunks,
+    settle_chunk,
+)
+from src.lottery07.ticket import TicketBatch, mask_to_numbers
+
+RESULT_FORMATS = ("csv", "ndjson", "binary")
+
+BINARY_MAGIC = b"LRES"
+_BINARY_HEADER = struct.Struct("<4s6B")
+_BINARY_COUNT = struct.Struct("<I")
+
+# 출력 파일 버퍼 크기
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class CsvResultWriter:
+    """결과를 CSV로 기록 (정산의 당첨 티켓 CSV와 같은 열)"""
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+
+    def start(self, lotto: LottoNumbers) -> None:
+        self.out.write(WINNER_HEADER)
+
+    def write(self, batch: TicketBatch, match_counts: bytes, rank_codes: bytes) -> None:
+        self.out.write("".join(map(format_winner, batch.ids, batch.masks, match_counts, rank_codes)))
+
+
+class NdjsonResultWriter:
+    """결과를 한 줄에 JSON 객체 하나로 기록"""
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+
+    def start(self, lotto: LottoNumbers) -> None:
+        pass
+
+    def write(self, batch: TicketBatch, match_counts: bytes, rank_codes: bytes) -> None:
+        self.out.write(
+            "".join(
+                f'{{"ticket_id":{ticket_id},"numbers":[{",".join(map(str, mask_to_numbers(mask)))}],'
+                f'"match_count":{match_count},"rank":"{RANK_NAMES[code]}"}}\n'
+                for ticket_id, mask, match_count, code in zip(batch.ids, batch.masks, match_counts, rank_codes)
+            )
+        )
+
+
+class BinaryResultWriter:
+    """결과를 청크별 열(column) 블록으로 기록"""
+
+    def __init__(self, out: BinaryIO) -> None:
+        self.out = out
+
+    def start(self, lotto: LottoNumbers) -> None:
+        self.out.write(_BINARY_HEADER.pack(BINARY_MAGIC, *sorted(lotto.numbers)))
+
+    def write(self, batch: TicketBatch, match_counts: bytes, rank_codes: bytes) -> None:
+        ids, masks = batch.ids, batch.masks
+        if sys.byteorder == "big":
+            ids, masks = array("Q", ids), array("Q", masks)
+            ids.byteswap()
+            masks.byteswap()
+        self.out.write(_BINARY_COUNT.pack(len(batch)) + ids.tobytes() + masks.tobytes() + match_counts + rank_codes)
+
+
+def read_binary_results(file: BinaryIO) -> tuple[LottoNumbers, Iterator[tuple[TicketBatch, bytes, bytes]]]:
+    """binary 결과 파일 -> (당첨 번호, (배치, 일치 개수, 등수 코드) 청크 이터레이터)"""
+    magic, *numbers = _BINARY_HEADER.unpack(file.read(_BINARY_HEADER.size))
+    if magic != BINARY_MAGIC:
+        raise ValueError("일괄 결과 파일 형식이 아닙니다.")
+
+    def chunks() -> Iterator[tuple[TicketBatch, bytes, bytes]]:
+        while header := file.read(_BINARY_COUNT.size):
+            (count,) = _BINARY_COUNT.unpack(header)
+            ids, masks = array("Q"), array("Q")
+            ids.frombytes(file.read(8 * count))
+            masks.frombytes(file.read(8 * count))
+            if sys.byteorder == "big":
+                ids.byteswap()
+                masks.byteswap()
+            yield TicketBatch(ids, masks), file.read(count), file.read(count)
+
+    return LottoNumbers(numbers=numbers), chunks()
+
+
+def result_writer(fmt: str, out: TextIO | BinaryIO) -> CsvResultWriter | NdjsonResultWriter | BinaryResultWriter:
+    if fmt == "csv":
+        return CsvResultWriter(out)
+    if fmt == "ndjson":
+        return NdjsonResultWriter(out)
+    if fmt == "binary":
+        return BinaryResultWriter(out)
+    raise ValueError(f"지원하지 않는 출력 형식입니다: {fmt} ({', '.join(RESULT_FORMATS)})")
+
+
+def play_batch(
+    lines: Iterable[str],
+    draw: LottoNumbers | LottoGenerator,
+    out: TextIO | BinaryIO,
+    fmt: str = "csv",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SettlementReport:
+    """
+    티켓 줄 스트림 전체를 한 번의 추첨으로 게임하고 결과를 out에 기록합니다.
+
+    draw에 생성 전략을 넘기면 generate()로 당첨 번호를 한 번 만듭니다.
+    형식이 잘못된 줄은 기록하지 않고 rejected_count로만 셉니다.
+    binary 형식은 바이너리 스트림, 나머지는 텍스트 스트림이 필요합니다.
+    """
+    lotto = draw if isinstance(draw, LottoNumbers) else draw.generate()
+    writer = result_writer(fmt, out)
+    writer.start(lotto)
+
+    rank_histogram = [0] * len(RANK_NAMES)
+    ticket_count = 0
+    rejected_count = 0
+    for first_id, chunk in read_ticket_chunks(lines, chunk_size):
+        batch, rejected = parse_ticket_chunk(first_id, chunk)
+        match_counts, rank_codes = settle_chunk(batch.masks, lotto, rank_histogram)
+        writer.write(batch, match_counts, rank_codes)
+
+        ticket_count += len(batch)
+        rejected_count += rejected
+
+    return SettlementReport(
+        lotto_numbers=lotto,
+        ticket_count=ticket_count,
+        rejected_count=rejected_count,
+        rank_counts=dict(zip(RANK_NAMES, rank_histogram)),
+    )
+
@@ -0,0 +1,67 @@
+"""
+성능 측정 모음
+
+대표 경로(자동 번호 생성, 대량 파싱, 일치/등수 계산, 스트리밍/병렬 정산, 노출 인덱스, 게임 시뮬레이션)의
+처리량을 같은 입력으로 측정합니다. 결과는 정산 리포트와 같은 StageStats 목록입니다.
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import Callable
+
+from src.lottery07.exposure import ExposureIndex
+from src.lottery07.game import count_match_many, get_rank_many, simulate_games
+from src.lottery07.generator import AutoLottoGenerator
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import StageStats, settle_stream
+from src.lottery07.sharded_settlement import settle_sharded
+from src.lottery07.ticket import mask_to_numbers, parse_ticket_buffer
+
+DEFAULT_BENCH_SIZE = 200_000
+
+
+def _measure(name: str, items: int, function: Callable[[], object]) -> StageStats:
+    started = time.perf_counter()
+    function()
+    return StageStats(name=name, items=items, seconds=time.perf_counter() - started)
+
+
+def run_benchmarks(size: int = DEFAULT_BENCH_SIZE, workers: int = 1, seed: int = 0) -> list[StageStats]:
+    """size장 기준 처리량 측정 (병렬 정산은 workers 프로세스)"""
+    rng = random.Random(seed)
+    generator = AutoLottoGenerator(rng)
+    lotto = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+    # 느린 경로(모델 생성, 노출 인덱스 갱신)는 1/10 크기로 측정
+    small_size = max(size // 10, 1)
+
+    ticket_lines = [", ".join(map(str, sorted(rng.sample(range(1, 46), 6)))) + "\n" for _ in range(size)]
+    data = "".join(ticket_lines).encode("ascii")
+    batch, _ = parse_ticket_buffer(data)
+    numbers = [mask_to_numbers(mask) for mask in batch.masks[:small_size]]
+
+    results = [
+        _measure("quickpick", small_size, lambda: [generator.generate() for _ in range(small_size)]),
+        _measure("parse", size, lambda: parse_ticket_buffer(data)),
+        _measure("match+rank", size, lambda: get_rank_many(count_match_many(batch.masks, lotto))),
+        _measure("settle", size, lambda: settle_stream(ticket_lines, lotto)),
+    ]
+
+    file_descriptor, path = tempfile.mkstemp(suffix=".tickets")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+        results.append(_measure(f"settle x{workers}", size, lambda: settle_sharded(path, lotto, workers=workers)))
+    finally:
+        os.remove(path)
+
+    index = ExposureIndex()
+    results.append(_measure("exposure add", small_size, lambda: index.add_many(numbers)))
+    results.append(_measure("exposure query", 1_000, lambda: [index.rank_counts(lotto) for _ in range(1_000)]))
+    results.append(_measure("simulate", size, lambda: simulate_games(size, rng)))
+    return results
+
+
+def format_benchmarks(results: list[StageStats]) -> str:
+    return "\n".join(f"[{stage.name}] {stage.items} items, {stage.items_per_second:,.0f}/s" for stage in results)
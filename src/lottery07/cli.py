@@ -0,0 +1,226 @@
+"""
+통합 명령행 도구
+
+    python main.py generate --count 1000000 --seed 7 --workers 4 --out tickets.txt
+    python main.py settle --draw 1,2,3,4,5,6 tickets.txt --out winners.csv --workers 4
+    python main.py play --draw 1,2,3,4,5,6 tickets.txt --out results.csv --format csv
+    python main.py simulate --games 10000000 --seed 7 --workers 4
+    python main.py bench --size 200000 --workers 4
+
+play(티켓마다 결과를 쓰는 일괄 게임)를 뺀 모든 하위 명령은 --workers를 받습니다. 작업은 CHUNK_SIZE 단위 청크로 나누고 청크마다 시드를
+(시드, 청크 번호)로 정하므로, 같은 시드면 워커 수와 관계없이 결과가 같습니다.
+출력은 청크 순서대로 바로 쓰며, 동시에 처리 중인 청크는 워커 수의 두 배까지만 둡니다.
+"""
+
+import argparse
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, TextIO
+
+from src.lottery07.batch import RESULT_FORMATS, WRITE_BUFFER_SIZE, play_batch
+from src.lottery07.bench import DEFAULT_BENCH_SIZE, format_benchmarks, run_benchmarks
+from src.lottery07.const import RANK_NAMES
+from src.lottery07.game import simulate_games
+from src.lottery07.generator import AutoLottoGenerator
+from src.lottery07.odds import rank_probabilities
+from src.lottery07.settlement import DEFAULT_CHUNK_SIZE, format_report, parse_draw, settle_stream
+from src.lottery07.sharded_settlement import settle_sharded
+
+CHUNK_SIZE = 65_536
+
+GENERATE_FORMATS = ("text", "ndjson")
+
+
+def _chunk_rng(seed: int, chunk: int) -> random.Random:
+    return random.Random(f"{seed}:{chunk}")
+
+
+def _chunks(total: int) -> list[tuple[int, int]]:
+    """(청크 번호, 개수) 목록"""
+    return [(chunk, min(CHUNK_SIZE, total - start)) for chunk, start in enumerate(range(0, total, CHUNK_SIZE))]
+
+
+def _map_chunks(function: Callable, arguments: Iterable[tuple], workers: int) -> Iterator:
+    """
+    청크 작업을 순서대로 실행 (workers가 2 이상이면 프로세스 풀)
+
+    결과가 쌓이지 않도록 제출한 청크는 workers * 2개까지만 유지합니다.
+    """
+    if workers <= 1:
+        for argument in arguments:
+            yield function(*argument)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for argument in arguments:
+            pending.append(executor.submit(function, *argument))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate_chunk(seed: int, chunk: int, count: int, fmt: str) -> str:
+    generator = AutoLottoGenerator(_chunk_rng(seed, chunk))
+    tickets = (sorted(generator.generate().numbers) for _ in range(count))
+    if fmt == "ndjson":
+        return "".join(f'{{"numbers":[{",".join(map(str, numbers))}]}}\n' for numbers in tickets)
+    return "".join(", ".join(map(str, numbers)) + "\n" for numbers in tickets)
+
+
+def simulate_chunk(seed: int, chunk: int, games: int) -> list[int]:
+    return simulate_games(games, _chunk_rng(seed, chunk))
+
+
+def generate(count: int, seed: int, out: TextIO, fmt: str = "text", workers: int = 1) -> None:
+    """자동 번호 count장을 out에 씁니다 (text는 티켓 파일 형식 "1, 2, 3, 4, 5, 6")."""
+    chunks = _chunks(count)
+    arguments = [(seed, chunk, size, fmt) for chunk, size in chunks]
+    for text in _map_chunks(generate_chunk, arguments, workers):
+        out.write(text)
+
+
+def simulate(games: int, seed: int, workers: int = 1) -> list[int]:
+    """무작위 게임 games판의 등수 코드별 횟수"""
+    histogram = [0] * len(RANK_NAMES)
+    arguments = [(seed, chunk, size) for chunk, size in _chunks(games)]
+    for chunk_histogram in _map_chunks(simulate_chunk, arguments, workers):
+        histogram = [total + count for total, count in zip(histogram, chunk_histogram)]
+    return histogram
+
+
+def format_simulation(histogram: list[int]) -> str:
+    games = sum(histogram)
+    probabilities = rank_probabilities()
+    lines = [f"games: {games}"]
+    lines += [
+        f"{rank}: {count} ({count / games if games else 0:.8f}, exact {float(probabilities[rank]):.8f})"
+        for rank, count in zip(RANK_NAMES, histogram)
+    ]
+    return "\n".join(lines)
+
+
+def _open_output(path: str | None) -> TextIO:
+    return open(path, "w", encoding="utf-8", buffering=1 << 20) if path else sys.stdout
+
+
+def _run_generate(args: argparse.Namespace) -> None:
+    out = _open_output(args.out)
+    try:
+        generate(args.count, args.seed, out, args.format, args.workers)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def _run_settle(args: argparse.Namespace) -> None:
+    lotto = parse_draw(args.draw)
+    winner_out = open(args.out, "w", encoding="utf-8") if args.out else None
+    try:
+        if args.tickets == "-":
+            report = settle_stream(sys.stdin, lotto, winner_out, args.chunk_size)
+        else:
+            report = settle_sharded(args.tickets, lotto, winner_out, args.workers, args.chunk_size)
+    finally:
+        if winner_out is not None:
+            winner_out.close()
+    print(format_report(report))
+
+
+def _run_play(args: argparse.Namespace) -> None:
+    draw = parse_draw(args.draw) if args.draw else AutoLottoGenerator(random.Random(args.seed))
+    binary = args.format == "binary"
+    tickets = sys.stdin if args.tickets == "-" else open(args.tickets, encoding="utf-8", errors="replace", newline="\n")
+    try:
+        if args.out:
+            out = (
+                open(args.out, "wb", buffering=WRITE_BUFFER_SIZE)
+                if binary
+                else open(args.out, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+            )
+        else:
+            out = sys.stdout.buffer if binary else sys.stdout
+        try:
+            report = play_batch(tickets, draw, out, args.format, args.chunk_size)
+        finally:
+            if args.out:
+                out.close()
+            else:
+                out.flush()
+    finally:
+        if tickets is not sys.stdin:
+            tickets.close()
+
+    # 결과를 stdout으로 내보낸 경우 요약은 stderr로
+    print(format_report(report), file=sys.stdout if args.out else sys.stderr)
+
+
+def _run_simulate(args: argparse.Namespace) -> None:
+    print(format_simulation(simulate(args.games, args.seed, args.workers)))
+
+
+def _run_bench(args: argparse.Namespace) -> None:
+    print(format_benchmarks(run_benchmarks(args.size, args.workers, args.seed)))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lotto", description="로또 도구 모음")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="자동 번호 생성")
+    generate_parser.add_argument("--count", type=int, default=1)
+    generate_parser.add_argument("--format", choices=GENERATE_FORMATS, default="text")
+    generate_parser.add_argument("--out", help="출력 파일 (기본: stdout)")
+    generate_parser.set_defaults(handler=_run_generate)
+
+    settle_parser = commands.add_parser("settle", help="티켓 파일 정산 (당첨 티켓 CSV + 등수별 집계)")
+    settle_parser.add_argument("--draw", required=True, help='당첨 번호 (예: "1,2,3,4,5,6")')
+    settle_parser.add_argument("tickets", help="티켓 파일 (한 줄에 한 장, '-'이면 stdin)")
+    settle_parser.add_argument("--out", help="당첨 티켓 CSV 파일 (기본: 기록하지 않음)")
+    settle_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    settle_parser.set_defaults(handler=_run_settle)
+
+    play_parser = commands.add_parser("play", help="티켓 파일 일괄 게임 (티켓마다 결과 기록, 비대화형)")
+    play_parser.add_argument("--draw", help='당첨 번호 (예: "1,2,3,4,5,6", 기본: --seed로 자동 생성)')
+    play_parser.add_argument("tickets", help="티켓 파일 (한 줄에 한 장, '-'이면 stdin)")
+    play_parser.add_argument("--out", help="결과 파일 (기본: stdout)")
+    play_parser.add_argument("--format", choices=RESULT_FORMATS, default="csv")
+    play_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    play_parser.set_defaults(handler=_run_play)
+
+    simulate_parser = commands.add_parser("simulate", help="무작위 게임 시뮬레이션 (정확한 확률과 비교)")
+    simulate_parser.add_argument("--games", type=int, default=1_000_000)
+    simulate_parser.set_defaults(handler=_run_simulate)
+
+    bench_parser = commands.add_parser("bench", help="성능 측정")
+    bench_parser.add_argument("--size", type=int, default=DEFAULT_BENCH_SIZE)
+    bench_parser.set_defaults(handler=_run_bench)
+
+    for command_parser in (generate_parser, settle_parser, simulate_parser, bench_parser):
+        command_parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수 (기본: 1, 0이면 CPU 수)")
+    for command_parser in (generate_parser, play_parser, simulate_parser, bench_parser):
+        command_parser.add_argument("--seed", type=int, default=None, help="난수 시드 (기본: 무작위)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "settle" and args.tickets == "-" and args.workers != 1:
+        parser.error("stdin('-') 정산은 --workers를 지원하지 않습니다 (한 프로세스에서 스트리밍).")
+    if getattr(args, "seed", 0) is None:
+        args.seed = random.randrange(2**32)
+    if getattr(args, "workers", 1) < 1:
+        args.workers = os.cpu_count() or 1
+    try:
+        args.handler(args)
+    except (ValueError, OSError) as error:
+        # 잘못된 당첨 번호(ValidationError 포함), 열 수 없는 파일은 트레이스백 대신 명령행 오류로
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+과거 회차 / 판매 티켓 압축 보관 (청크 단위 열 저장)
+
+수십 년치 회차의 판매 티켓 전체를 작게 보관하고, 회차 범위만 골라 빠르게 읽습니다.
+
+파일 구조 (little-endian):
+    헤더  : magic(4) + 압축 방식(1, CODECS 인덱스)
+    청크들 : 회차 하나의 티켓 조합 순위(정렬)를 chunk_tickets장씩 나눠
+            1. 이웃 값의 차이(델타)로 바꾸고 (정렬돼 있으므로 작은 수)
+            2. uint32 바이트를 자리별로 모은 뒤 (상위 바이트 자리는 거의 0)
+            3. zlib 또는 lzma로 압축
+    청크 인덱스: 청크마다 (회차, 티켓 수, 파일 위치, 압축 크기)
+    회차 표  : 회차마다 (회차, 당첨 번호 조합 순위)
+    끝      : 청크 인덱스 위치 + 청크 수 + 회차 수 + magic(4)
+
+읽을 때는 청크 인덱스 이진 탐색으로 회차 범위 밖 청크를 건너뛰고,
+스레드 풀에서 여러 청크를 동시에 압축 해제해(zlib/lzma는 GIL을 놓음) 순서대로 넘깁니다.
+청크는 조합 순위 열 또는 비트마스크 열로 받아 count_match_many() 등에 바로 넘길 수 있습니다.
+"""
+
+import lzma
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, chain
+from operator import sub
+from typing import Callable, Iterable, Iterator
+
+from pydantic import BaseModel
+
+from src.lottery07.combination import (
+    combination_masks,
+    combination_rank,
+    combination_rank_masks,
+    combination_unrank,
+)
+from src.lottery07.const import RANK_NAMES
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import settle_chunk
+from src.lottery07.ticket import TicketBatch
+
+CODECS = ("zlib", "lzma")
+DEFAULT_CHUNK_TICKETS = 1 << 20
+DEFAULT_READ_WORKERS = 4
+
+_MAGIC = b"LCOL"
+_HEADER = struct.Struct("<4sB")
+_CHUNK_ENTRY = struct.Struct("<IIQI")
+_DRAW_ENTRY = struct.Struct("<II")
+_TRAILER = struct.Struct("<QII4s")
+_RANK_BYTES = array("I").itemsize
+
+
+class ArchiveChunk(BaseModel):
+    """청크 인덱스 항목"""
+
+    draw_no: int
+    ticket_count: int
+    offset: int
+    size: int
+
+
+def _compressor(codec: str, level: int | None) -> Callable[[bytes], bytes]:
+    if codec == "zlib":
+        return lambda data: zlib.compress(data, -1 if level is None else level)
+    if codec == "lzma":
+        return lambda data: lzma.compress(data, preset=level)
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {codec} ({', '.join(CODECS)})")
+
+
+_DECOMPRESSORS = {"zlib": zlib.decompress, "lzma": lzma.decompress}
+
+
+def encode_ranks(ranks: array) -> bytes:
+    """정렬된 조합 순위 열 -> 델타 + 바이트 자리별 재배치 (압축 전)"""
+    deltas = array("I", map(sub, ranks, chain((0,), ranks)))
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    raw = deltas.tobytes()
+    return b"".join(raw[place::_RANK_BYTES] for place in range(_RANK_BYTES))
+
+
+def decode_ranks(data: bytes) -> array:
+    """encode_ranks()의 역변환"""
+    count = len(data) // _RANK_BYTES
+    raw = bytearray(len(data))
+    for place in range(_RANK_BYTES):
+        raw[place::_RANK_BYTES] = data[place * count : (place + 1) * count]
+    deltas = array("I", raw)
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return array("I", accumulate(deltas))
+
+
+class ColumnarArchiveWriter:
+    """
+    보관 파일 작성 (회차는 증가 순서로 추가)
+
+    임시 파일에 쓰고 close()에서 제자리로 옮기므로, 쓰는 도중의 파일을 읽는 쪽에서 볼 일이 없습니다.
+    level은 zlib 압축 수준 또는 lzma preset입니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec: str = "zlib",
+        chunk_tickets: int = DEFAULT_CHUNK_TICKETS,
+        level: int | None = None,
+    ) -> None:
+        self.path = path
+        self.chunk_tickets = chunk_tickets
+        self._compress = _compressor(codec, level)
+        self._chunks: list[tuple[int, int, int, int]] = []
+        self._draws: list[tuple[int, int]] = []
+        self._temporary = path + ".tmp"
+        self._file = open(self._temporary, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, CODECS.index(codec)))
+
+    def add_draw(self, draw_no: int, lotto: LottoNumbers, combinations: Iterable[int]) -> None:
+        """회차의 당첨 번호와 판매 티켓(조합 순위들)을 추가합니다."""
+        if self._draws and draw_no <= self._draws[-1][0]:
+            raise ValueError(f"회차는 증가해야 합니다: {draw_no} <= {self._draws[-1][0]}")
+        ranks = array("I", sorted(combinations))
+        for start in range(0, len(ranks), self.chunk_tickets):
+            chunk = ranks[start : start + self.chunk_tickets]
+            payload = self._compress(encode_ranks(chunk))
+            self._chunks.append((draw_no, len(chunk), self._file.tell(), len(payload)))
+            self._file.write(payload)
+        self._draws.append((draw_no, combination_rank(lotto.numbers)))
+
+    def add_draw_batch(self, draw_no: int, lotto: LottoNumbers, batch: TicketBatch) -> None:
+        """파싱된 티켓 묶음으로 회차를 추가합니다 (티켓 id는 보관하지 않음)."""
+        self.add_draw(draw_no, lotto, combination_rank_masks(batch.masks))
+
+    def close(self) -> None:
+        index_offset = self._file.tell()
+        self._file.write(b"".join(_CHUNK_ENTRY.pack(*entry) for entry in self._chunks))
+        self._file.write(b"".join(_DRAW_ENTRY.pack(*entry) for entry in self._draws))
+        self._file.write(_TRAILER.pack(index_offset, len(self._chunks), len(self._draws), _MAGIC))
+        self._file.close()
+        os.replace(self._temporary, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        os.remove(self._temporary)
+
+    def __enter__(self) -> "ColumnarArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class ColumnarArchive:
+    """보관 파일 읽기 (메모리 매핑)"""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, codec = _HEADER.unpack_from(self._mmap)
+        index_offset, chunk_count, draw_count, trailer_magic = _TRAILER.unpack_from(
+            self._mmap, len(self._mmap) - _TRAILER.size
+        )
+        if magic != _MAGIC or trailer_magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"압축 보관 파일이 아닙니다: {path}")
+
+        self.codec = CODECS[codec]
+        self._decompress = _DECOMPRESSORS[self.codec]
+        self.chunks = [
+            ArchiveChunk(draw_no=draw_no, ticket_count=count, offset=offset, size=size)
+            for draw_no, count, offset, size in _CHUNK_ENTRY.iter_unpack(
+                self._mmap[index_offset : index_offset + chunk_count * _CHUNK_ENTRY.size]
+            )
+        ]
+        draws_offset = index_offset + chunk_count * _CHUNK_ENTRY.size
+        self._draws = dict(
+            _DRAW_ENTRY.iter_unpack(self._mmap[draws_offset : draws_offset + draw_count * _DRAW_ENTRY.size])
+        )
+        self._chunk_draws = [chunk.draw_no for chunk in self.chunks]
+
+    @property
+    def draws(self) -> list[int]:
+        """보관된 회차 번호들"""
+        return list(self._draws)
+
+    def draw_numbers(self, draw_no: int) -> LottoNumbers:
+        return LottoNumbers(numbers=combination_unrank(self._draws[draw_no]))
+
+    def ticket_count(self, draw_no: int) -> int:
+        return sum(chunk.ticket_count for chunk in self.select(draw_no, draw_no))
+
+    def select(self, first_draw: int | None = None, last_draw: int | None = None) -> list[ArchiveChunk]:
+        """회차 범위 [first_draw, last_draw]의 청크 (범위 밖 청크는 읽지 않음)"""
+        start = 0 if first_draw is None else bisect_left(self._chunk_draws, first_draw)
+        end = len(self.chunks) if last_draw is None else bisect_right(self._chunk_draws, last_draw)
+        return self.chunks[start:end]
+
+    def read_ranks(self, chunk: ArchiveChunk) -> array:
+        """청크 하나의 조합 순위 열 (정렬됨)"""
+        return decode_ranks(self._decompress(self._mmap[chunk.offset : chunk.offset + chunk.size]))
+
+    def read_masks(self, chunk: ArchiveChunk) -> array:
+        """청크 하나의 번호 비트마스크 열"""
+        return combination_masks(self.read_ranks(chunk))
+
+    def _read_parallel(
+        self, read: Callable[[ArchiveChunk], array], chunks: list[ArchiveChunk], workers: int
+    ) -> Iterator[tuple[ArchiveChunk, array]]:
+        """청크를 스레드 workers개로 미리 읽어 순서대로 넘깁니다 (미리 읽는 청크는 workers * 2개까지)."""
+        if workers <= 1:
+            for chunk in chunks:
+                yield chunk, read(chunk)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(read, chunk)))
+                if len(pending) >= workers * 2:
+                    done, future = pending.popleft()
+                    yield done, future.result()
+            while pending:
+                done, future = pending.popleft()
+                yield done, future.result()
+
+    def iter_ranks(
+        self, first_draw: int | None = None, last_draw: int | None = None, workers: int = DEFAULT_READ_WORKERS
+    ) -> Iterator[tuple[ArchiveChunk, array]]:
+        return self._read_parallel(self.read_ranks, self.select(first_draw, last_draw), workers)
+
+    def iter_masks(
+        self, first_draw: int | None = None, last_draw: int | None = None, workers: int = DEFAULT_READ_WORKERS
+    ) -> Iterator[tuple[ArchiveChunk, array]]:
+        return self._read_parallel(self.read_masks, self.select(first_draw, last_draw), workers)
+
+    def rank_counts(
+        self, first_draw: int | None = None, last_draw: int | None = None, workers: int = DEFAULT_READ_WORKERS
+    ) -> dict[int, dict[str, int]]:
+        """회차별 등수별 티켓 수 (각 회차의 당첨 번호 기준)"""
+        histograms = {
+            draw_no: [0] * len(RANK_NAMES)
+            for draw_no in self._draws
+            if (first_draw is None or draw_no >= first_draw) and (last_draw is None or draw_no <= last_draw)
+        }
+        for chunk, masks in self.iter_masks(first_draw, last_draw, workers):
+            settle_chunk(masks, self.draw_numbers(chunk.draw_no), histograms[chunk.draw_no])
+        return {draw_no: dict(zip(RANK_NAMES, histogram)) for draw_no, histogram in histograms.items()}
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "ColumnarArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,182 @@
+import os
+import sys
+from array import array
+from itertools import combinations
+from math import comb
+from typing import Callable, Iterable, Iterator
+
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+
+# ===== 조합 번호 (colex 순위) =====
+# 정렬된 번호 a1 < a2 < ... < ak 의 순위 = sum(C(ai - 1, i))
+# 1~45 중 6개 조합은 0 ~ C(45, 6) - 1 (8,145,059) 범위의 정수 하나로 표현됩니다.
+
+COMBINATION_COUNT = comb(LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER + 1, LOTTO_NUMBER_COUNT)
+
+# BINOMIAL[n][k] = C(n, k)
+BINOMIAL = [[comb(n, k) for k in range(LOTTO_NUMBER_COUNT + 1)] for n in range(LOTTO_MAX_NUMBER + 1)]
+
+
+def combination_count(size: int = LOTTO_NUMBER_COUNT) -> int:
+    return comb(LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER + 1, size)
+
+
+def combination_rank(numbers: Iterable[int]) -> int:
+    return sum(BINOMIAL[number - LOTTO_MIN_NUMBER][index] for index, number in enumerate(sorted(numbers), start=1))
+
+
+def combination_unrank(rank: int, size: int = LOTTO_NUMBER_COUNT) -> list[int]:
+    numbers: list[int] = []
+    offset = LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER
+    for index in range(size, 0, -1):
+        while BINOMIAL[offset][index] > rank:
+            offset -= 1
+        rank -= BINOMIAL[offset][index]
+        numbers.append(offset + LOTTO_MIN_NUMBER)
+        offset -= 1
+    return numbers[::-1]
+
+
+def subset_ranks(numbers: Iterable[int], size: int) -> Iterator[int]:
+    """번호 묶음에 포함된 size개 부분 조합들의 순위"""
+    for subset in combinations(sorted(numbers), size):
+        yield sum(BINOMIAL[number - LOTTO_MIN_NUMBER][index] for index, number in enumerate(subset, start=1))
+
+
+# ===== 정렬된 번호 레코드 -> 부분 조합 순위 (대량) =====
+# 티켓마다 정렬된 번호 6바이트를 이어 붙인 열을 자리별 열(data[i::6])로 나누고,
+# 자리 조합(예: 1·3·4번째 번호)마다 모든 티켓의 부분 조합 순위를 열 단위 map으로 한 번에 계산합니다.
+
+# _RANK_TERMS[i][n] = 부분 조합의 i번째(1부터) 번호가 n일 때 순위에 더해지는 값 C(n - 1, i)
+_RANK_TERMS = [
+    [
+        BINOMIAL[number - LOTTO_MIN_NUMBER][index] if number >= LOTTO_MIN_NUMBER else 0
+        for number in range(LOTTO_MAX_NUMBER + 1)
+    ]
+    for index in range(LOTTO_NUMBER_COUNT + 1)
+]
+
+
+def packed_subset_ranks(numbers: bytes, size: int) -> Iterator[Iterator[int]]:
+    """자리 조합마다, 모든 티켓의 size개 부분 조합 순위 (티켓 순서)"""
+    columns = [numbers[position::LOTTO_NUMBER_COUNT] for position in range(LOTTO_NUMBER_COUNT)]
+    for positions in combinations(range(LOTTO_NUMBER_COUNT), size):
+        terms = [
+            map(_RANK_TERMS[index].__getitem__, columns[position]) for index, position in enumerate(positions, start=1)
+        ]
+        yield map(sum, zip(*terms))
+
+
+# ===== 비트마스크 -> 순위 (대량) =====
+# 마스크를 바이트 6개로 나누고, (바이트 값, 아래 바이트들의 비트 수)별 부분합을 표로 미리 계산합니다.
+# 순위 = 바이트별 표 값의 합 -> 번호 목록을 만들지 않고 조회 6번으로 계산
+_MASK_BYTES = (LOTTO_MAX_NUMBER + 8) // 8
+
+
+def _byte_rank_table(byte_index: int) -> list[int]:
+    """표[값 << 3 | 아래 비트 수] = 이 바이트의 번호들이 순위에 더하는 값"""
+    table = [0] * (256 << 3)
+    for value in range(256):
+        for below in range(LOTTO_NUMBER_COUNT + 1):
+            index, total = below, 0
+            for bit in range(8):
+                number = byte_index * 8 + bit
+                if value >> bit & 1 and LOTTO_MIN_NUMBER <= number <= LOTTO_MAX_NUMBER:
+                    index += 1
+                    if index <= LOTTO_NUMBER_COUNT:
+                        total += BINOMIAL[number - LOTTO_MIN_NUMBER][index]
+            table[value << 3 | below] = total
+    return table
+
+
+_BYTE_RANK_TABLES = [_byte_rank_table(byte_index) for byte_index in range(_MASK_BYTES)]
+
+
+def combination_rank_masks(masks: Iterable[int]) -> array:
+    """번호 6개 비트마스크들의 조합 순위 (uint32 열)"""
+    t0, t1, t2, t3, t4, t5 = _BYTE_RANK_TABLES
+    ranks = array("I")
+    for mask in masks:
+        b0, b1, b2, b3, b4 = mask & 255, mask >> 8 & 255, mask >> 16 & 255, mask >> 24 & 255, mask >> 32 & 255
+        c1 = b0.bit_count()
+        c2 = c1 + b1.bit_count()
+        c3 = c2 + b2.bit_count()
+        c4 = c3 + b3.bit_count()
+        c5 = c4 + b4.bit_count()
+        ranks.append(
+            t0[b0 << 3]
+            + t1[b1 << 3 | c1]
+            + t2[b2 << 3 | c2]
+            + t3[b3 << 3 | c3]
+            + t4[b4 << 3 | c4]
+            + t5[(mask >> 40) << 3 | c5]
+        )
+    return ranks
+
+
+# ===== 순위 -> 비트마스크 (대량) =====
+# 위쪽 세 번호(a4 < a5 < a6)가 같은 조합들의 순위는 [기준값, 기준값 + C(a4 - 1, 3)) 구간에 이어져 있고,
+# 구간 안의 위치가 곧 아래 세 번호의 3개 조합 순위입니다.
+# 아래 세 번호 마스크를 표로 두고, 구간이 바뀔 때만 combination_unrank()로 위쪽 세 번호를 구합니다.
+# 정렬된 순위 열이면 구간 변경이 최대 C(45, 3)번이라 티켓당 표 조회 한 번으로 끝납니다.
+_LOW_SIZE = LOTTO_NUMBER_COUNT // 2
+
+
+def _low_mask_table() -> list[int]:
+    """표[아래 세 번호의 순위] = 아래 세 번호 마스크"""
+    table = [0] * BINOMIAL[LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER][_LOW_SIZE]
+    for low in combinations(range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER), _LOW_SIZE):
+        table[combination_rank(low)] = sum(1 << number for number in low)
+    return table
+
+
+_LOW_MASKS = _low_mask_table()
+
+
+def combination_masks(ranks: Iterable[int]) -> array:
+    """조합 순위들의 번호 비트마스크 (uint64 열, 정렬된 순위일 때 빠름)"""
+    low_masks = _LOW_MASKS
+    masks = array("Q")
+    base, end, high_mask = 0, 0, 0
+    for rank in ranks:
+        if not base <= rank < end:
+            numbers = combination_unrank(rank)
+            high = numbers[_LOW_SIZE:]
+            high_mask = sum(1 << number for number in high)
+            base = rank - combination_rank(numbers[:_LOW_SIZE])
+            end = base + BINOMIAL[high[0] - LOTTO_MIN_NUMBER][_LOW_SIZE]
+        masks.append(high_mask | low_masks[rank - base])
+    return masks
+
+
+# ===== 순위 목록 디스크 캐시 =====
+# 조합 순위 목록을 little-endian uint32 열 그대로 파일 하나에 저장합니다 (제약 조건 목록, 휠 티켓).
+
+
+def cached_ranks(cache_dir: str | None, file_name: str, compute: Callable[[], array]) -> array:
+    """
+    cache_dir/file_name의 순위 목록 (uint32), 파일이 없으면 compute()로 만들어 저장합니다.
+
+    cache_dir이 없으면 매번 compute()를 부릅니다. 임시 파일에 쓴 뒤 교체하므로
+    같은 캐시를 쓰는 다른 프로세스는 다 쓴 파일만 봅니다.
+    """
+    cache_path = os.path.join(cache_dir, file_name) if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        ranks = array("I")
+        with open(cache_path, "rb") as file:
+            ranks.frombytes(file.read())
+        if sys.byteorder == "big":
+            ranks.byteswap()
+        return ranks
+
+    ranks = compute()
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        stored = array("I", ranks)
+        if sys.byteorder == "big":
+            stored.byteswap()
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            stored.tofile(file)
+        os.replace(temporary_path, cache_path)
+    return ranks
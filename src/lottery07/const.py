@@ -1,7 +1,10 @@
+from decimal import Decimal
+
 # ===== 상수 =====
 LOTTO_NUMBER_COUNT = 6
 LOTTO_MIN_NUMBER = 1
 LOTTO_MAX_NUMBER = 45
+LOTTO_TICKET_PRICE = 1_000
 
 
 RANK_BY_MATCH_COUNT = {
@@ -10,3 +13,27 @@ RANK_BY_MATCH_COUNT = {
     4: "3rd",
     3: "4th",
 }
+
+RANK_FAIL = "fail"
+
+# 등수 코드 (uint8): 0은 낙첨, 1부터 일치 개수가 많은 등수 순서
+# 예: RANK_NAMES[1] == "1st", RANK_CODE_BY_MATCH_COUNT[6] == 1
+RANK_NAMES = (RANK_FAIL, *(RANK_BY_MATCH_COUNT[count] for count in sorted(RANK_BY_MATCH_COUNT, reverse=True)))
+RANK_CODE_BY_MATCH_COUNT = {count: RANK_NAMES.index(rank) for count, rank in RANK_BY_MATCH_COUNT.items()}
+
+
+# ===== 당첨금 규칙 =====
+# 1~2등: 총 판매액의 일정 비율을 당첨자 수로 균등 분배 (천원 단위 버림)
+# 3~4등: 고정 금액
+PRIZE_POOL_SHARE_BY_RANK = {
+    "1st": Decimal("0.75"),
+    "2nd": Decimal("0.125"),
+}
+FIXED_PRIZE_BY_RANK = {
+    "3rd": 1_500_000,
+    "4th": 50_000,
+}
+PRIZE_ROUNDING_UNIT = 1_000
+
+# 당첨자가 없으면 배분액을 다음 회차로 이월하는 등수
+ROLLOVER_RANKS = ("1st",)
@@ -0,0 +1,102 @@
+"""
+조건부 자동 생성용 제약 조건
+
+예) 합계 100~175, 홀수 3개, 3개 연속 번호 금지, 7 포함
+제약 조건 묶음을 만족하는 모든 조합의 순위를 한 번 계산(컴파일)해 두면,
+이후에는 그중 하나를 균등하게 O(1)로 뽑을 수 있습니다.
+컴파일 결과는 메모리와 디스크에 캐시합니다.
+"""
+
+import hashlib
+from array import array
+from functools import lru_cache
+from itertools import combinations
+
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from src.lottery07.combination import cached_ranks, combination_rank
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+from src.lottery07.model import LottoNumber, require_unique
+
+
+class PickConstraints(BaseModel):
+    """번호 선택 제약 조건 (None이면 검사하지 않음)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    min_sum: int | None = None
+    max_sum: int | None = None
+    odd_count: int | None = None
+    max_consecutive: int | None = None
+    required_numbers: tuple[LottoNumber, ...] = ()
+    excluded_numbers: tuple[LottoNumber, ...] = ()
+
+    @field_validator("required_numbers", "excluded_numbers")
+    @classmethod
+    def validate_numbers(cls, v: tuple[int, ...]) -> tuple[int, ...]:
+        """중복 검사 후 정렬 (순서만 다른 제약 조건은 같은 캐시 키)"""
+        require_unique(v)
+        return tuple(sorted(v))
+
+    @model_validator(mode="after")
+    def validate_required_excluded(self) -> "PickConstraints":
+        if len(self.required_numbers) > LOTTO_NUMBER_COUNT:
+            raise ValueError(f"필수 번호는 {LOTTO_NUMBER_COUNT}개를 넘을 수 없습니다.")
+        if set(self.required_numbers) & set(self.excluded_numbers):
+            raise ValueError("필수 번호와 제외 번호가 겹칩니다.")
+        return self
+
+    def accepts(self, numbers: tuple[int, ...]) -> bool:
+        """정렬된 번호 6개가 조건을 만족하는지"""
+        if not set(self.required_numbers) <= set(numbers) or not set(self.excluded_numbers).isdisjoint(numbers):
+            return False
+        total = sum(numbers)
+        if self.min_sum is not None and total < self.min_sum:
+            return False
+        if self.max_sum is not None and total > self.max_sum:
+            return False
+        if self.odd_count is not None and sum(number & 1 for number in numbers) != self.odd_count:
+            return False
+        if self.max_consecutive is not None:
+            run = 1
+            for previous, number in zip(numbers, numbers[1:]):
+                run = run + 1 if number == previous + 1 else 1
+                if run > self.max_consecutive:
+                    return False
+        return True
+
+    def cache_key(self) -> str:
+        return hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()[:32]
+
+
+# 메모리에 둘 컴파일 결과 수 (제약이 느슨하면 목록 하나가 수십 MB)
+COMPILED_CACHE_SIZE = 8
+
+
+def _enumerate_valid_ranks(constraints: PickConstraints) -> array:
+    required = constraints.required_numbers
+    excluded = set(constraints.excluded_numbers) | set(required)
+    free_numbers = [number for number in range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1) if number not in excluded]
+
+    ranks = array("I")
+    for free in combinations(free_numbers, LOTTO_NUMBER_COUNT - len(required)):
+        numbers = tuple(sorted(free + required)) if required else free
+        if constraints.accepts(numbers):
+            ranks.append(combination_rank(numbers))
+    return ranks
+
+
+def compile_constraints(constraints: PickConstraints, cache_dir: str | None = None) -> memoryview:
+    """
+    제약 조건을 만족하는 조합 순위 목록 (uint32, 읽기 전용)
+
+    같은 제약 조건은 메모리 캐시를, cache_dir이 있으면 디스크 캐시를 재사용합니다.
+    캐시된 목록을 호출자끼리 공유하므로 읽기 전용 memoryview로 돌려줍니다.
+    """
+    return memoryview(_compiled(constraints, cache_dir)).toreadonly()
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def _compiled(constraints: PickConstraints, cache_dir: str | None) -> array:
+    file_name = f"constraints-{constraints.cache_key()}.ranks"
+    return cached_ranks(cache_dir, file_name, lambda: _enumerate_valid_ranks(constraints))
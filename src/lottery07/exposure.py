@@ -0,0 +1,119 @@
+"""
+판매 중 실시간 노출(exposure) 인덱스
+
+티켓이 팔릴 때마다 그 티켓에 포함된 3~6개 부분 조합의 카운터를 1씩 올립니다.
+추첨 번호가 나오면 티켓을 다시 훑지 않고, 추첨 번호의 부분 조합 42개 카운터만 읽어
+포함-배제(inclusion-exclusion)로 일치 개수별 당첨자 수를 계산합니다.
+
+    S_k = 추첨 번호의 k개 부분 조합 카운터 합 = sum(C(j, k) * E_j, j >= k)
+    E_j = 정확히 j개 일치한 티켓 수 (큰 j부터 역산)
+"""
+
+import struct
+import sys
+from array import array
+from math import comb
+from typing import Iterable
+
+from src.lottery07.combination import combination_count, packed_subset_ranks, subset_ranks
+from src.lottery07.const import (
+    LOTTO_NUMBER_COUNT,
+    RANK_BY_MATCH_COUNT,
+    RANK_FAIL,
+    RANK_NAMES,
+)
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import require_packed_tickets, require_ticket_numbers
+
+# 등수가 있는 최소 일치 개수(3)부터 6까지의 부분 조합을 추적
+SUBSET_SIZES = tuple(range(min(RANK_BY_MATCH_COUNT), LOTTO_NUMBER_COUNT + 1))
+
+_FILE_MAGIC = b"LEXP"
+_FILE_HEADER = struct.Struct("<4sBQ")
+
+
+def _to_little_endian(counter: array) -> array:
+    if sys.byteorder == "big":
+        counter = array(counter.typecode, counter)
+        counter.byteswap()
+    return counter
+
+
+class ExposureIndex:
+    """부분 조합 순위를 키로 하는 판매 티켓 카운터"""
+
+    def __init__(self) -> None:
+        self.ticket_count = 0
+        self.counters = {size: array("I", bytes(4 * combination_count(size))) for size in SUBSET_SIZES}
+
+    def add(self, numbers: Iterable[int]) -> None:
+        """티켓 한 장을 더합니다 (서로 다른 1~45 번호 6개가 아니면 카운터를 건드리지 않고 ValueError)."""
+        numbers = list(numbers)
+        require_ticket_numbers(numbers)
+        for size, counter in self.counters.items():
+            for rank in subset_ranks(numbers, size):
+                counter[rank] += 1
+        self.ticket_count += 1
+
+    def add_many(self, tickets: Iterable[Iterable[int]]) -> None:
+        for numbers in tickets:
+            self.add(numbers)
+
+    def add_packed(self, numbers: bytes) -> None:
+        """
+        티켓마다 정렬된 번호 6바이트를 이어 붙인 열을 한꺼번에 더합니다 (add()를 티켓마다 부른 것과 같음).
+
+        자리 조합(예: 1·3·4번째 번호)마다 모든 티켓의 부분 조합 순위를 열 단위 map으로 한 번에 계산합니다.
+        레코드가 하나라도 범위 밖이거나 정렬된 서로 다른 번호가 아니면 카운터를 건드리지 않고 ValueError입니다.
+        """
+        require_packed_tickets(numbers)
+        for size, counter in self.counters.items():
+            for ranks in packed_subset_ranks(numbers, size):
+                for rank in ranks:
+                    counter[rank] += 1
+        self.ticket_count += len(numbers) // LOTTO_NUMBER_COUNT
+
+    def match_counts(self, lotto: LottoNumbers) -> dict[int, int]:
+        """일치 개수별 티켓 수 (SUBSET_SIZES 범위만)"""
+        subset_sums = {
+            size: sum(counter[rank] for rank in subset_ranks(lotto.numbers, size))
+            for size, counter in self.counters.items()
+        }
+
+        exact: dict[int, int] = {}
+        for size in reversed(SUBSET_SIZES):
+            exact[size] = subset_sums[size] - sum(comb(more, size) * exact[more] for more in exact)
+        return dict(sorted(exact.items()))
+
+    def rank_counts(self, lotto: LottoNumbers) -> dict[str, int]:
+        """등수별 당첨자 수 (RANK_NAMES 순서, 낙첨 포함)"""
+        match_counts = self.match_counts(lotto)
+        winners = {RANK_BY_MATCH_COUNT[count]: match_counts[count] for count in RANK_BY_MATCH_COUNT}
+        return {RANK_FAIL: self.ticket_count - sum(winners.values())} | {rank: winners[rank] for rank in RANK_NAMES[1:]}
+
+    def merge(self, other: "ExposureIndex") -> None:
+        """다른 단말기의 인덱스를 더합니다."""
+        for size, counter in self.counters.items():
+            for rank, count in enumerate(other.counters[size]):
+                if count:
+                    counter[rank] += count
+        self.ticket_count += other.ticket_count
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, len(SUBSET_SIZES), self.ticket_count))
+            for size in SUBSET_SIZES:
+                _to_little_endian(self.counters[size]).tofile(file)
+
+    @classmethod
+    def load(cls, path: str) -> "ExposureIndex":
+        index = cls()
+        with open(path, "rb") as file:
+            magic, size_count, index.ticket_count = _FILE_HEADER.unpack(file.read(_FILE_HEADER.size))
+            if magic != _FILE_MAGIC or size_count != len(SUBSET_SIZES):
+                raise ValueError(f"노출 인덱스 파일이 아닙니다: {path}")
+            for size in SUBSET_SIZES:
+                counter = array("I")
+                counter.fromfile(file, combination_count(size))
+                index.counters[size] = _to_little_endian(counter)
+        return index
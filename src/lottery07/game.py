@@ -1,3 +1,7 @@
+import random
+from array import array
+from typing import Callable, Iterable
+
 from pydantic import ValidationError
 
 from src.lottery07.const import (
@@ -5,16 +9,25 @@ from src.lottery07.const import (
     LOTTO_MIN_NUMBER,
     LOTTO_NUMBER_COUNT,
     RANK_BY_MATCH_COUNT,
+    RANK_CODE_BY_MATCH_COUNT,
+    RANK_FAIL,
+    RANK_NAMES,
 )
 from src.lottery07.generator import AutoLottoGenerator, LottoGenerator
 from src.lottery07.model import LottoNumbers, LottoResult
+from src.lottery07.sink import OutputSink, as_sink
+from src.lottery07.ticket import to_mask
 
 # ===== 도메인 로직 =====
 # generate_lotto_numbers()는 generator.py로 이동
 # 이제 LottoGenerator 인터페이스를 통해 생성 전략을 주입받습니다
 
+# 일치 개수(0~255) -> 등수 코드 변환표 (bytes.translate 용)
+_RANK_CODE_TABLE = bytes(RANK_CODE_BY_MATCH_COUNT.get(count, 0) for count in range(256))
+
 
-def read_user_numbers(input_func=input, print_func=print) -> LottoNumbers:
+def read_user_numbers(input_func=input, print_func: OutputSink | Callable[[str], object] = print) -> LottoNumbers:
+    sink = as_sink(print_func)
     while True:
         raw = input_func(
             f"{LOTTO_NUMBER_COUNT}개의 번호를 콤마(,)로 구분해서 입력하세요 ({LOTTO_MIN_NUMBER}~{LOTTO_MAX_NUMBER}): "
@@ -24,36 +37,65 @@ def read_user_numbers(input_func=input, print_func=print) -> LottoNumbers:
             parts = [p.strip() for p in raw.split(",")]
             numbers = [int(p) for p in parts]
         except ValueError:
-            print_func("숫자만 입력해 주세요.")
+            sink.write_line("숫자만 입력해 주세요.")
             continue
 
         try:
             return LottoNumbers(numbers=numbers)
         except ValidationError as e:
-            print_func("입력값이 올바르지 않습니다:")
+            sink.write_line("입력값이 올바르지 않습니다:")
             for err in e.errors():
                 # 예: numbers.0 -> 첫 번째 번호
                 loc = ".".join(str(x) for x in err["loc"])
-                print_func(f"- {loc}: {err['msg']}")
-            print_func("다시 입력해 주세요.\n")
+                sink.write_line(f"- {loc}: {err['msg']}")
+            sink.write_line("다시 입력해 주세요.\n")
 
 
 def count_match(lotto: LottoNumbers, user: LottoNumbers) -> int:
     return len(set(lotto.numbers) & set(user.numbers))
 
 
+def count_match_many(ticket_masks: Iterable[int], lotto: LottoNumbers) -> bytes:
+    """티켓 비트마스크 여러 개의 일치 개수를 uint8 배열로 계산합니다."""
+    lotto_mask = to_mask(lotto.numbers)
+    return bytes((mask & lotto_mask).bit_count() for mask in ticket_masks)
+
+
 def get_rank(match_count: int) -> str:
-    return RANK_BY_MATCH_COUNT.get(match_count, "fail")
+    return RANK_BY_MATCH_COUNT.get(match_count, RANK_FAIL)
+
+
+def get_rank_many(match_counts: bytes | bytearray | array) -> bytes:
+    """
+    uint8 일치 개수 배열을 uint8 등수 코드 배열로 변환합니다.
+
+    티켓마다 문자열을 만들지 않고 변환표 한 번으로 처리합니다.
+    등수 코드는 RANK_NAMES의 인덱스이며, rank_name()으로 문자열로 되돌릴 수 있습니다.
+    'B'가 아닌 array는 버퍼를 그대로 읽지 않고 값을 하나씩 바이트로 바꿉니다 (255 초과면 ValueError).
+    """
+    if isinstance(match_counts, array) and match_counts.typecode != "B":
+        match_counts = iter(match_counts)
+    return bytes(match_counts).translate(_RANK_CODE_TABLE)
+
+
+def rank_name(rank_code: int) -> str:
+    return RANK_NAMES[rank_code]
+
+
+def count_ranks(rank_codes: bytes) -> list[int]:
+    """등수 코드별 개수 (인덱스 = 등수 코드)"""
+    return [rank_codes.count(code) for code in range(len(RANK_NAMES))]
 
 
 def play_game(
     generator: LottoGenerator,
     input_func=input,
-    print_func=print,
+    print_func: OutputSink | Callable[[str], object] = print,
 ) -> LottoResult:
     # 생성 전략을 통해 로또 번호 생성 (어떻게 만드는지는 관심 없음)
     lotto_numbers = generator.generate()
-    user_numbers = read_user_numbers(input_func=input_func, print_func=print_func)
+    sink = as_sink(print_func)
+    user_numbers = read_user_numbers(input_func=input_func, print_func=sink)
     match_count = count_match(lotto_numbers, user_numbers)
     rank = get_rank(match_count)
 
@@ -65,14 +107,29 @@ def play_game(
     )
 
     # 출력은 별도 (도메인 모델과 IO 분리)
-    print_func(f"result: {result.lotto_numbers.numbers}")
-    print_func(f"mine:   {result.user_numbers.numbers}")
-    print_func(f"match:  {result.match_count}")
-    print_func(f"rank:   {result.rank}")
+    # 함수를 넘기면 예전처럼 네 줄을 한 줄씩, 싱크를 넘기면 싱크가 정한 방식으로 출력
+    sink.write_result(result)
 
     return result
 
 
+def simulate_games(games: int, rng: random.Random | None = None) -> list[int]:
+    """
+    무작위 티켓 x 무작위 추첨으로 games판을 진행한 등수 코드별 횟수 (인덱스 = 등수 코드)
+
+    판마다 모델을 만들지 않고 비트마스크로 일치 개수를 계산합니다.
+    """
+    rng = rng or random.Random()
+    numbers = range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1)
+    match_counts = bytes(
+        (
+            to_mask(rng.sample(numbers, LOTTO_NUMBER_COUNT)) & to_mask(rng.sample(numbers, LOTTO_NUMBER_COUNT))
+        ).bit_count()
+        for _ in range(games)
+    )
+    return count_ranks(get_rank_many(match_counts))
+
+
 def main() -> None:
     """
     메인 실행 함수
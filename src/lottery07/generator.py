@@ -1,8 +1,20 @@
+import heapq
 import random
-from typing import Callable, Protocol
+from math import log
+from typing import Callable, Protocol, Sequence
 
+from src.lottery07.combination import combination_count, combination_unrank
 from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+from src.lottery07.constraint import PickConstraints, compile_constraints
+from src.lottery07.history import DrawHistory
 from src.lottery07.model import LottoNumbers
+from src.lottery07.popularity import PopularityTracker
+from src.lottery07.sampling import AliasTable
+from src.lottery07.ticket import TicketBatch, to_mask
+from src.lottery07.wheel import wheel_tickets
+
+# _PAIRS[순위] = 번호 쌍 (a, b), a < b
+_PAIRS = [tuple(combination_unrank(rank, 2)) for rank in range(combination_count(2))]
 
 
 class LottoGenerator(Protocol):
@@ -10,10 +22,13 @@ class LottoGenerator(Protocol):
 
 
 class AutoLottoGenerator:
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.rng = rng or random.Random()
+
     def generate(self) -> LottoNumbers:
         numbers: list[int] = []
         while len(numbers) < LOTTO_NUMBER_COUNT:
-            candidate = random.randint(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER)
+            candidate = self.rng.randint(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER)
             if candidate in numbers:
                 continue
             numbers.append(candidate)
@@ -65,3 +80,161 @@ class ManualLottoGenerator:
             self.print_func(f"{number} 추가됨 (현재: {numbers})")
 
         return LottoNumbers(numbers=numbers)
+
+
+class AntiPopularLottoGenerator:
+    """
+    인기 없는 조합을 우선하는 자동 생성 전략
+
+    당첨금은 같은 조합을 산 사람끼리 나누므로, 현재 판매 중 적게 팔린 번호/쌍을 고릅니다.
+    - 쌍 (a, b)의 가중치 = w(a) * w(b) / (쌍 판매 수 + 1), w(n) = 1 / (번호 판매 수 + 1)
+    - 쌍 990개로 alias 테이블을 만들고, 서로 겹치지 않는 쌍 3개를 뽑아 번호 6개를 만듦
+    - 판매 수가 rebuild_every장 이상 늘어날 때만 alias 테이블을 통째로 다시 만듦
+
+    가중치를 판매마다 갱신하지 않습니다. alias 테이블은 일부 가중치만 고칠 수 없고,
+    티켓 한 장이 팔리면 쌍 990개 중 약 250개의 가중치가 바뀌므로
+    O(990) 재구성을 rebuild_every장에 한 번 하는 편이 더 쌉니다 (그동안 가중치는 조금 낡음).
+    """
+
+    def __init__(
+        self,
+        tracker: PopularityTracker,
+        rebuild_every: int = 10_000,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.tracker = tracker
+        self.rebuild_every = rebuild_every
+        self.rng = rng or random.Random()
+        self._built_at = 0
+        self._table: AliasTable | None = None
+
+    def _refresh(self) -> AliasTable:
+        if self._table is None or self.tracker.ticket_count - self._built_at >= self.rebuild_every:
+            number_counts, pair_counts = self.tracker.number_counts, self.tracker.pair_counts
+            self._table = AliasTable(
+                [
+                    1 / ((number_counts[first] + 1) * (number_counts[second] + 1) * (pair_counts[rank] + 1))
+                    for rank, (first, second) in enumerate(_PAIRS)
+                ]
+            )
+            self._built_at = self.tracker.ticket_count
+        return self._table
+
+    def generate(self) -> LottoNumbers:
+        table = self._refresh()
+        numbers: list[int] = []
+        while len(numbers) < LOTTO_NUMBER_COUNT:
+            first, second = _PAIRS[table.sample(self.rng)]
+            if first not in numbers and second not in numbers:
+                numbers += (first, second)
+        return LottoNumbers(numbers=sorted(numbers))
+
+
+class WeightedLottoGenerator:
+    """
+    번호별 가중치를 따르는 비복원 추출 생성 전략
+
+    weights[n]은 번호 n의 가중치입니다 (인덱스 0은 쓰지 않음).
+    Gumbel-top-k: 번호마다 키 -log(U) / w(n)을 매겨 가장 작은 6개를 고릅니다.
+    남은 번호들의 가중치로 다시 정규화해 하나씩 뽑는 것(비복원 순차 추출)과 같은 분포이며,
+    다시 뽑기가 없어서 가중치가 한쪽에 몰려도 한 장에 난수 45개로 끝납니다.
+    """
+
+    def __init__(self, weights: Sequence[float], rng: random.Random | None = None) -> None:
+        if len(weights) != LOTTO_MAX_NUMBER + 1:
+            raise ValueError(f"가중치는 0~{LOTTO_MAX_NUMBER}번 인덱스({LOTTO_MAX_NUMBER + 1}개)가 필요합니다.")
+        self.numbers = [number for number in range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1) if weights[number] > 0]
+        if len(self.numbers) < LOTTO_NUMBER_COUNT:
+            raise ValueError(f"가중치가 0보다 큰 번호가 {LOTTO_NUMBER_COUNT}개 이상이어야 합니다.")
+        self._inverse_weights = [1 / weights[number] for number in self.numbers]
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def from_history(
+        cls, history: str | DrawHistory, strategy: str = "hot", rng: random.Random | None = None
+    ) -> "WeightedLottoGenerator":
+        """
+        과거 추첨 기록(파일 경로 또는 DrawHistory)으로 가중치를 만듭니다.
+
+        - hot : 자주 나온 번호일수록 잘 뽑힘 (출현 횟수 + 1)
+        - cold: 적게 나온 번호일수록 잘 뽑힘 (1 / (출현 횟수 + 1))
+        """
+        if isinstance(history, str):
+            history = DrawHistory.load(history)
+        frequencies = history.frequencies()
+        if strategy == "hot":
+            weights = [frequency + 1 for frequency in frequencies]
+        elif strategy == "cold":
+            weights = [1 / (frequency + 1) for frequency in frequencies]
+        else:
+            raise ValueError(f"지원하지 않는 전략입니다: {strategy} (hot, cold)")
+        return cls(weights, rng)
+
+    def generate(self) -> LottoNumbers:
+        next_random = self.rng.random
+        # 1 - random()은 (0, 1] 범위라 log(0)이 나오지 않음
+        keys = [-log(1.0 - next_random()) * inverse for inverse in self._inverse_weights]
+        chosen = heapq.nsmallest(LOTTO_NUMBER_COUNT, zip(keys, self.numbers))
+        return LottoNumbers(numbers=sorted(number for _, number in chosen))
+
+    def generate_batch(self, count: int) -> list[LottoNumbers]:
+        return [self.generate() for _ in range(count)]
+
+
+class ConstrainedLottoGenerator:
+    """
+    제약 조건을 만족하는 조합 중 하나를 균등하게 고르는 생성 전략
+
+    거절 샘플링 대신 조건을 만족하는 조합 순위 목록을 미리 만들어 두고(compile_constraints)
+    목록에서 무작위 인덱스 하나를 고릅니다.
+    """
+
+    def __init__(
+        self,
+        constraints: PickConstraints,
+        cache_dir: str | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.ranks = compile_constraints(constraints, cache_dir)
+        if not self.ranks:
+            raise ValueError("제약 조건을 만족하는 조합이 없습니다.")
+        self.rng = rng or random.Random()
+
+    def generate(self) -> LottoNumbers:
+        rank = self.ranks[self.rng.randrange(len(self.ranks))]
+        return LottoNumbers(numbers=combination_unrank(rank))
+
+
+class WheelLottoGenerator:
+    """
+    휠(커버링 디자인) 티켓을 차례로 돌려주는 생성 전략
+
+    풀 번호 중 drawn개가 당첨 번호에 들어 있으면 티켓 중 한 장은 guarantee개 이상 맞습니다.
+    generate()는 휠 티켓을 순서대로 돌려주고 끝나면 처음부터 반복합니다.
+    """
+
+    def __init__(
+        self,
+        pool: Sequence[int],
+        guarantee: int = 3,
+        drawn: int | None = None,
+        cache_dir: str | None = None,
+    ) -> None:
+        self.tickets = wheel_tickets(pool, guarantee, drawn, cache_dir)
+        self._position = 0
+
+    def generate(self) -> LottoNumbers:
+        ticket = self.tickets[self._position]
+        self._position = (self._position + 1) % len(self.tickets)
+        return ticket
+
+    def generate_batch(self, count: int | None = None) -> list[LottoNumbers]:
+        """count를 생략하면 휠 티켓 전체"""
+        return [self.generate() for _ in range(len(self.tickets) if count is None else count)]
+
+    def ticket_batch(self) -> TicketBatch:
+        """휠 티켓 전체를 일괄 정산용 묶음(id 1부터)으로"""
+        batch = TicketBatch()
+        for ticket_id, ticket in enumerate(self.tickets, start=1):
+            batch.append(ticket_id, to_mask(ticket.numbers))
+        return batch
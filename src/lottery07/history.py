@@ -0,0 +1,226 @@
+"""
+과거 추첨 기록 (CSV / 바이너리 파일)과 번호별 통계
+
+- read_draw_file / number_frequencies: CSV 기록 파일을 읽음
+- DrawHistory: 회차 열을 바이트 배열로 보관하고 출현 횟수, 미출현 회차 수, 쌍 빈도를 계산해 둠
+"""
+
+import os
+import struct
+import sys
+from array import array
+from itertools import combinations
+from typing import Iterable
+
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import to_mask
+
+# ===== 과거 추첨 기록 파일 =====
+# CSV 한 줄에 한 회차: draw_no,n1,n2,n3,n4,n5,n6,bonus
+# 첫 칸이 숫자가 아닌 줄(헤더)과 빈 줄은 건너뜁니다.
+
+
+def read_draw_file(path: str) -> list[tuple[int, list[int], int]]:
+    """(회차, 당첨 번호 6개, 보너스 번호) 목록"""
+    draws = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            fields = line.strip().split(",")
+            if not fields[0].strip().isdigit():
+                continue
+            values = [int(field) for field in fields]
+            if len(values) != LOTTO_NUMBER_COUNT + 2:
+                raise ValueError(f"회차 기록 형식이 올바르지 않습니다: {line.strip()}")
+            draws.append((values[0], values[1 : LOTTO_NUMBER_COUNT + 1], values[-1]))
+    return draws
+
+
+def number_frequencies(path: str) -> list[int]:
+    """번호별 당첨 번호 출현 횟수 (인덱스 = 번호, 보너스 제외)"""
+    return DrawHistory.load(path).frequencies()
+
+
+# ===== 추첨 기록 통계 =====
+# 회차 번호(uint32 열), 당첨 번호(회차마다 정렬된 6바이트를 이어 붙인 bytearray), 보너스(바이트 열)로 보관합니다.
+# 번호 열이 바이트라서 출현 횟수는 bytes.count(), 마지막 출현 위치는 bytes.rfind()로 C 수준에서 셉니다.
+#
+# 바이너리 파일 (little-endian):
+#     헤더(magic b"LHIS" + 회차 수 n) + 회차 번호 uint32 x n + 당첨 번호 uint8 x 6n + 보너스 uint8 x n
+
+_HISTORY_MAGIC = b"LHIS"
+_HISTORY_HEADER = struct.Struct("<4sI")
+
+_NUMBERS = range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1)
+_VALID_NUMBER_BYTES = bytes(_NUMBERS)
+
+
+class DrawHistory:
+    """
+    과거 추첨 기록과 번호별 통계
+
+    통계는 처음 요청할 때 계산해 두고, append()로 회차가 추가되면 새 회차만 반영해 갱신합니다.
+    version은 기록된 회차 수이며 회차가 추가될 때마다 늘어납니다.
+    """
+
+    def __init__(self) -> None:
+        self.draw_nos = array("I")
+        self.numbers = bytearray()
+        self.bonuses = bytearray()
+        self._frequencies: list[int] | None = None
+        self._last_seen: list[int] | None = None
+        self._pairs: list[list[int]] | None = None
+        self._rolling: dict[int, list[int]] = {}
+
+    @classmethod
+    def from_draws(cls, draws: Iterable[tuple[int, list[int], int]]) -> "DrawHistory":
+        history = cls()
+        for draw_no, numbers, bonus in draws:
+            history.append(draw_no, LottoNumbers(numbers=numbers), bonus)
+        return history
+
+    @classmethod
+    def load(cls, path: str) -> "DrawHistory":
+        """CSV(read_draw_file 형식) 또는 save()로 만든 바이너리 파일"""
+        with open(path, "rb") as file:
+            header = file.read(_HISTORY_HEADER.size)
+            if header[:4] != _HISTORY_MAGIC:
+                return cls.from_draws(read_draw_file(path))
+            _, count = _HISTORY_HEADER.unpack(header)
+            history = cls()
+            try:
+                history.draw_nos.fromfile(file, count)
+            except EOFError:
+                raise ValueError(f"추첨 기록 파일이 잘렸습니다: {path}") from None
+            history.numbers = bytearray(file.read(LOTTO_NUMBER_COUNT * count))
+            history.bonuses = bytearray(file.read(count))
+        if len(history.numbers) != LOTTO_NUMBER_COUNT * count or len(history.bonuses) != count:
+            raise ValueError(f"추첨 기록 파일이 잘렸습니다: {path}")
+        if sys.byteorder == "big":
+            history.draw_nos.byteswap()
+        history._validate(path)
+        return history
+
+    def _validate(self, path: str) -> None:
+        """파일에서 읽은 열이 append()로 만든 기록과 같은 조건을 만족하는지 (회차 증가, 정렬된 서로 다른 번호, 보너스)"""
+        if self.numbers.translate(None, _VALID_NUMBER_BYTES) or self.bonuses.translate(None, _VALID_NUMBER_BYTES):
+            raise ValueError(f"추첨 기록 파일에 {LOTTO_MIN_NUMBER}~{LOTTO_MAX_NUMBER} 범위 밖 번호가 있습니다: {path}")
+        if any(previous >= current for previous, current in zip(self.draw_nos, self.draw_nos[1:])):
+            raise ValueError(f"추첨 기록 파일의 회차가 증가 순서가 아닙니다: {path}")
+        numbers = self.numbers
+        for index, bonus in enumerate(self.bonuses):
+            drawn = numbers[index * LOTTO_NUMBER_COUNT : (index + 1) * LOTTO_NUMBER_COUNT]
+            if any(previous >= current for previous, current in zip(drawn, drawn[1:])) or bonus in drawn:
+                raise ValueError(f"추첨 기록 파일의 {self.draw_nos[index]}회차 번호가 올바르지 않습니다: {path}")
+
+    def save(self, path: str) -> None:
+        draw_nos = array("I", self.draw_nos)
+        if sys.byteorder == "big":
+            draw_nos.byteswap()
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(_HISTORY_HEADER.pack(_HISTORY_MAGIC, len(self)))
+            draw_nos.tofile(file)
+            file.write(self.numbers)
+            file.write(self.bonuses)
+        os.replace(temporary, path)
+
+    def __len__(self) -> int:
+        return len(self.draw_nos)
+
+    @property
+    def version(self) -> int:
+        return len(self.draw_nos)
+
+    def draw(self, index: int) -> tuple[int, LottoNumbers, int]:
+        """index번째 (회차, 당첨 번호, 보너스), 음수 인덱스 가능"""
+        index = range(len(self))[index]
+        start = index * LOTTO_NUMBER_COUNT
+        numbers = list(self.numbers[start : start + LOTTO_NUMBER_COUNT])
+        return self.draw_nos[index], LottoNumbers(numbers=numbers), self.bonuses[index]
+
+    def masks(self) -> array:
+        """회차별 당첨 번호 비트마스크 (count_match_many 등에 그대로 사용)"""
+        numbers = self.numbers
+        return array(
+            "Q",
+            (
+                to_mask(numbers[start : start + LOTTO_NUMBER_COUNT])
+                for start in range(0, len(numbers), LOTTO_NUMBER_COUNT)
+            ),
+        )
+
+    def append(self, draw_no: int, lotto: LottoNumbers, bonus: int) -> None:
+        """새 회차를 추가하고 계산해 둔 통계를 새 회차만큼 갱신합니다."""
+        if self.draw_nos and draw_no <= self.draw_nos[-1]:
+            raise ValueError(f"회차는 증가해야 합니다: {draw_no} <= {self.draw_nos[-1]}")
+        if not LOTTO_MIN_NUMBER <= bonus <= LOTTO_MAX_NUMBER or bonus in lotto.numbers:
+            raise ValueError(f"보너스 번호가 올바르지 않습니다: {bonus}")
+
+        numbers = sorted(lotto.numbers)
+        index = len(self)
+        self.draw_nos.append(draw_no)
+        self.numbers += bytes(numbers)
+        self.bonuses.append(bonus)
+
+        if self._frequencies is not None:
+            for number in numbers:
+                self._frequencies[number] += 1
+        if self._last_seen is not None:
+            for number in numbers:
+                self._last_seen[number] = index
+        if self._pairs is not None:
+            for first, second in combinations(numbers, 2):
+                self._pairs[first][second] += 1
+                self._pairs[second][first] += 1
+        for window, frequencies in self._rolling.items():
+            for number in numbers:
+                frequencies[number] += 1
+            if index >= window:
+                start = (index - window) * LOTTO_NUMBER_COUNT
+                for number in self.numbers[start : start + LOTTO_NUMBER_COUNT]:
+                    frequencies[number] -= 1
+
+    def frequencies(self) -> list[int]:
+        """번호별 당첨 번호 출현 횟수 (인덱스 = 번호, 보너스 제외)"""
+        if self._frequencies is None:
+            self._frequencies = self._count(self.numbers)
+        return list(self._frequencies)
+
+    def rolling_frequencies(self, window: int) -> list[int]:
+        """최근 window회차의 번호별 출현 횟수"""
+        if window < 1:
+            raise ValueError("window는 1 이상이어야 합니다.")
+        if window not in self._rolling:
+            self._rolling[window] = self._count(self.numbers[-window * LOTTO_NUMBER_COUNT :])
+        return list(self._rolling[window])
+
+    def gaps(self) -> list[int]:
+        """
+        번호별로 마지막 출현 이후 지난 회차 수 (인덱스 = 번호)
+
+        최근 회차에 나왔으면 0, 한 번도 나오지 않았으면 전체 회차 수입니다.
+        """
+        if self._last_seen is None:
+            self._last_seen = [-1] * (LOTTO_MAX_NUMBER + 1)
+            for number in _NUMBERS:
+                position = self.numbers.rfind(number)
+                if position >= 0:
+                    self._last_seen[number] = position // LOTTO_NUMBER_COUNT
+        last_index = len(self) - 1
+        return [0] + [last_index - self._last_seen[number] for number in _NUMBERS]
+
+    def pair_counts(self) -> list[list[int]]:
+        """두 번호가 같은 회차에 함께 나온 횟수 (pair_counts()[a][b], 대칭)"""
+        if self._pairs is None:
+            self._pairs = [[0] * (LOTTO_MAX_NUMBER + 1) for _ in range(LOTTO_MAX_NUMBER + 1)]
+            numbers = self.numbers
+            for start in range(0, len(numbers), LOTTO_NUMBER_COUNT):
+                for first, second in combinations(numbers[start : start + LOTTO_NUMBER_COUNT], 2):
+                    self._pairs[first][second] += 1
+                    self._pairs[second][first] += 1
+        return [list(row) for row in self._pairs]
+
+    @staticmethod
+    def _count(numbers: bytes | bytearray) -> list[int]:
+        return [0] + [numbers.count(number) for number in _NUMBERS]
@@ -0,0 +1,392 @@
+"""
+판매 티켓 수집 서버 (asyncio, 로컬 TCP 또는 Unix 소켓)
+
+단말기가 티켓 묶음을 바이너리 프레임으로 보내면 한꺼번에 검사해 저장소(TicketStore)와
+회차별 노출 카운터(ExposureIndex), 인기도 집계(PopularityTracker)에 반영하고, 묶음마다 응답(ack)을 돌려줍니다.
+
+프레임 (little-endian):
+    요청: magic b"LING" + 묶음 id(uint32) + 회차(uint32) + 단말기(uint32) + 티켓 수 n(uint32)
+          + 티켓 n장 (번호 6개를 uint8 6바이트로, parse_ticket_records 형식)
+    응답: magic b"LACK" + 묶음 id(uint32) + 상태(uint8) + 첫 티켓 id(uint64) + 저장 수(uint32) + 거부 수 m(uint32)
+          + 거부된 티켓의 묶음 안 위치 uint32 x m
+    묶음의 i번째 티켓 id = 첫 티켓 id + i (거부된 티켓의 id는 비워 두며, 서버가 도는 동안 다시 매기지 않음)
+
+흐름:
+    연결마다 읽기 태스크 -> 전체 대기열(크기 queue_size) -> 저장 루프 (전용 스레드 하나)
+                         -> 연결별 응답 대기열(크기 max_in_flight) -> 응답 태스크 (받은 순서대로)
+- 역압: 대기열이 차면 읽기 태스크가 멈추고, 소켓 버퍼가 차면 단말기의 전송도 멈춥니다.
+- 저장 루프는 대기열에 쌓인 묶음을 max_group개까지 모아 트랜잭션 하나로 저장합니다.
+- SQLite 연결은 만든 스레드에서만 쓸 수 있으므로 저장소는 저장 스레드 안에서 열고 닫습니다.
+- 저장이 끝난 묶음은 노출 카운터/인기도 갱신이 실패해도 STATUS_OK로 응답하고,
+  실패 수는 통계(exposure_errors, popularity_errors)로 알립니다.
+- 노출 카운터와 인기도는 검사를 통과한 티켓의 정렬된 6바이트 레코드 열을 묶음째 반영합니다 (add_packed, update_packed).
+- 지연 시간: 프레임을 다 받은 때부터 응답을 보낸 때까지, 최근 LATENCY_WINDOW개 기준 분위수
+"""
+
+import argparse
+import asyncio
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel
+
+from src.lottery07.const import LOTTO_NUMBER_COUNT
+from src.lottery07.exposure import ExposureIndex
+from src.lottery07.liability import quantile
+from src.lottery07.popularity import PopularityTracker
+from src.lottery07.ticket import TicketBatch, parse_ticket_records
+from src.lottery07.ticket_store import TicketStore
+
+FRAME_HEADER = struct.Struct("<4sIIII")
+ACK_HEADER = struct.Struct("<4sIBQII")
+FRAME_MAGIC = b"LING"
+ACK_MAGIC = b"LACK"
+
+STATUS_OK = 0
+STATUS_INVALID = 1
+STATUS_ERROR = 2
+
+MAX_BATCH_TICKETS = 100_000
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_GROUP = 16
+LATENCY_WINDOW = 10_000
+
+_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+class IngestAck(BaseModel):
+    """묶음 하나의 처리 결과"""
+
+    batch_id: int
+    status: int = STATUS_OK
+    first_ticket_id: int = 0
+    accepted: int = 0
+    rejected: list[int] = []
+
+
+class IngestStats(BaseModel):
+    """수집 서버 누적 통계 (지연 시간은 ms)"""
+
+    batches: int
+    tickets: int
+    rejected: int
+    exposure_errors: int
+    popularity_errors: int
+    queued: int
+    latency_ms: dict[str, float]
+
+
+def encode_batch(batch_id: int, draw_no: int, terminal_id: int, tickets: list[list[int]]) -> bytes:
+    """단말기 쪽: 티켓 번호 목록 -> 요청 프레임"""
+    payload = b"".join(bytes(numbers) for numbers in tickets)
+    return FRAME_HEADER.pack(FRAME_MAGIC, batch_id, draw_no, terminal_id, len(tickets)) + payload
+
+
+def encode_ack(ack: IngestAck) -> bytes:
+    rejected = array("I", ack.rejected)
+    if sys.byteorder == "big":
+        rejected.byteswap()
+    header = ACK_HEADER.pack(ACK_MAGIC, ack.batch_id, ack.status, ack.first_ticket_id, ack.accepted, len(rejected))
+    return header + rejected.tobytes()
+
+
+async def read_ack(reader: asyncio.StreamReader) -> IngestAck:
+    """단말기 쪽: 응답 프레임 하나를 읽습니다."""
+    magic, batch_id, status, first_ticket_id, accepted, rejected_count = ACK_HEADER.unpack(
+        await reader.readexactly(ACK_HEADER.size)
+    )
+    if magic != ACK_MAGIC:
+        raise ValueError("수집 서버 응답 형식이 아닙니다.")
+    rejected = array("I", await reader.readexactly(4 * rejected_count))
+    if sys.byteorder == "big":
+        rejected.byteswap()
+    return IngestAck(
+        batch_id=batch_id, status=status, first_ticket_id=first_ticket_id, accepted=accepted, rejected=list(rejected)
+    )
+
+
+class _PendingBatch:
+    """검사를 마치고 저장을 기다리는 묶음 (batch의 티켓 id는 묶음 안 위치)"""
+
+    def __init__(
+        self,
+        batch_id: int,
+        draw_no: int,
+        terminal_id: int,
+        ticket_count: int,
+        parsed: tuple[TicketBatch, bytes, list[tuple[int, str]]],
+        future: asyncio.Future,
+    ) -> None:
+        self.batch_id = batch_id
+        self.draw_no = draw_no
+        self.terminal_id = terminal_id
+        self.ticket_count = ticket_count
+        self.batch, self.packed, errors = parsed
+        self.rejected = [index for index, _ in errors]
+        self.future = future
+
+
+class IngestServer:
+    """
+    티켓 수집 서버
+
+    exposures는 회차별 노출 카운터, popularities는 회차별 인기도 집계이며 저장 스레드에서 갱신됩니다.
+    track_exposure=False / track_popularity=False면 해당 집계를 갱신하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store_path: str,
+        track_exposure: bool = True,
+        track_popularity: bool = True,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_group: int = DEFAULT_MAX_GROUP,
+    ) -> None:
+        self.store_path = store_path
+        self.track_exposure = track_exposure
+        self.track_popularity = track_popularity
+        self.queue_size = queue_size
+        self.max_in_flight = max_in_flight
+        self.max_group = max_group
+        self.exposures: dict[int, ExposureIndex] = {}
+        self.popularities: dict[int, PopularityTracker] = {}
+        self.batches = 0
+        self.tickets = 0
+        self.rejected = 0
+        self.exposure_errors = 0
+        self.popularity_errors = 0
+        self._next_ticket_id = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-store")
+        self._store: TicketStore | None = None
+        self._queue: asyncio.Queue | None = None
+        self._writer_task: asyncio.Task | None = None
+
+    # ===== 시작 / 종료 =====
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._open_store)
+        self._queue = asyncio.Queue(self.queue_size)
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        """대기열에 남은 묶음을 모두 저장한 뒤 저장소를 닫습니다."""
+        if self._writer_task is not None:
+            await self._queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._close_store)
+        self._executor.shutdown()
+
+    def _open_store(self) -> None:
+        self._store = TicketStore(self.store_path)
+        self._next_ticket_id = self._store.next_ticket_id
+
+    def _close_store(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    # ===== 연결 =====
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        acks: asyncio.Queue = asyncio.Queue(self.max_in_flight)
+        sender = asyncio.create_task(self._send_acks(acks, writer))
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(FRAME_HEADER.size)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                magic, batch_id, draw_no, terminal_id, count = FRAME_HEADER.unpack(header)
+                future = asyncio.get_running_loop().create_future()
+                if magic != FRAME_MAGIC or count > MAX_BATCH_TICKETS:
+                    # 프레임 경계를 잃었으므로 응답 후 연결을 닫음
+                    future.set_result(IngestAck(batch_id=batch_id, status=STATUS_INVALID))
+                    await acks.put((future, time.perf_counter()))
+                    break
+                try:
+                    payload = await reader.readexactly(count * LOTTO_NUMBER_COUNT)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                received = time.perf_counter()
+                pending = _PendingBatch(
+                    batch_id, draw_no, terminal_id, count, parse_ticket_records(payload, first_id=0), future
+                )
+                await acks.put((future, received))
+                await self._queue.put(pending)
+        finally:
+            await acks.put(None)
+            await sender
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _send_acks(self, acks: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """응답을 묶음을 받은 순서대로 보냅니다 (연결이 끊기면 남은 응답은 버림)."""
+        connected = True
+        while (item := await acks.get()) is not None:
+            future, received = item
+            ack = await future
+            if not connected:
+                continue
+            try:
+                writer.write(encode_ack(ack))
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+                continue
+            self._latencies.append(time.perf_counter() - received)
+
+    # ===== 저장 =====
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            group = []
+            item = await self._queue.get()
+            while item is not None:
+                group.append(item)
+                if len(group) >= self.max_group or self._queue.empty():
+                    break
+                item = self._queue.get_nowait()
+            stopping = item is None
+            if not group:
+                continue
+            try:
+                first_ids = await loop.run_in_executor(self._executor, self._store_group, group)
+            except Exception:
+                for pending in group:
+                    pending.future.set_result(IngestAck(batch_id=pending.batch_id, status=STATUS_ERROR))
+                continue
+            for pending, first_id in zip(group, first_ids):
+                self.batches += 1
+                self.tickets += len(pending.batch)
+                self.rejected += len(pending.rejected)
+                pending.future.set_result(
+                    IngestAck(
+                        batch_id=pending.batch_id,
+                        first_ticket_id=first_id,
+                        accepted=len(pending.batch),
+                        rejected=pending.rejected,
+                    )
+                )
+
+    def _store_group(self, group: list[_PendingBatch]) -> list[int]:
+        """
+        저장 스레드: 묶음들에 티켓 id를 매겨 한 트랜잭션으로 저장하고 노출 카운터와 인기도를 갱신합니다.
+
+        id는 저장소의 가장 큰 id가 아니라 서버가 마지막으로 매긴 id 다음부터 매기므로,
+        끝부분 티켓이 거부된 묶음 뒤에도 거부된 티켓의 id를 다른 티켓에 주지 않습니다.
+        """
+        first_ids = []
+        entries = []
+        next_id = self._next_ticket_id
+        for pending in group:
+            first_ids.append(next_id)
+            ids = array("Q", [next_id + index for index in pending.batch.ids])
+            entries.append((pending.draw_no, TicketBatch(ids, pending.batch.masks), pending.terminal_id))
+            next_id += pending.ticket_count
+        self._store.add_batches(entries)
+        self._next_ticket_id = next_id
+
+        for pending in group:
+            if self.track_exposure:
+                try:
+                    exposure = self.exposures.get(pending.draw_no)
+                    if exposure is None:
+                        exposure = self.exposures[pending.draw_no] = ExposureIndex()
+                    exposure.add_packed(pending.packed)
+                except Exception:
+                    self.exposure_errors += 1
+            if self.track_popularity:
+                try:
+                    popularity = self.popularities.get(pending.draw_no)
+                    if popularity is None:
+                        popularity = self.popularities[pending.draw_no] = PopularityTracker()
+                    popularity.update_packed(pending.packed)
+                except Exception:
+                    self.popularity_errors += 1
+        return first_ids
+
+    # ===== 통계 =====
+
+    def stats(self) -> IngestStats:
+        latencies = sorted(self._latencies)
+        latency_ms = {name: quantile(latencies, q) * 1000 for name, q in _PERCENTILES.items()} if latencies else {}
+        if latencies:
+            latency_ms["max"] = latencies[-1] * 1000
+        return IngestStats(
+            batches=self.batches,
+            tickets=self.tickets,
+            rejected=self.rejected,
+            exposure_errors=self.exposure_errors,
+            popularity_errors=self.popularity_errors,
+            queued=self._queue.qsize() if self._queue is not None else 0,
+            latency_ms=latency_ms,
+        )
+
+
+async def start_ingest_server(server: IngestServer, host: str = "127.0.0.1", port: int = 9100) -> asyncio.Server:
+    await server.start()
+    return await asyncio.start_server(server.handle_connection, host, port)
+
+
+async def start_ingest_unix_server(server: IngestServer, path: str) -> asyncio.Server:
+    await server.start()
+    return await asyncio.start_unix_server(server.handle_connection, path)
+
+
+def format_stats(stats: IngestStats) -> str:
+    latency = " ".join(f"{name}={value:.2f}ms" for name, value in stats.latency_ms.items())
+    return f"batches={stats.batches} tickets={stats.tickets} rejected={stats.rejected} {latency}".rstrip()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="판매 티켓 수집 서버")
+    parser.add_argument("--store", required=True, help="TicketStore SQLite 파일")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--unix", help="TCP 대신 Unix 소켓 경로")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument("--no-exposure", action="store_true", help="노출 카운터를 갱신하지 않음")
+    parser.add_argument("--no-popularity", action="store_true", help="인기도 집계를 갱신하지 않음")
+    args = parser.parse_args(argv)
+
+    ingest = IngestServer(
+        args.store,
+        track_exposure=not args.no_exposure,
+        track_popularity=not args.no_popularity,
+        queue_size=args.queue_size,
+    )
+
+    async def run() -> None:
+        if args.unix:
+            server = await start_ingest_unix_server(ingest, args.unix)
+        else:
+            server = await start_ingest_server(ingest, args.host, args.port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await ingest.stop()
+            print(format_stats(ingest.stats()))
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+회차별 당첨금 원장 (SQLite, 추가 전용)
+
+1등 당첨자가 없으면 1등 배분액이 다음 회차로 이월됩니다 (ROLLOVER_RANKS).
+회차마다 판매/지급/이월 이벤트를 추가만 하고, 일정 회차마다 누적 상태 스냅샷을 남깁니다.
+
+- 그룹 커밋: 이벤트를 모아 두었다가 commit_every개마다 한 트랜잭션으로 기록
+- 빠른 재구성: 가장 가까운 이전 스냅샷부터 이후 이벤트만 재생
+"""
+
+import sqlite3
+from typing import Iterable, Mapping
+
+from pydantic import BaseModel
+
+from src.lottery07.const import ROLLOVER_RANKS
+from src.lottery07.prize import DEFAULT_PRIZE_RULE, PrizeRule, calculate_payouts, pool_amount
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    draw_no INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    rank TEXT,
+    amount INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_draw_no ON events (draw_no);
+CREATE TABLE IF NOT EXISTS snapshots (
+    draw_no INTEGER PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+# 이벤트 종류
+EVENT_DRAW = "draw"  # 회차 시작, amount = 판매액
+EVENT_PAYOUT = "payout"  # 등수별 총 지급액
+EVENT_ROLLOVER = "rollover"  # 다음 회차로 이월되는 금액
+
+
+class LedgerState(BaseModel):
+    """특정 회차 직후의 누적 상태"""
+
+    draw_no: int = 0
+    total_sales: int = 0
+    total_paid: int = 0
+    carryovers: dict[str, int] = {}
+
+
+def apply_events(state: LedgerState, events: Iterable[tuple[int, str, str | None, int]]) -> LedgerState:
+    """(회차, 종류, 등수, 금액) 이벤트를 순서대로 적용한 새 상태를 반환합니다."""
+    state = state.model_copy(deep=True)
+    for draw_no, kind, rank, amount in events:
+        if kind == EVENT_DRAW:
+            state.draw_no = draw_no
+            state.total_sales += amount
+            state.carryovers = {}
+        elif kind == EVENT_PAYOUT:
+            state.total_paid += amount
+        elif kind == EVENT_ROLLOVER:
+            state.carryovers[rank] = amount
+    return state
+
+
+class JackpotLedger:
+    """이월 당첨금 원장"""
+
+    def __init__(
+        self,
+        path: str,
+        rule: PrizeRule = DEFAULT_PRIZE_RULE,
+        commit_every: int = 1_000,
+        snapshot_every: int = 100,
+    ) -> None:
+        self.rule = rule
+        self.commit_every = commit_every
+        self.snapshot_every = snapshot_every
+        self._pending_events: list[tuple[int, str, str | None, int]] = []
+        self._pending_snapshots: list[tuple[int, str]] = []
+        self._draws_since_snapshot = 0
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+        last_draw_no = self._connection.execute("SELECT MAX(draw_no) FROM events").fetchone()[0]
+        self.state = self.balances(last_draw_no) if last_draw_no is not None else LedgerState()
+
+    def record_draw(self, draw_no: int, total_sales: int, winner_counts: Mapping[str, int]) -> dict[str, int]:
+        """
+        회차 결과를 기록하고 등수별 1인당 당첨금을 반환합니다.
+
+        직전 회차 이월금은 해당 등수 배분액에 더해집니다.
+        """
+        if draw_no <= self.state.draw_no:
+            raise ValueError(f"회차는 증가해야 합니다: {draw_no} <= {self.state.draw_no}")
+
+        payouts = calculate_payouts(total_sales, winner_counts, self.rule, self.state.carryovers)
+
+        events: list[tuple[int, str, str | None, int]] = [(draw_no, EVENT_DRAW, None, total_sales)]
+        for rank, payout in payouts.items():
+            winners = winner_counts.get(rank, 0)
+            if winners:
+                events.append((draw_no, EVENT_PAYOUT, rank, payout * winners))
+            elif rank in ROLLOVER_RANKS and rank in self.rule.pool_shares:
+                carried = pool_amount(total_sales, self.rule.pool_shares[rank]) + self.state.carryovers.get(rank, 0)
+                events.append((draw_no, EVENT_ROLLOVER, rank, carried))
+
+        self.state = apply_events(self.state, events)
+        self._pending_events.extend(events)
+        self._draws_since_snapshot += 1
+        if self._draws_since_snapshot >= self.snapshot_every:
+            self._pending_snapshots.append((draw_no, self.state.model_dump_json()))
+            self._draws_since_snapshot = 0
+        if len(self._pending_events) >= self.commit_every:
+            self.flush()
+        return payouts
+
+    def flush(self) -> None:
+        """모아 둔 이벤트와 스냅샷을 한 트랜잭션으로 기록합니다."""
+        if not self._pending_events and not self._pending_snapshots:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO events (draw_no, kind, rank, amount) VALUES (?, ?, ?, ?)", self._pending_events
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO snapshots (draw_no, state) VALUES (?, ?)", self._pending_snapshots
+            )
+        self._pending_events.clear()
+        self._pending_snapshots.clear()
+
+    def balances(self, draw_no: int) -> LedgerState:
+        """draw_no 회차 직후의 누적 상태 (가장 가까운 스냅샷 + 이후 이벤트 재생)"""
+        self.flush()
+        row = self._connection.execute(
+            "SELECT draw_no, state FROM snapshots WHERE draw_no <= ? ORDER BY draw_no DESC LIMIT 1", (draw_no,)
+        ).fetchone()
+        snapshot_draw_no, state = (row[0], LedgerState.model_validate_json(row[1])) if row else (0, LedgerState())
+
+        events = self._connection.execute(
+            "SELECT draw_no, kind, rank, amount FROM events WHERE draw_no > ? AND draw_no <= ? ORDER BY seq",
+            (snapshot_draw_no, draw_no),
+        )
+        return apply_events(state, events)
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> "JackpotLedger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
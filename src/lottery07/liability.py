@@ -0,0 +1,159 @@
+"""
+지급액(liability) 몬테카를로 시뮬레이션
+
+판매가 끝나기 전, 실제로 팔린 티켓 기준으로 총 지급액의 분포를 추정합니다.
+추첨마다 티켓을 훑는 대신 노출 인덱스(ExposureIndex)에서 등수별 당첨자 수를 읽고,
+한 라운드의 추첨 결과를 당첨금 엔진에 열 단위로 넘겨 한 번에 계산합니다.
+
+추첨 묶음(batch_size번)마다 분위수(p50/p99/p99.9)의 신뢰구간을 확인하고, 충분히 좁아지면 조기 종료합니다.
+"""
+
+import heapq
+import math
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import BaseModel
+
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT, LOTTO_TICKET_PRICE, RANK_NAMES
+from src.lottery07.exposure import ExposureIndex
+from src.lottery07.model import LottoNumbers
+from src.lottery07.prize import DEFAULT_PRIZE_RULE, PrizeRule, calculate_payouts_many
+
+QUANTILES = {"p50": 0.5, "p99": 0.99, "p99.9": 0.999}
+
+# 분위수 신뢰구간 (정규 근사, 95%)
+_CONFIDENCE_Z = 1.96
+
+_worker_index: ExposureIndex | None = None
+
+
+class LiabilityReport(BaseModel):
+    """총 지급액 분포 요약"""
+
+    draws: int
+    quantiles: dict[str, int]
+    worst_draws: list[tuple[list[int], int]]
+    converged: bool
+
+
+def simulate_payouts(
+    index: ExposureIndex, draw_count: int, seed: int, rule: PrizeRule = DEFAULT_PRIZE_RULE
+) -> list[tuple[int, list[int]]]:
+    """무작위 추첨 draw_count번의 (총 지급액, 추첨 번호) 목록"""
+    rng = random.Random(seed)
+    numbers_range = range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1)
+    draws = [sorted(rng.sample(numbers_range, LOTTO_NUMBER_COUNT)) for _ in range(draw_count)]
+
+    winner_columns: dict[str, list[int]] = {rank: [] for rank in RANK_NAMES}
+    for numbers in draws:
+        for rank, count in index.rank_counts(LottoNumbers(numbers=numbers)).items():
+            winner_columns[rank].append(count)
+
+    total_sales = [index.ticket_count * LOTTO_TICKET_PRICE] * draw_count
+    payout_columns = calculate_payouts_many(total_sales, winner_columns, rule)
+
+    totals = [0] * draw_count
+    for rank, payouts in payout_columns.items():
+        winners = winner_columns.get(rank, [0] * draw_count)
+        totals = [total + payout * count for total, payout, count in zip(totals, payouts, winners)]
+    return list(zip(totals, draws))
+
+
+def _init_worker(index_path: str) -> None:
+    global _worker_index
+    _worker_index = ExposureIndex.load(index_path)
+
+
+def _simulate_in_worker(draw_count: int, seed: int, rule: PrizeRule) -> list[tuple[int, list[int]]]:
+    return simulate_payouts(_worker_index, draw_count, seed, rule)
+
+
+def quantile(sorted_values: list[int], q: float) -> int:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def quantiles_converged(sorted_values: list[int], tolerance: float) -> bool:
+    """모든 분위수의 95% 신뢰구간 폭이 추정값의 tolerance 비율 이하인지"""
+    n = len(sorted_values)
+    for q in QUANTILES.values():
+        spread = _CONFIDENCE_Z * math.sqrt(n * q * (1 - q))
+        lower, upper = math.floor(n * q - spread), math.ceil(n * q + spread)
+        if lower < 0 or upper >= n:
+            return False
+        if sorted_values[upper] - sorted_values[lower] > tolerance * max(quantile(sorted_values, q), 1):
+            return False
+    return True
+
+
+def simulate_liability(
+    index: ExposureIndex,
+    max_draws: int = 100_000,
+    batch_size: int = 5_000,
+    workers: int = 1,
+    seed: int | None = None,
+    tolerance: float = 0.01,
+    worst: int = 10,
+    rule: PrizeRule = DEFAULT_PRIZE_RULE,
+) -> LiabilityReport:
+    """
+    총 지급액 분포를 시뮬레이션합니다.
+
+    라운드마다 workers x batch_size번 추첨하고, 신뢰구간이 tolerance 안으로 좁아지거나
+    max_draws에 도달하면 멈춥니다. workers가 2 이상이면 인덱스를 임시 파일로 저장해
+    각 워커 프로세스가 한 번씩 불러옵니다.
+
+    수렴 여부는 묶음 순서대로 묶음마다 확인하고 수렴한 뒤의 묶음은 버리므로,
+    같은 seed면 workers 수와 관계없이 결과가 같습니다.
+    """
+    if max_draws < 1 or batch_size < 1 or workers < 1:
+        raise ValueError("max_draws, batch_size, workers는 1 이상이어야 합니다.")
+    seed = seed if seed is not None else random.randrange(2**32)
+    totals: list[int] = []
+    worst_draws: list[tuple[int, list[int]]] = []
+    converged = False
+
+    executor = None
+    index_path = None
+    if workers > 1:
+        file_descriptor, index_path = tempfile.mkstemp(suffix=".exposure")
+        os.close(file_descriptor)
+        index.save(index_path)
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index_path,))
+
+    try:
+        round_no = 0
+        while len(totals) < max_draws and not converged:
+            seeds = [seed + round_no * workers + worker for worker in range(workers)]
+            draw_counts = [
+                min(batch_size, max(max_draws - len(totals) - worker * batch_size, 0)) for worker in range(workers)
+            ]
+            if executor is None:
+                results = [simulate_payouts(index, draw_counts[0], seeds[0], rule)]
+            else:
+                results = list(executor.map(_simulate_in_worker, draw_counts, seeds, [rule] * workers))
+
+            for result in results:
+                if not result:
+                    break
+                totals.extend(total for total, _ in result)
+                worst_draws = heapq.nlargest(worst, worst_draws + result)
+                totals.sort()
+                converged = quantiles_converged(totals, tolerance)
+                if converged:
+                    break
+            round_no += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if index_path is not None:
+            os.remove(index_path)
+
+    return LiabilityReport(
+        draws=len(totals),
+        quantiles={name: quantile(totals, q) for name, q in QUANTILES.items()},
+        worst_draws=[(numbers, total) for total, numbers in worst_draws],
+        converged=converged,
+    )
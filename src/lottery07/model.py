@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 from pydantic import BaseModel, Field, conint, field_validator
 
@@ -8,6 +8,12 @@ from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER
 LottoNumber = conint(ge=LOTTO_MIN_NUMBER, le=LOTTO_MAX_NUMBER)
 
 
+def require_unique(numbers: Sequence[int]) -> None:
+    """번호 중복 여부 검사 (번호 목록 필드 검증기에서 공통으로 사용)"""
+    if len(set(numbers)) != len(numbers):
+        raise ValueError("번호는 서로 중복될 수 없습니다.")
+
+
 class LottoNumbers(BaseModel):
     """로또 번호 6개 묶음 도메인 모델"""
 
@@ -22,8 +28,7 @@ class LottoNumbers(BaseModel):
     @classmethod
     def validate_unique(cls, v: List[int]) -> List[int]:
         """번호 중복 여부 검사"""
-        if len(set(v)) != len(v):
-            raise ValueError("번호는 서로 중복될 수 없습니다.")
+        require_unique(v)
         return v
 
 
@@ -0,0 +1,83 @@
+"""
+등수별 정확한 당첨 확률과 기대값
+
+C(45, 6) 전체 조합 중 각 등수에 해당하는 조합 수를 초기하분포로 셉니다.
+보너스 번호는 당첨 번호 6개를 뺀 나머지에서 1개 추첨된다고 봅니다.
+
+    정확히 m개 일치:            C(6, m) * C(N - 6, 6 - m)
+    m개 일치 + 보너스 포함:     C(6, m) * C(N - 7, 5 - m)
+    m개 일치 + 보너스 미포함:   C(6, m) * C(N - 7, 6 - m)
+
+규칙 묶음(RuleSet)별 결과는 한 번만 계산하고 캐시합니다.
+"""
+
+from fractions import Fraction
+from functools import cache
+from math import comb
+from types import MappingProxyType
+from typing import Mapping
+
+from pydantic import BaseModel, ConfigDict
+
+from src.lottery07.const import (
+    LOTTO_MAX_NUMBER,
+    LOTTO_MIN_NUMBER,
+    LOTTO_NUMBER_COUNT,
+    RANK_BY_MATCH_COUNT,
+    RANK_FAIL,
+)
+
+
+class RankRule(BaseModel):
+    """등수 조건 (bonus가 None이면 보너스 번호는 따지지 않음)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    rank: str
+    match_count: int
+    bonus: bool | None = None
+
+
+class RuleSet(BaseModel):
+    """번호 범위, 고르는 개수, 등수 조건 묶음"""
+
+    model_config = ConfigDict(frozen=True)
+
+    number_count: int = LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER + 1
+    pick_count: int = LOTTO_NUMBER_COUNT
+    ranks: tuple[RankRule, ...] = tuple(
+        RankRule(rank=rank, match_count=match_count) for match_count, rank in RANK_BY_MATCH_COUNT.items()
+    )
+
+
+DEFAULT_RULE_SET = RuleSet()
+
+
+def _combinations_for(rule_set: RuleSet, rank_rule: RankRule) -> int:
+    n, k, m = rule_set.number_count, rule_set.pick_count, rank_rule.match_count
+    matched = comb(k, m)
+    if rank_rule.bonus is None:
+        return matched * comb(n - k, k - m)
+    if rank_rule.bonus:
+        return matched * comb(n - k - 1, k - m - 1) if k - m >= 1 else 0
+    return matched * comb(n - k - 1, k - m)
+
+
+@cache
+def rank_combination_counts(rule_set: RuleSet = DEFAULT_RULE_SET) -> Mapping[str, int]:
+    """등수별 해당 조합 수 (낙첨 포함, 합계 = C(N, k))"""
+    counts = {rank_rule.rank: _combinations_for(rule_set, rank_rule) for rank_rule in rule_set.ranks}
+    counts[RANK_FAIL] = comb(rule_set.number_count, rule_set.pick_count) - sum(counts.values())
+    return MappingProxyType(counts)
+
+
+@cache
+def rank_probabilities(rule_set: RuleSet = DEFAULT_RULE_SET) -> Mapping[str, Fraction]:
+    total = comb(rule_set.number_count, rule_set.pick_count)
+    return MappingProxyType({rank: Fraction(count, total) for rank, count in rank_combination_counts(rule_set).items()})
+
+
+def expected_value(payouts: Mapping[str, int], rule_set: RuleSet = DEFAULT_RULE_SET) -> Fraction:
+    """티켓 한 장의 기대 당첨금"""
+    probabilities = rank_probabilities(rule_set)
+    return sum((probabilities[rank] * payout for rank, payout in payouts.items()), Fraction(0))
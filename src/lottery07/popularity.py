@@ -0,0 +1,209 @@
+"""
+번호/조합 인기도 실시간 집계
+
+- 번호(45개), 쌍(990개), 세 개 묶음(14,190개)은 정확한 카운터
+- 6개 전체 조합은 경우의 수가 많아 근사 구조 사용
+    - Space-Saving: 가장 많이 팔린 조합 상위 k개
+    - Count-Min Sketch: 임의 조합의 판매 수 (과대 추정만 발생)
+    - HyperLogLog: 판매된 서로 다른 조합 수
+
+판매 경로(수집 서버 등)는 정렬된 번호 6바이트 레코드 열을 update_packed()로 한꺼번에 반영하고,
+update()는 번호 목록을 티켓마다 반영하는 대체 경로입니다.
+모든 구조는 같은 설정끼리 merge()로 단말기별 결과를 합칠 수 있습니다.
+"""
+
+import math
+from array import array
+from collections import Counter
+from typing import Iterable
+
+from src.lottery07.combination import combination_count, combination_rank, packed_subset_ranks, subset_ranks
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+from src.lottery07.ticket import require_packed_tickets, require_ticket_numbers
+
+_MASK_64 = (1 << 64) - 1
+
+
+def mix64(value: int) -> int:
+    """splitmix64 해시 (조합 순위 -> 64비트 균등 분포)"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+class SpaceSaving:
+    """상위 k개 빈도 항목 (Space-Saving 알고리즘)"""
+
+    def __init__(self, capacity: int = 100) -> None:
+        self.capacity = capacity
+        self.counts: dict[int, int] = {}
+        self.errors: dict[int, int] = {}
+
+    def add(self, key: int, count: int = 1) -> None:
+        if key in self.counts:
+            self.counts[key] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = count
+            self.errors[key] = 0
+        else:
+            evicted = min(self.counts, key=self.counts.__getitem__)
+            floor = self.counts.pop(evicted)
+            del self.errors[evicted]
+            self.counts[key] = floor + count
+            self.errors[key] = floor
+
+    def _floor(self) -> int:
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def merge(self, other: "SpaceSaving") -> None:
+        floor, other_floor = self._floor(), other._floor()
+        merged = {
+            key: (self.counts.get(key, floor), other.counts.get(key, other_floor))
+            for key in self.counts.keys() | other.counts.keys()
+        }
+        top = sorted(merged, key=lambda key: sum(merged[key]), reverse=True)[: self.capacity]
+        self.counts = {key: sum(merged[key]) for key in top}
+        self.errors = {key: self.errors.get(key, floor) + other.errors.get(key, other_floor) for key in top}
+
+    def top(self, k: int | None = None) -> list[tuple[int, int]]:
+        """(키, 추정 빈도) 상위 k개"""
+        return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:k]
+
+
+class CountMinSketch:
+    """Count-Min Sketch (추정값 >= 실제값)"""
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4) -> None:
+        self.width = width
+        self.depth = depth
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def _columns(self, key: int) -> list[int]:
+        return [mix64(key ^ (row << 56)) % self.width for row in range(self.depth)]
+
+    def add(self, key: int, count: int = 1) -> None:
+        for row, column in zip(self.rows, self._columns(key)):
+            row[column] += count
+
+    def estimate(self, key: int) -> int:
+        return min(row[column] for row, column in zip(self.rows, self._columns(key)))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("같은 크기의 Count-Min Sketch만 합칠 수 있습니다.")
+        for row, other_row in zip(self.rows, other.rows):
+            for column, count in enumerate(other_row):
+                if count:
+                    row[column] += count
+
+
+class HyperLogLog:
+    """서로 다른 항목 수 추정 (HyperLogLog, 표준 오차 약 1.04 / sqrt(2^precision))"""
+
+    def __init__(self, precision: int = 14) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, key: int) -> None:
+        hashed = mix64(key)
+        register = hashed >> (64 - self.precision)
+        rest_bits = 64 - self.precision
+        rest = hashed & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self.registers[register]:
+            self.registers[register] = rank
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0**-value for value in self.registers)
+        empty = self.registers.count(0)
+        if estimate <= 2.5 * size and empty:
+            estimate = size * math.log(size / empty)
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if self.precision != other.precision:
+            raise ValueError("같은 precision의 HyperLogLog만 합칠 수 있습니다.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class PopularityTracker:
+    """판매 티켓의 번호/쌍/세 개 묶음/조합 인기도"""
+
+    def __init__(self, top_capacity: int = 100, sketch_width: int = 1 << 16, hll_precision: int = 14) -> None:
+        self.ticket_count = 0
+        self.number_counts = array("Q", bytes(8 * (LOTTO_MAX_NUMBER + 1)))
+        self.pair_counts = array("Q", bytes(8 * combination_count(2)))
+        self.triple_counts = array("Q", bytes(8 * combination_count(3)))
+        self.top_combinations = SpaceSaving(top_capacity)
+        self.combination_sketch = CountMinSketch(sketch_width)
+        self.distinct_combinations = HyperLogLog(hll_precision)
+
+    def update(self, tickets: Iterable[Iterable[int]]) -> None:
+        """
+        티켓 묶음 하나를 티켓마다 반영합니다 (번호 목록용 대체 경로, 대량이면 update_packed()).
+
+        잘못된 티켓이 하나라도 있으면 아무것도 반영하지 않고 ValueError입니다.
+        """
+        tickets = [sorted(numbers) for numbers in tickets]
+        for numbers in tickets:
+            require_ticket_numbers(numbers)
+        batch_combinations: dict[int, int] = {}
+        for numbers in tickets:
+            for number in numbers:
+                self.number_counts[number] += 1
+            for rank in subset_ranks(numbers, 2):
+                self.pair_counts[rank] += 1
+            for rank in subset_ranks(numbers, 3):
+                self.triple_counts[rank] += 1
+            rank = combination_rank(numbers)
+            batch_combinations[rank] = batch_combinations.get(rank, 0) + 1
+            self.ticket_count += 1
+
+        self._add_combinations(batch_combinations)
+
+    def update_packed(self, numbers: bytes) -> None:
+        """
+        티켓마다 정렬된 번호 6바이트를 이어 붙인 열을 한꺼번에 반영합니다 (update()와 같은 결과).
+
+        번호는 bytes.count()로, 쌍/세 개 묶음/조합은 자리 조합마다 열 단위로 계산한 순위를 Counter로 모아 더합니다.
+        레코드가 하나라도 범위 밖이거나 정렬된 서로 다른 번호가 아니면 아무것도 반영하지 않고 ValueError입니다.
+        """
+        require_packed_tickets(numbers)
+        for number in range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1):
+            self.number_counts[number] += numbers.count(number)
+        for size, counts in ((2, self.pair_counts), (3, self.triple_counts)):
+            for ranks in packed_subset_ranks(numbers, size):
+                for rank, count in Counter(ranks).items():
+                    counts[rank] += count
+        (ranks,) = packed_subset_ranks(numbers, LOTTO_NUMBER_COUNT)
+        self._add_combinations(Counter(ranks))
+        self.ticket_count += len(numbers) // LOTTO_NUMBER_COUNT
+
+    def _add_combinations(self, batch_combinations: dict[int, int]) -> None:
+        # 배치 안에서 같은 조합은 한 번에 반영
+        for rank, count in batch_combinations.items():
+            self.top_combinations.add(rank, count)
+            self.combination_sketch.add(rank, count)
+            self.distinct_combinations.add(rank)
+
+    def pair_count(self, first: int, second: int) -> int:
+        return self.pair_counts[combination_rank((first, second))]
+
+    def triple_count(self, first: int, second: int, third: int) -> int:
+        return self.triple_counts[combination_rank((first, second, third))]
+
+    def merge(self, other: "PopularityTracker") -> None:
+        self.ticket_count += other.ticket_count
+        for counts, other_counts in (
+            (self.number_counts, other.number_counts),
+            (self.pair_counts, other.pair_counts),
+            (self.triple_counts, other.triple_counts),
+        ):
+            for index, count in enumerate(other_counts):
+                counts[index] += count
+        self.top_combinations.merge(other.top_combinations)
+        self.combination_sketch.merge(other.combination_sketch)
+        self.distinct_combinations.merge(other.distinct_combinations)
@@ -0,0 +1,84 @@
+"""
+당첨금(패리뮤추얼) 계산
+
+src/examples/08.comment.py의 calculate_winning_amount 규칙을 일반화합니다.
+- 판매액, 등수별 배분 비율, 고정 당첨금, 등수별 당첨자 수를 받아 모든 등수를 한 번에 계산
+- float 대신 정수 연산으로 정확하게 계산 (천원 단위 버림)
+- 여러 시나리오(판매액/당첨자 수 조합)를 열 단위로 한 번에 계산
+"""
+
+from decimal import Decimal
+from typing import Mapping, Sequence
+
+from pydantic import BaseModel
+
+from src.lottery07.const import FIXED_PRIZE_BY_RANK, PRIZE_POOL_SHARE_BY_RANK, PRIZE_ROUNDING_UNIT
+
+
+class PrizeRule(BaseModel):
+    """등수별 당첨금 규칙"""
+
+    pool_shares: dict[str, Decimal] = PRIZE_POOL_SHARE_BY_RANK
+    fixed_prizes: dict[str, int] = FIXED_PRIZE_BY_RANK
+    rounding_unit: int = PRIZE_ROUNDING_UNIT
+
+
+DEFAULT_PRIZE_RULE = PrizeRule()
+
+
+def pool_amount(total_sales: int, share: Decimal) -> int:
+    """판매액 중 등수에 배분되는 금액 (원 단위 버림)"""
+    numerator, denominator = share.as_integer_ratio()
+    return total_sales * numerator // denominator
+
+
+def calculate_payouts_many(
+    total_sales: Sequence[int],
+    winner_counts: Mapping[str, Sequence[int]],
+    rule: PrizeRule = DEFAULT_PRIZE_RULE,
+    carryovers: Mapping[str, Sequence[int]] | None = None,
+) -> dict[str, list[int]]:
+    """
+    시나리오 여러 개의 등수별 1인당 당첨금을 계산합니다.
+
+    total_sales[i]와 winner_counts[rank][i]가 시나리오 i입니다.
+    carryovers[rank][i]는 이전 회차에서 이월된 금액으로, 해당 등수 배분액에 더해집니다.
+    당첨자가 없는 배분 등수의 당첨금은 0입니다.
+    """
+    unit = rule.rounding_unit
+    zeros = [0] * len(total_sales)
+    carryovers = carryovers or {}
+    payouts: dict[str, list[int]] = {}
+
+    for rank, share in rule.pool_shares.items():
+        numerator, denominator = share.as_integer_ratio()
+        payouts[rank] = [
+            (sales * numerator // denominator + carried) // (winners * unit) * unit if winners else 0
+            for sales, winners, carried in zip(total_sales, winner_counts.get(rank, zeros), carryovers.get(rank, zeros))
+        ]
+
+    for rank, prize in rule.fixed_prizes.items():
+        payouts[rank] = [prize] * len(total_sales)
+
+    return payouts
+
+
+def calculate_payouts(
+    total_sales: int,
+    winner_counts: Mapping[str, int],
+    rule: PrizeRule = DEFAULT_PRIZE_RULE,
+    carryovers: Mapping[str, int] | None = None,
+) -> dict[str, int]:
+    """등수별 1인당 당첨금"""
+    columns = calculate_payouts_many(
+        [total_sales],
+        {rank: [count] for rank, count in winner_counts.items()},
+        rule,
+        {rank: [amount] for rank, amount in (carryovers or {}).items()},
+    )
+    return {rank: column[0] for rank, column in columns.items()}
+
+
+def total_payout(payouts: Mapping[str, int], winner_counts: Mapping[str, int]) -> int:
+    """전체 지급액 = sum(1인당 당첨금 x 당첨자 수)"""
+    return sum(payout * winner_counts.get(rank, 0) for rank, payout in payouts.items())
@@ -0,0 +1,33 @@
+import random
+from typing import Sequence
+
+# ===== 가중치 샘플링 (Walker/Vose alias method) =====
+# 만들 때 O(n), 뽑을 때마다 O(1) (난수 1개 + 비교 1번)
+
+
+class AliasTable:
+    """인덱스 0 ~ n-1 을 weights 비율로 뽑는 alias 테이블"""
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        size = len(weights)
+        total = sum(weights)
+        if size == 0 or total <= 0:
+            raise ValueError("가중치는 하나 이상이고 합이 0보다 커야 합니다.")
+
+        scaled = [weight * size / total for weight in weights]
+        self.probabilities = [1.0] * size
+        self.aliases = list(range(size))
+
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self.probabilities[low] = scaled[low]
+            self.aliases[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        position = (rng or random).random() * len(self.probabilities)
+        index = int(position)
+        return index if position - index < self.probabilities[index] else self.aliases[index]
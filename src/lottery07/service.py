@@ -0,0 +1,275 @@
+"""
+단말기용 HTTP 서비스 (asyncio, 표준 라이브러리만 사용)
+
+엔드포인트
+- GET  /health                         -> {"status": "ok", "pool": 남은 자동 번호 수}
+- GET  /quickpick                      -> {"numbers": [...]}
+- GET  /quickpick?count=N              -> {"tickets": [[...], ...]}
+- GET  /check?numbers=1,2,...&draw=... -> {"match_count": 3, "rank": "4th"} (draw 생략 시 서버의 현재 추첨)
+- POST /check  {"draw": [...], "tickets": [[...], ...]} -> {"results": [{"match_count": .., "rank": ..}, ...]}
+
+HTTP/1.1 keep-alive와 파이프라이닝을 지원합니다. 한 번에 받은 데이터 안의 요청을 모두 처리하고
+응답을 모아 transport.write() 한 번으로 보냅니다.
+자동 번호는 미리 JSON으로 인코딩해 둔 풀에서 꺼내고, 풀이 절반 아래로 줄면 기본 스레드 풀에서 다시 채웁니다
+(번호 생성이 이벤트 루프를 막지 않도록).
+추첨 번호 문자열과 티켓 번호 문자열은 캐시를 따로 써서, 티켓 요청이 많아도 추첨 번호 캐시가 밀려나지 않습니다.
+"""
+
+import argparse
+import asyncio
+import json
+from collections import deque
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Callable
+from urllib.parse import parse_qsl, urlsplit
+
+from src.lottery07.game import count_match_many, get_rank, get_rank_many, rank_name
+from src.lottery07.generator import AutoLottoGenerator, LottoGenerator
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import mask_to_numbers, parse_ticket_line, to_mask
+
+DEFAULT_POOL_SIZE = 10_000
+MAX_QUICKPICK_COUNT = 1_000
+MAX_CHECK_TICKETS = 10_000
+MAX_HEADER_SIZE = 8 * 1024
+MAX_BODY_SIZE = 1 << 20
+
+
+class HttpError(Exception):
+    """클라이언트에 상태 코드와 메시지로 돌려줄 오류"""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class QuickPickPool:
+    """JSON 배열(b"[1,2,3,4,5,6]")로 미리 인코딩한 자동 번호 풀"""
+
+    def __init__(self, generator: LottoGenerator | None = None, size: int = DEFAULT_POOL_SIZE) -> None:
+        self.generator = generator or AutoLottoGenerator()
+        self.size = size
+        self.tickets: deque[bytes] = deque()
+        self._refilling: asyncio.Future | None = None
+        self.refill()
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+    def refill(self, minimum: int = 0) -> None:
+        """풀을 size(와 minimum 중 큰 값)까지 채웁니다."""
+        for _ in range(max(self.size, minimum) - len(self.tickets)):
+            numbers = sorted(self.generator.generate().numbers)
+            self.tickets.append(f"[{','.join(map(str, numbers))}]".encode("ascii"))
+
+    def take(self, count: int) -> list[bytes]:
+        if len(self.tickets) < count:
+            self.refill(count)
+        return [self.tickets.popleft() for _ in range(count)]
+
+    @property
+    def needs_refill(self) -> bool:
+        return len(self.tickets) < self.size // 2
+
+    def refill_in_background(self) -> None:
+        """실행 중인 이벤트 루프의 기본 스레드 풀에서 풀을 채웁니다 (이미 채우는 중이면 무시)."""
+        if self._refilling is None or self._refilling.done():
+            self._refilling = asyncio.get_running_loop().run_in_executor(None, self.refill)
+
+
+@lru_cache(maxsize=16)
+def _draw_numbers_mask(raw: str) -> int:
+    return parse_ticket_line(raw)
+
+
+@lru_cache(maxsize=1024)
+def _ticket_numbers_mask(raw: str) -> int:
+    return parse_ticket_line(raw)
+
+
+def _json(payload: object) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+class LottoService:
+    """요청 (메서드, 경로, 쿼리, 본문) -> (상태 코드, JSON 본문)"""
+
+    def __init__(self, pool: QuickPickPool | None = None, draw: LottoNumbers | None = None) -> None:
+        self.pool = pool or QuickPickPool()
+        self.draw_mask = to_mask(draw.numbers) if draw is not None else None
+        self.routes: dict[tuple[str, str], Callable[[dict[str, str], bytes], bytes]] = {
+            ("GET", "/health"): self.health,
+            ("GET", "/quickpick"): self.quickpick,
+            ("GET", "/check"): self.check,
+            ("POST", "/check"): self.check_batch,
+        }
+
+    def handle(self, method: str, target: str, body: bytes) -> tuple[HTTPStatus, bytes]:
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if handler is None:
+            allowed = any(path == url.path for _, path in self.routes)
+            status = HTTPStatus.METHOD_NOT_ALLOWED if allowed else HTTPStatus.NOT_FOUND
+            return status, _json({"error": status.phrase})
+        try:
+            return HTTPStatus.OK, handler(dict(parse_qsl(url.query)), body)
+        except HttpError as error:
+            return error.status, _json({"error": str(error)})
+        except ValueError as error:
+            return HTTPStatus.BAD_REQUEST, _json({"error": str(error)})
+
+    def health(self, query: dict[str, str], body: bytes) -> bytes:
+        return b'{"status":"ok","pool":%d}' % len(self.pool)
+
+    def quickpick(self, query: dict[str, str], body: bytes) -> bytes:
+        if "count" not in query:
+            return b'{"numbers":' + self.pool.take(1)[0] + b"}"
+        count = int(query["count"])
+        if not 1 <= count <= MAX_QUICKPICK_COUNT:
+            raise ValueError(f"count는 1~{MAX_QUICKPICK_COUNT} 범위만 허용됩니다.")
+        return b'{"tickets":[' + b",".join(self.pool.take(count)) + b"]}"
+
+    def _draw_mask(self, raw: str | None) -> int:
+        if raw is not None:
+            return _draw_numbers_mask(raw)
+        if self.draw_mask is None:
+            raise ValueError("draw가 필요합니다 (서버에 현재 추첨이 설정되지 않음).")
+        return self.draw_mask
+
+    def check(self, query: dict[str, str], body: bytes) -> bytes:
+        if "numbers" not in query:
+            raise ValueError("numbers가 필요합니다.")
+        match_count = (_ticket_numbers_mask(query["numbers"]) & self._draw_mask(query.get("draw"))).bit_count()
+        return b'{"match_count":%d,"rank":"%s"}' % (match_count, get_rank(match_count).encode("ascii"))
+
+    def check_batch(self, query: dict[str, str], body: bytes) -> bytes:
+        try:
+            request = json.loads(body)
+            draw = request.get("draw")
+            tickets = request["tickets"]
+        except (ValueError, KeyError, AttributeError, TypeError):
+            raise ValueError('본문은 {"draw": [...], "tickets": [[...], ...]} 형식이어야 합니다.') from None
+        if not isinstance(tickets, list) or len(tickets) > MAX_CHECK_TICKETS:
+            raise ValueError(f"tickets는 최대 {MAX_CHECK_TICKETS}장까지 허용됩니다.")
+
+        lotto = (
+            LottoNumbers(numbers=mask_to_numbers(self._draw_mask(None))) if draw is None else LottoNumbers(numbers=draw)
+        )
+        masks = [to_mask(LottoNumbers(numbers=numbers).numbers) for numbers in tickets]
+        match_counts = count_match_many(masks, lotto)
+        results = [
+            {"match_count": match_count, "rank": rank_name(code)}
+            for match_count, code in zip(match_counts, get_rank_many(match_counts))
+        ]
+        return _json({"results": results})
+
+
+class HttpProtocol(asyncio.Protocol):
+    """HTTP/1.1 연결 하나 (keep-alive, 파이프라이닝)"""
+
+    def __init__(self, service: LottoService) -> None:
+        self.service = service
+        self.buffer = bytearray()
+        self.transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        responses: list[bytes] = []
+        keep_alive = True
+        while keep_alive:
+            try:
+                request = self._next_request()
+            except HttpError as error:
+                responses.append(_response(error.status, _json({"error": str(error)}), keep_alive=False))
+                keep_alive = False
+                break
+            if request is None:
+                break
+            method, target, body, keep_alive = request
+            status, payload = self.service.handle(method, target, body)
+            responses.append(_response(status, payload, keep_alive))
+
+        if responses:
+            self.transport.write(b"".join(responses))
+        if not keep_alive:
+            self.transport.close()
+        elif self.service.pool.needs_refill:
+            self.service.pool.refill_in_background()
+
+    def _next_request(self) -> tuple[str, str, bytes, bool] | None:
+        """버퍼에서 완성된 요청 하나를 꺼냅니다 (아직 덜 왔으면 None)."""
+        header_end = self.buffer.find(b"\r\n\r\n")
+        if header_end < 0:
+            if len(self.buffer) > MAX_HEADER_SIZE:
+                raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "헤더가 너무 큽니다.")
+            return None
+
+        try:
+            request_line, *header_lines = bytes(self.buffer[:header_end]).decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "잘못된 요청 줄입니다.") from None
+
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED, "Content-Length가 필요합니다.")
+
+        try:
+            body_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "잘못된 Content-Length입니다.") from None
+        if not 0 <= body_length <= MAX_BODY_SIZE:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "본문이 너무 큽니다.")
+        body_start = header_end + 4
+        if len(self.buffer) < body_start + body_length:
+            return None
+
+        body = bytes(self.buffer[body_start : body_start + body_length])
+        del self.buffer[: body_start + body_length]
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+        return method, target, body, keep_alive
+
+
+def _response(status: HTTPStatus, body: bytes, keep_alive: bool) -> bytes:
+    connection = b"" if keep_alive else b"Connection: close\r\n"
+    return (
+        b"HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n%s\r\n"
+        % (status.value, status.phrase.encode("ascii"), len(body), connection)
+    ) + body
+
+
+async def start_server(service: LottoService, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(lambda: HttpProtocol(service), host, port)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="자동 번호 / 당첨 확인 HTTP 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--draw", help='현재 추첨 번호 (예: "1,2,3,4,5,6")')
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    args = parser.parse_args(argv)
+
+    draw = LottoNumbers(numbers=[int(part) for part in args.draw.split(",")]) if args.draw else None
+    service = LottoService(QuickPickPool(size=args.pool_size), draw)
+
+    async def run() -> None:
+        server = await start_server(service, args.host, args.port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+대량 정산 (스트리밍 파이프라인)
+
+티켓 파일을 청크 단위로 읽어 다음 단계를 제너레이터로 연결합니다.
+읽기 -> 검증 -> 정산(일치 개수, 등수, 등수별 집계) -> 당첨 기록
+
+청크 하나의 정산(settle_chunk)은 일괄 게임, 샤드 정산, 열 기반 아카이브도 함께 씁니다.
+
+한 번에 한 청크만 메모리에 있으므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+시스템(복식) 티켓은 하위 티켓을 펼치지 않고 닫힌 식 히스토그램(system_rank_histogram)으로 집계에 더합니다.
+명령행에서는 통합 CLI의 settle 하위 명령(python main.py settle)으로 실행합니다.
+"""
+
+import time
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+
+from pydantic import BaseModel
+
+from src.lottery07.const import RANK_BY_MATCH_COUNT, RANK_NAMES
+from src.lottery07.game import count_match_many, count_ranks, get_rank_many
+from src.lottery07.model import LottoNumbers
+from src.lottery07.system_ticket import SystemTicket, system_rank_histogram
+from src.lottery07.ticket import TicketBatch, mask_to_numbers, parse_ticket_buffer, to_mask
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+WINNER_HEADER = "ticket_id,numbers,match_count,rank\n"
+
+
+class StageStats(BaseModel):
+    """파이프라인 단계별 처리량"""
+
+    name: str
+    items: int = 0
+    seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+class SettlementReport(BaseModel):
+    """정산 결과 요약 (ticket_count와 rank_counts는 시스템 티켓의 하위 티켓을 포함)"""
+
+    lotto_numbers: LottoNumbers
+    ticket_count: int
+    rejected_count: int
+    rank_counts: dict[str, int]
+    system_entry_count: int = 0
+    stages: list[StageStats] = []
+
+
+# ===== 파이프라인 단계 =====
+# 티켓 id는 파일의 줄 번호(1부터)입니다. 빈 줄은 티켓이 아니지만 번호는 차지합니다.
+
+
+def read_ticket_chunks(lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[int, list[str]]]:
+    """(첫 티켓 id, 줄 목록) 청크를 생성합니다."""
+    iterator = iter(lines)
+    first_id = 1
+    while chunk := list(islice(iterator, chunk_size)):
+        yield first_id, chunk
+        first_id += len(chunk)
+
+
+def parse_ticket_chunk(first_id: int, lines: list[str]) -> tuple[TicketBatch, int]:
+    """줄 목록을 TicketBatch로 변환하고 (배치, 거부된 줄 수)를 반환합니다."""
+    data = "".join(line if line.endswith("\n") else line + "\n" for line in lines)
+    batch, errors = parse_ticket_buffer(data.encode("utf-8", errors="replace"), first_id)
+    return batch, len(errors)
+
+
+def _timed_read(chunks: Iterable[tuple[int, list[str]]], stats: StageStats) -> Iterator[tuple[int, list[str]]]:
+    iterator = iter(chunks)
+    while True:
+        started = time.perf_counter()
+        chunk = next(iterator, None)
+        stats.seconds += time.perf_counter() - started
+        if chunk is None:
+            return
+        stats.items += len(chunk[1])
+        yield chunk
+
+
+def _parse_stage(chunks: Iterable[tuple[int, list[str]]], stats: StageStats) -> Iterator[tuple[TicketBatch, int]]:
+    for first_id, lines in chunks:
+        started = time.perf_counter()
+        parsed = parse_ticket_chunk(first_id, lines)
+        stats.seconds += time.perf_counter() - started
+        stats.items += len(lines)
+        yield parsed
+
+
+def settle_chunk(masks: Iterable[int], lotto: LottoNumbers, histogram: list[int]) -> tuple[bytes, bytes]:
+    """
+    티켓 마스크 청크 하나를 정산해 등수 코드별 티켓 수를 histogram에 더합니다.
+
+    (일치 개수, 등수 코드) uint8 열을 반환합니다.
+    """
+    match_counts = count_match_many(masks, lotto)
+    rank_codes = get_rank_many(match_counts)
+    for code, count in enumerate(count_ranks(rank_codes)):
+        histogram[code] += count
+    return match_counts, rank_codes
+
+
+def _settle_stage(
+    parsed: Iterable[tuple[TicketBatch, int]], lotto: LottoNumbers, histogram: list[int], stats: StageStats
+) -> Iterator[tuple[TicketBatch, int, bytes, bytes]]:
+    for batch, rejected in parsed:
+        started = time.perf_counter()
+        match_counts, rank_codes = settle_chunk(batch.masks, lotto, histogram)
+        stats.seconds += time.perf_counter() - started
+        stats.items += len(batch)
+        yield batch, rejected, match_counts, rank_codes
+
+
+def format_winner(ticket_id: int, mask: int, match_count: int, rank_code: int) -> str:
+    numbers = " ".join(str(number) for number in mask_to_numbers(mask))
+    return f"{ticket_id},{numbers},{match_count},{RANK_NAMES[rank_code]}\n"
+
+
+def settle_stream(
+    lines: Iterable[str],
+    lotto: LottoNumbers,
+    winner_out: TextIO | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    system_entries: Iterable[SystemTicket] = (),
+) -> SettlementReport:
+    """
+    티켓 줄 스트림을 정산합니다.
+
+    당첨 티켓은 winner_out에 CSV로 기록하고, 등수별 집계와 단계별 처리량을 반환합니다.
+    system_entries의 하위 티켓은 등수별 집계에만 더하며 당첨 기록에는 쓰지 않습니다.
+    """
+    stages = [StageStats(name=name) for name in ("read", "validate", "settle", "aggregate")]
+    read_stats, parse_stats, settle_stats, aggregate_stats = stages
+
+    rank_histogram = [0] * len(RANK_NAMES)
+    chunks = _timed_read(read_ticket_chunks(lines, chunk_size), read_stats)
+    settled = _settle_stage(_parse_stage(chunks, parse_stats), lotto, rank_histogram, settle_stats)
+
+    ticket_count = 0
+    rejected_count = 0
+    if winner_out is not None:
+        winner_out.write(WINNER_HEADER)
+
+    for batch, rejected, match_counts, rank_codes in settled:
+        started = time.perf_counter()
+        ticket_count += len(batch)
+        rejected_count += rejected
+        if winner_out is not None:
+            winner_out.write(
+                "".join(
+                    format_winner(batch.ids[index], batch.masks[index], match_counts[index], code)
+                    for index, code in enumerate(rank_codes)
+                    if code
+                )
+            )
+        aggregate_stats.seconds += time.perf_counter() - started
+        aggregate_stats.items += len(batch)
+
+    started = time.perf_counter()
+    system_masks = [to_mask(entry.numbers) for entry in system_entries]
+    system_histogram = system_rank_histogram(system_masks, lotto)
+    for code, count in enumerate(system_histogram):
+        rank_histogram[code] += count
+    ticket_count += sum(system_histogram)
+    aggregate_stats.seconds += time.perf_counter() - started
+
+    return SettlementReport(
+        lotto_numbers=lotto,
+        ticket_count=ticket_count,
+        rejected_count=rejected_count,
+        rank_counts=dict(zip(RANK_NAMES, rank_histogram)),
+        system_entry_count=len(system_masks),
+        stages=stages,
+    )
+
+
+def format_report(report: SettlementReport) -> str:
+    lines = [
+        f"draw:     {report.lotto_numbers.numbers}",
+        f"tickets:  {report.ticket_count}",
+        f"rejected: {report.rejected_count}",
+    ]
+    if report.system_entry_count:
+        lines.append(f"system:   {report.system_entry_count}")
+    lines += [f"{rank}: {report.rank_counts[rank]}" for rank in RANK_BY_MATCH_COUNT.values()]
+    lines += [f"[{stage.name}] {stage.items} items, {stage.items_per_second:,.0f}/s" for stage in report.stages]
+    return "\n".join(lines)
+
+
+def parse_draw(raw: str) -> LottoNumbers:
+    return LottoNumbers(numbers=[int(part) for part in raw.split(",")])
+
@@ -0,0 +1,166 @@
+"""
+샤드 단위 병렬 정산 (map-reduce)
+
+티켓 파일을 줄 경계에 맞춘 바이트 구간(샤드)으로 나누고,
+각 워커 프로세스가 같은 추첨 번호로 샤드 하나를 정산합니다.
+워커는 등수 히스토그램과 당첨 티켓 목록만 돌려주고, 부모가 순서대로 합칩니다.
+결과(집계와 당첨 CSV)는 settle_stream()과 동일합니다.
+"""
+
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, TextIO
+
+from src.lottery07.const import RANK_NAMES
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import (
+    DEFAULT_CHUNK_SIZE,
+    WINNER_HEADER,
+    SettlementReport,
+    StageStats,
+    format_winner,
+    parse_ticket_chunk,
+    read_ticket_chunks,
+    settle_chunk,
+)
+
+READ_BLOCK_SIZE = 1 << 20
+
+
+class SettlementPartial:
+    """샤드 하나의 정산 결과 (티켓 id는 샤드 안에서의 줄 번호)"""
+
+    def __init__(self) -> None:
+        self.line_count = 0
+        self.ticket_count = 0
+        self.rejected_count = 0
+        self.rank_histogram = [0] * len(RANK_NAMES)
+        self.winner_ids = array("Q")
+        self.winner_masks = array("Q")
+        self.winner_match_counts = bytearray()
+        self.winner_rank_codes = bytearray()
+
+
+def split_shards(path: str, shard_count: int) -> list[tuple[int, int]]:
+    """파일을 줄 경계에 맞춘 (시작, 끝) 바이트 구간 shard_count개 이하로 나눕니다."""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as file:
+        for index in range(1, shard_count):
+            file.seek(max(size * index // shard_count, boundaries[-1]))
+            if file.tell() > 0:
+                file.seek(file.tell() - 1)
+                file.readline()
+            boundaries.append(file.tell())
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def read_lines(path: str, start: int, end: int) -> Iterator[str]:
+    """바이트 구간 [start, end)의 줄을 읽습니다 (줄 구분은 '\\n')."""
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start
+        carry = b""
+        while remaining > 0:
+            block = file.read(min(READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            lines = (carry + block).split(b"\n")
+            carry = lines.pop()
+            for line in lines:
+                yield line.decode("utf-8", errors="replace")
+        if carry:
+            yield carry.decode("utf-8", errors="replace")
+
+
+def settle_shard(
+    path: str, start: int, end: int, lotto: LottoNumbers, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> SettlementPartial:
+    partial = SettlementPartial()
+    for first_id, lines in read_ticket_chunks(read_lines(path, start, end), chunk_size):
+        batch, rejected = parse_ticket_chunk(first_id, lines)
+        match_counts, rank_codes = settle_chunk(batch.masks, lotto, partial.rank_histogram)
+
+        partial.line_count += len(lines)
+        partial.ticket_count += len(batch)
+        partial.rejected_count += rejected
+        for index, code in enumerate(rank_codes):
+            if code:
+                partial.winner_ids.append(batch.ids[index])
+                partial.winner_masks.append(batch.masks[index])
+                partial.winner_match_counts.append(match_counts[index])
+                partial.winner_rank_codes.append(code)
+    return partial
+
+
+def settle_sharded(
+    path: str,
+    lotto: LottoNumbers,
+    winner_out: TextIO | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SettlementReport:
+    """
+    티켓 파일을 워커 프로세스 여러 개로 나눠 정산합니다.
+
+    workers가 1이면 프로세스를 띄우지 않고 현재 프로세스에서 처리합니다.
+    """
+    workers = workers or os.cpu_count() or 1
+    settle_stats = StageStats(name="settle")
+    merge_stats = StageStats(name="merge")
+
+    started = time.perf_counter()
+    shards = split_shards(path, workers)
+    starts = [start for start, _ in shards]
+    ends = [end for _, end in shards]
+    count = len(shards)
+    if workers == 1 or count <= 1:
+        partials = list(map(settle_shard, [path] * count, starts, ends, [lotto] * count, [chunk_size] * count))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(
+                executor.map(settle_shard, [path] * count, starts, ends, [lotto] * count, [chunk_size] * count)
+            )
+    settle_stats.seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rank_histogram = [0] * len(RANK_NAMES)
+    ticket_count = 0
+    rejected_count = 0
+    line_offset = 0
+    if winner_out is not None:
+        winner_out.write(WINNER_HEADER)
+
+    for partial in partials:
+        ticket_count += partial.ticket_count
+        rejected_count += partial.rejected_count
+        for code, count in enumerate(partial.rank_histogram):
+            rank_histogram[code] += count
+        if winner_out is not None:
+            winner_out.write(
+                "".join(
+                    format_winner(line_offset + ticket_id, mask, match_count, code)
+                    for ticket_id, mask, match_count, code in zip(
+                        partial.winner_ids,
+                        partial.winner_masks,
+                        partial.winner_match_counts,
+                        partial.winner_rank_codes,
+                    )
+                )
+            )
+        line_offset += partial.line_count
+    merge_stats.seconds = time.perf_counter() - started
+
+    settle_stats.items = merge_stats.items = line_offset
+    return SettlementReport(
+        lotto_numbers=lotto,
+        ticket_count=ticket_count,
+        rejected_count=rejected_count,
+        rank_counts=dict(zip(RANK_NAMES, rank_histogram)),
+        stages=[settle_stats, merge_stats],
+    )
+
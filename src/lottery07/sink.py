@@ -0,0 +1,139 @@
+"""
+출력 싱크
+
+play_game() / read_user_numbers()의 print_func 자리에 넘길 수 있는 출력 대상입니다.
+print 같은 함수를 넘기면 CallableSink로 감싸 예전처럼 한 줄씩 호출합니다.
+
+- BufferedTextSink: 텍스트를 모아 두었다가 크기/시간 기준을 넘으면 한 번에 씀
+- RecordSink      : 문자열 대신 결과 모델(LottoResult)과 메시지를 그대로 보관
+- NullSink        : 모두 버림 (대량 실행, 벤치마크용)
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, TextIO
+
+from src.lottery07.model import LottoResult
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+def format_result_lines(result: LottoResult) -> list[str]:
+    return [
+        f"result: {result.lotto_numbers.numbers}",
+        f"mine:   {result.user_numbers.numbers}",
+        f"match:  {result.match_count}",
+        f"rank:   {result.rank}",
+    ]
+
+
+class OutputSink(ABC):
+    """
+    출력 싱크 기본 클래스 (write_line만 구현하면 됨)
+
+    as_sink()가 함수와 싱크를 isinstance로 구분하므로 Protocol이 아닌 추상 클래스입니다
+    (속성 검사로는 Mock 같은 함수 대역도 싱크로 보임).
+    """
+
+    @abstractmethod
+    def write_line(self, text: str) -> None: ...
+
+    def write_result(self, result: LottoResult) -> None:
+        for line in format_result_lines(result):
+            self.write_line(line)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CallableSink(OutputSink):
+    """print 같은 함수를 한 줄에 한 번씩 호출 (기존 print_func 호환)"""
+
+    def __init__(self, print_func: Callable[[str], object]) -> None:
+        self.print_func = print_func
+
+    def write_line(self, text: str) -> None:
+        self.print_func(text)
+
+
+class BufferedTextSink(OutputSink):
+    """
+    줄을 모아 두었다가 buffer_size 바이트 또는 flush_interval초를 넘으면 out에 한 번에 씁니다.
+
+    시간 기준은 다음 쓰기 때 확인하므로, 마지막 출력은 flush()/close()로 내보내야 합니다.
+    """
+
+    def __init__(
+        self,
+        out: TextIO,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.out = out
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._first_pending_at = 0.0
+
+    def write_line(self, text: str) -> None:
+        self._append(text + "\n")
+
+    def write_result(self, result: LottoResult) -> None:
+        self._append("\n".join(format_result_lines(result)) + "\n")
+
+    def _append(self, text: str) -> None:
+        if not self._pending:
+            self._first_pending_at = self.clock()
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= self.buffer_size or self.clock() - self._first_pending_at >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.out.write("".join(self._pending))
+            self._pending.clear()
+            self._pending_size = 0
+        self.out.flush()
+
+
+class RecordSink(OutputSink):
+    """결과 모델과 메시지를 문자열로 만들지 않고 보관"""
+
+    def __init__(self) -> None:
+        self.results: list[LottoResult] = []
+        self.messages: list[str] = []
+
+    def write_line(self, text: str) -> None:
+        self.messages.append(text)
+
+    def write_result(self, result: LottoResult) -> None:
+        self.results.append(result)
+
+
+class NullSink(OutputSink):
+    """아무것도 출력하지 않음"""
+
+    def write_line(self, text: str) -> None:
+        pass
+
+    def write_result(self, result: LottoResult) -> None:
+        pass
+
+
+def as_sink(output: OutputSink | Callable[[str], object]) -> OutputSink:
+    """싱크는 그대로, 함수는 CallableSink로 감쌉니다."""
+    return output if isinstance(output, OutputSink) else CallableSink(output)
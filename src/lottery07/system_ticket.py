@@ -0,0 +1,131 @@
+"""
+시스템(복식) 티켓 정산
+
+번호를 7~12개 고르면 그 안의 모든 6개 조합(최대 C(12, 6) = 924장)을 산 것과 같습니다.
+하위 티켓을 만들지 않고, 고른 번호 중 당첨 번호 개수 d(와 보너스 포함 여부 b)만으로
+일치 개수별 하위 티켓 수를 닫힌 식으로 계산합니다.
+
+    정확히 j개 일치:              C(d, j) * C(m - d, 6 - j)
+    j개 일치 + 보너스 포함:       C(d, j) * C(b, 1) * C(m - d - b, 5 - j)
+    j개 일치 + 보너스 미포함:     C(d, j) * C(m - d - b, 6 - j)
+"""
+
+from functools import cache
+from math import comb
+from typing import Iterable, List
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.lottery07.const import LOTTO_NUMBER_COUNT, RANK_CODE_BY_MATCH_COUNT, RANK_FAIL, RANK_NAMES
+from src.lottery07.model import LottoNumber, LottoNumbers, require_unique
+from src.lottery07.odds import DEFAULT_RULE_SET, RuleSet
+from src.lottery07.ticket import to_mask
+
+SYSTEM_MIN_NUMBER_COUNT = 7
+SYSTEM_MAX_NUMBER_COUNT = 12
+
+
+class SystemTicket(BaseModel):
+    """시스템 티켓 (번호 7~12개)"""
+
+    numbers: List[LottoNumber] = Field(
+        ...,
+        min_length=SYSTEM_MIN_NUMBER_COUNT,
+        max_length=SYSTEM_MAX_NUMBER_COUNT,
+        description="시스템 티켓 번호 7~12개",
+    )
+
+    @field_validator("numbers")
+    @classmethod
+    def validate_unique(cls, v: List[int]) -> List[int]:
+        """번호 중복 여부 검사"""
+        require_unique(v)
+        return v
+
+    @property
+    def ticket_count(self) -> int:
+        """포함된 6개 조합(하위 티켓) 수"""
+        return comb(len(self.numbers), LOTTO_NUMBER_COUNT)
+
+
+@cache
+def _match_counts(size: int, drawn: int, picks: int = LOTTO_NUMBER_COUNT) -> tuple[int, ...]:
+    """
+    번호 size개(당첨 번호 drawn개 포함)에서 picks개를 고르는 조합의 일치 개수별 수 (인덱스 = 일치 개수)
+
+    등수별 집계와 등수 코드 히스토그램이 모두 이 값을 씁니다.
+    """
+    return tuple(
+        comb(drawn, match_count) * comb(size - drawn, picks - match_count) if match_count <= picks else 0
+        for match_count in range(LOTTO_NUMBER_COUNT + 1)
+    )
+
+
+def system_rank_counts(
+    entry: SystemTicket,
+    lotto: LottoNumbers,
+    bonus: int | None = None,
+    rule_set: RuleSet = DEFAULT_RULE_SET,
+) -> dict[str, int]:
+    """
+    등수별 하위 티켓 수 (낙첨 포함)
+
+    보너스 조건이 있는 등수 규칙을 쓰려면 bonus 번호가 필요합니다 (당첨 번호와 겹치면 ValueError).
+    """
+    if bonus is not None and bonus in lotto.numbers:
+        raise ValueError(f"보너스 번호는 당첨 번호와 중복될 수 없습니다: {bonus}")
+    size = len(entry.numbers)
+    drawn = len(set(entry.numbers) & set(lotto.numbers))
+    has_bonus = int(bonus in entry.numbers) if bonus is not None else 0
+
+    counts: dict[str, int] = {}
+    for rank_rule in rule_set.ranks:
+        if rank_rule.bonus is None:
+            count = _match_counts(size, drawn)[rank_rule.match_count]
+        elif bonus is None:
+            raise ValueError(f"{rank_rule.rank} 등수 계산에는 보너스 번호가 필요합니다.")
+        elif rank_rule.bonus:
+            # 보너스 번호를 포함한 하위 티켓 = 보너스를 뺀 번호에서 나머지 5개를 고른 조합
+            count = _match_counts(size - 1, drawn, LOTTO_NUMBER_COUNT - 1)[rank_rule.match_count] if has_bonus else 0
+        else:
+            count = _match_counts(size - has_bonus, drawn)[rank_rule.match_count]
+        counts[rank_rule.rank] = counts.get(rank_rule.rank, 0) + count
+
+    counts[RANK_FAIL] = entry.ticket_count - sum(counts.values())
+    return counts
+
+
+def settle_system_entries(
+    entries: Iterable[SystemTicket],
+    lotto: LottoNumbers,
+    bonus: int | None = None,
+    rule_set: RuleSet = DEFAULT_RULE_SET,
+) -> dict[str, int]:
+    """시스템 티켓 여러 장의 등수별 하위 티켓 수 합계"""
+    totals: dict[str, int] = {}
+    for entry in entries:
+        for rank, count in system_rank_counts(entry, lotto, bonus, rule_set).items():
+            totals[rank] = totals.get(rank, 0) + count
+    return totals
+
+
+@cache
+def _histogram_row(size: int, drawn: int) -> tuple[int, ...]:
+    row = [0] * len(RANK_NAMES)
+    for match_count, count in enumerate(_match_counts(size, drawn)):
+        row[RANK_CODE_BY_MATCH_COUNT.get(match_count, 0)] += count
+    return tuple(row)
+
+
+def system_rank_histogram(entry_masks: Iterable[int], lotto: LottoNumbers) -> list[int]:
+    """
+    비트마스크로 저장된 시스템 티켓들의 등수 코드별 하위 티켓 수 (인덱스 = 등수 코드)
+
+    기본 등수 규칙만 다루며, 결과는 일괄 정산의 등수 히스토그램에 그대로 더할 수 있습니다.
+    """
+    lotto_mask = to_mask(lotto.numbers)
+    histogram = [0] * len(RANK_NAMES)
+    for mask in entry_masks:
+        row = _histogram_row(mask.bit_count(), (mask & lotto_mask).bit_count())
+        histogram = [total + count for total, count in zip(histogram, row)]
+    return histogram
@@ -0,0 +1,245 @@
+from array import array
+from typing import BinaryIO, Iterable, Iterator, Sequence
+
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+from src.lottery07.model import require_unique
+
+# ===== 티켓 비트마스크 =====
+# 번호 n은 (1 << n) 비트로 표현합니다 (1~45 -> 64비트 정수 하나)
+# 일치 개수 = (티켓 마스크 & 추첨 마스크).bit_count()
+
+VALID_NUMBERS_MASK = sum(1 << number for number in range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1))
+
+
+def to_mask(numbers: Iterable[int]) -> int:
+    mask = 0
+    for number in numbers:
+        mask |= 1 << number
+    return mask
+
+
+def mask_to_numbers(mask: int) -> list[int]:
+    return [number for number in range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1) if mask >> number & 1]
+
+
+def require_ticket_numbers(numbers: Sequence[int]) -> None:
+    """서로 다른 1~45 번호 6개인지 검사 (카운터를 갱신하기 전에 부르는 공통 검사, 아니면 ValueError)"""
+    if len(numbers) != LOTTO_NUMBER_COUNT:
+        raise ValueError(f"번호는 {LOTTO_NUMBER_COUNT}개여야 합니다: {len(numbers)}")
+    if any(not LOTTO_MIN_NUMBER <= number <= LOTTO_MAX_NUMBER for number in numbers):
+        raise ValueError(f"{LOTTO_MIN_NUMBER}~{LOTTO_MAX_NUMBER} 범위만 허용됩니다.")
+    require_unique(numbers)
+
+
+def parse_ticket_line(line: str) -> int:
+    """
+    "3, 11, 19, 27, 38, 44" 형식의 한 줄을 비트마스크로 변환합니다.
+
+    read_user_numbers() + LottoNumbers 검증과 같은 기준으로 받아들이고,
+    올바르지 않으면 ValueError를 발생시킵니다.
+    """
+    try:
+        # int()만으로는 str.strip()이 지우는 \x1c~\x1f 같은 공백을 거부하므로 read_user_numbers()처럼 먼저 strip
+        numbers = [int(part.strip()) for part in line.split(",")]
+    except ValueError:
+        raise ValueError("숫자만 입력해 주세요.") from None
+
+    if len(numbers) != LOTTO_NUMBER_COUNT:
+        raise ValueError(f"번호는 {LOTTO_NUMBER_COUNT}개여야 합니다.")
+    if not all(LOTTO_MIN_NUMBER <= number <= LOTTO_MAX_NUMBER for number in numbers):
+        raise ValueError(f"{LOTTO_MIN_NUMBER}~{LOTTO_MAX_NUMBER} 범위만 허용됩니다.")
+
+    mask = to_mask(numbers)
+    if mask.bit_count() != LOTTO_NUMBER_COUNT:
+        raise ValueError("번호는 서로 중복될 수 없습니다.")
+    return mask
+
+
+class TicketBatch:
+    """티켓 id / 번호 비트마스크를 열(column) 단위로 담는 묶음"""
+
+    def __init__(self, ids: array | None = None, masks: array | None = None) -> None:
+        self.ids = ids if ids is not None else array("Q")
+        self.masks = masks if masks is not None else array("Q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, ticket_id: int, mask: int) -> None:
+        self.ids.append(ticket_id)
+        self.masks.append(mask)
+
+
+# ===== 대량 파싱 =====
+# 한 줄씩 split/int/검증하는 대신 블록(여러 줄) 단위로 C 수준 bytes 연산만 사용합니다.
+#   1. 공백을 한 번에 지우고 줄바꿈을 별도 토큰으로 만들어 split -> 7번째 토큰마다 줄바꿈이면 모든 줄이 6칸
+#   2. "번호 문자열 -> 비트" 사전 조회 후 6개씩 합 -> 마스크 (사전에 없는 토큰이면 실패)
+#   3. 서로 다른 비트 6개의 합만 비트가 6개 -> bit_count()로 중복 검사
+#   4. 원본의 숫자 덩어리 수가 토큰 수와 같아야 함 -> "1 2"처럼 숫자 사이 공백이 지워져 붙은 경우 실패
+# 실패한 블록은 반으로 나눠 다시 시도하고, 남은 몇 줄만 parse_ticket_line()으로 검사해
+# read_user_numbers()와 같은 기준으로 받아들이거나 사유와 함께 거부합니다.
+
+PARSE_BLOCK_SIZE = 1 << 20
+
+# 잘못된 줄 하나가 다시 검사하게 만드는 범위를 줄이기 위해 버퍼를 이 크기 블록으로 나눠 처리
+_FAST_BLOCK_SIZE = 1 << 16
+
+# 이 줄 수 이하의 블록은 나누지 않고 한 줄씩 검사
+_LINE_BY_LINE_LIMIT = 16
+
+_WHITESPACE = b" \t\r\v\f"
+_TOKEN_BITS = {
+    token.encode("ascii"): 1 << number
+    for number in range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1)
+    for token in {str(number), f"{number:02d}"}
+}
+# 숫자 -> "0", 나머지 -> " " (숫자 덩어리 수 = " 0" 개수)
+_DIGIT_SHAPE = bytes(b"0"[0] if byte in b"0123456789" else b" "[0] for byte in range(256))
+
+
+def _parse_block_fast(data: bytes, line_count: int) -> list[int] | None:
+    """모든 줄이 올바른 티켓이면 마스크 목록, 아니면 None"""
+    shape = data.translate(_DIGIT_SHAPE)
+    if shape.count(b" 0") + shape.startswith(b"0") != LOTTO_NUMBER_COUNT * line_count:
+        return None
+
+    tokens = data.translate(None, _WHITESPACE).replace(b"\n", b",\n,").split(b",")
+    stride = LOTTO_NUMBER_COUNT + 1
+    if len(tokens) != stride * line_count + 1 or tokens[LOTTO_NUMBER_COUNT::stride].count(b"\n") != line_count:
+        return None
+    del tokens[LOTTO_NUMBER_COUNT::stride]
+    tokens.pop()
+
+    try:
+        bits = list(map(_TOKEN_BITS.__getitem__, tokens))
+    except KeyError:
+        return None
+    masks = list(map(sum, zip(*[iter(bits)] * LOTTO_NUMBER_COUNT)))
+    if sum(map(int.bit_count, masks)) != LOTTO_NUMBER_COUNT * line_count:
+        return None
+    return masks
+
+
+def _parse_block(data: bytes, first_id: int, batch: TicketBatch, errors: list[tuple[int, str]]) -> None:
+    """줄바꿈으로 끝나는 블록을 파싱해 batch/errors에 추가합니다."""
+    line_count = data.count(b"\n")
+    masks = _parse_block_fast(data, line_count)
+    if masks is not None:
+        batch.ids.extend(range(first_id, first_id + line_count))
+        batch.masks.extend(masks)
+        return
+
+    if line_count > _LINE_BY_LINE_LIMIT:
+        # 가운데 가까운 줄 경계에서 반으로 (마지막 줄바꿈은 제외해 양쪽 모두 비지 않게)
+        middle = data.find(b"\n", len(data) // 2, len(data) - 1) + 1 or data.rfind(b"\n", 0, len(data) - 1) + 1
+        _parse_block(data[:middle], first_id, batch, errors)
+        _parse_block(data[middle:], first_id + data.count(b"\n", 0, middle), batch, errors)
+        return
+
+    for ticket_id, raw in enumerate(data.split(b"\n")[:-1], start=first_id):
+        line = raw.decode("utf-8", errors="replace")
+        if not line.strip():
+            continue
+        try:
+            batch.append(ticket_id, parse_ticket_line(line))
+        except ValueError as error:
+            errors.append((ticket_id, str(error)))
+
+
+def parse_ticket_buffer(data: bytes, first_id: int = 1) -> tuple[TicketBatch, list[tuple[int, str]]]:
+    """
+    줄 단위 티켓 버퍼를 TicketBatch로 변환합니다.
+
+    티켓 id는 first_id부터 시작하는 줄 번호이며, 빈 줄은 티켓이 아니지만 번호는 차지합니다.
+    (배치, [(거부된 줄 id, 사유)])를 반환합니다.
+    """
+    batch = TicketBatch()
+    errors: list[tuple[int, str]] = []
+    if data and not data.endswith(b"\n"):
+        data += b"\n"
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + _FAST_BLOCK_SIZE) + 1 or len(data)
+        _parse_block(data[start:end], first_id, batch, errors)
+        first_id += data.count(b"\n", start, end)
+        start = end
+    return batch, errors
+
+
+def parse_ticket_file(
+    file: BinaryIO, block_size: int = PARSE_BLOCK_SIZE
+) -> Iterator[tuple[TicketBatch, list[tuple[int, str]]]]:
+    """바이너리 파일을 block_size 안팎의 줄 경계 블록으로 읽어 (배치, 거부 목록)을 차례로 생성합니다."""
+    first_id = 1
+    carry = b""
+    while block := file.read(block_size):
+        data = carry + block
+        end = data.rfind(b"\n") + 1
+        carry = data[end:]
+        if end:
+            yield parse_ticket_buffer(data[:end], first_id)
+            first_id += data.count(b"\n", 0, end)
+    if carry:
+        yield parse_ticket_buffer(carry, first_id)
+
+
+# ===== 바이너리 티켓 레코드 =====
+# 티켓 한 장 = 번호 6개를 uint8 6바이트로 (단말기 -> 수집 서버 전송 형식)
+# 자리별 열(data[i::6])로 나눠 비트 조회 + 6개씩 합 + bit_count()로 텍스트 대량 파싱과 같은 검사를 합니다.
+
+_NUMBER_BITS = [1 << value for value in range(256)]
+_VALID_NUMBER_BYTES = bytes(range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1))
+
+
+def _record_error(record: bytes) -> str:
+    if record.translate(None, _VALID_NUMBER_BYTES):
+        return f"{LOTTO_MIN_NUMBER}~{LOTTO_MAX_NUMBER} 범위만 허용됩니다."
+    return "번호는 서로 중복될 수 없습니다."
+
+
+def require_packed_tickets(data: bytes) -> None:
+    """
+    정렬된 서로 다른 1~45 번호 6바이트 레코드를 이어 붙인 열인지 검사합니다 (아니면 ValueError).
+
+    parse_ticket_records()가 돌려주는 열의 조건이며, 자리별 열끼리 비교해 한꺼번에 확인합니다.
+    """
+    if len(data) % LOTTO_NUMBER_COUNT:
+        raise ValueError(f"티켓 레코드 길이는 {LOTTO_NUMBER_COUNT}의 배수여야 합니다: {len(data)}")
+    if data.translate(None, _VALID_NUMBER_BYTES):
+        raise ValueError(f"{LOTTO_MIN_NUMBER}~{LOTTO_MAX_NUMBER} 범위만 허용됩니다.")
+    columns = [data[position::LOTTO_NUMBER_COUNT] for position in range(LOTTO_NUMBER_COUNT)]
+    if not all(all(map(int.__lt__, left, right)) for left, right in zip(columns, columns[1:])):
+        raise ValueError("티켓 레코드는 정렬된 서로 다른 번호여야 합니다.")
+
+
+def parse_ticket_records(data: bytes, first_id: int = 1) -> tuple[TicketBatch, bytes, list[tuple[int, str]]]:
+    """
+    6바이트 티켓 레코드를 이어 붙인 버퍼를 한꺼번에 검사합니다.
+
+    티켓 id는 first_id부터 시작하는 레코드 번호입니다.
+    (배치, 통과한 티켓의 정렬된 번호를 6바이트씩 이어 붙인 열, [(거부된 티켓 id, 사유)])를 반환합니다.
+    """
+    if len(data) % LOTTO_NUMBER_COUNT:
+        raise ValueError(f"티켓 레코드 길이는 {LOTTO_NUMBER_COUNT}의 배수여야 합니다: {len(data)}")
+    count = len(data) // LOTTO_NUMBER_COUNT
+    columns = [data[position::LOTTO_NUMBER_COUNT] for position in range(LOTTO_NUMBER_COUNT)]
+    masks = array("Q", map(sum, zip(*[map(_NUMBER_BITS.__getitem__, column) for column in columns])))
+
+    in_range = not data.translate(None, _VALID_NUMBER_BYTES)
+    if in_range and bytes(map(int.bit_count, masks)).count(LOTTO_NUMBER_COUNT) == count:
+        batch = TicketBatch(array("Q", range(first_id, first_id + count)), masks)
+        ordered = all(
+            all(map(int.__lt__, columns[position], columns[position + 1])) for position in range(LOTTO_NUMBER_COUNT - 1)
+        )
+        packed = data if ordered else b"".join(bytes(mask_to_numbers(mask)) for mask in masks)
+        return batch, packed, []
+
+    batch = TicketBatch()
+    errors: list[tuple[int, str]] = []
+    for index, mask in enumerate(masks):
+        if mask.bit_count() == LOTTO_NUMBER_COUNT and not mask & ~VALID_NUMBERS_MASK:
+            batch.append(first_id + index, mask)
+        else:
+            start = index * LOTTO_NUMBER_COUNT
+            errors.append((first_id + index, _record_error(data[start : start + LOTTO_NUMBER_COUNT])))
+    return batch, b"".join(bytes(mask_to_numbers(mask)) for mask in batch.masks), errors
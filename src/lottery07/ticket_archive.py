@@ -0,0 +1,291 @@
+"""
+판매 티켓 보관소 (추가 전용, 세그먼트 파일 + 메모리 매핑)
+
+몇 년치 판매 티켓에서 티켓 한 장을 id로 찾을 때 보관소 전체를 읽지 않도록 합니다.
+
+디렉터리 구조:
+    segment-00000001.rec : 고정 폭 레코드 (ticket_id uint64, draw_no uint32, 조합 순위 uint32, 단말기 uint32)
+    segment-00000001.idx : 희소 인덱스 (세그먼트가 가득 차 봉인될 때 기록)
+                           헤더(magic + 간격 + 레코드 수) + SPARSE_STRIDE번째 레코드마다 ticket_id(uint64), draw_no(uint32)
+
+티켓 id와 회차는 추가 순서대로 증가해야 합니다 (같은 회차 티켓은 연속해서 저장됨).
+- id 조회: 세그먼트 이진 탐색 -> 희소 인덱스 이진 탐색 -> 블록 안 이진 탐색, O(log n)
+- 회차 조회: 회차의 첫 레코드를 같은 방식으로 찾은 뒤 순차 읽기
+아직 봉인되지 않은 마지막 세그먼트는 열 때 희소 인덱스를 메모리에서 만듭니다.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from src.lottery07.combination import combination_rank_masks, combination_unrank
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import TicketBatch
+
+RECORD = struct.Struct("<QIII")
+SPARSE_STRIDE = 256
+DEFAULT_SEGMENT_RECORDS = 1 << 20
+
+_INDEX_MAGIC = b"LSPX"
+_INDEX_HEADER = struct.Struct("<4sIQ")
+_SEGMENT_PREFIX = "segment-"
+
+
+class ArchivedTicket(BaseModel):
+    """보관소 레코드 하나"""
+
+    ticket_id: int
+    draw_no: int
+    combination: int
+    terminal_id: int
+
+    def numbers(self) -> LottoNumbers:
+        return LottoNumbers(numbers=combination_unrank(self.combination))
+
+
+def _segment_paths(directory: str) -> list[tuple[str, str]]:
+    """(레코드 파일, 희소 인덱스 파일) 경로, 세그먼트 번호 순"""
+    names = sorted(name for name in os.listdir(directory) if name.startswith(_SEGMENT_PREFIX) and name.endswith(".rec"))
+    return [(os.path.join(directory, name), os.path.join(directory, name[:-4] + ".idx")) for name in names]
+
+
+def _segment_path(directory: str, number: int) -> str:
+    return os.path.join(directory, f"{_SEGMENT_PREFIX}{number:08d}.rec")
+
+
+def _sparse_index(records: memoryview, count: int) -> tuple[array, array]:
+    """SPARSE_STRIDE번째 레코드마다 (ticket_id 열, draw_no 열)"""
+    ids, draws = array("Q"), array("I")
+    for position in range(0, count, SPARSE_STRIDE):
+        ticket_id, draw_no, _, _ = RECORD.unpack_from(records, position * RECORD.size)
+        ids.append(ticket_id)
+        draws.append(draw_no)
+    return ids, draws
+
+
+def _write_sparse_index(path: str, ids: array, draws: array, count: int) -> None:
+    if sys.byteorder == "big":
+        ids, draws = array("Q", ids), array("I", draws)
+        ids.byteswap()
+        draws.byteswap()
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, SPARSE_STRIDE, count))
+        ids.tofile(file)
+        draws.tofile(file)
+    os.replace(temporary, path)
+
+
+def _read_sparse_index(path: str, count: int) -> tuple[array, array] | None:
+    """봉인된 세그먼트의 희소 인덱스 (없거나 레코드 수가 다르면 None)"""
+    try:
+        with open(path, "rb") as file:
+            magic, stride, indexed_count = _INDEX_HEADER.unpack(file.read(_INDEX_HEADER.size))
+            if magic != _INDEX_MAGIC or stride != SPARSE_STRIDE or indexed_count != count:
+                return None
+            size = -(-count // SPARSE_STRIDE)
+            ids, draws = array("Q"), array("I")
+            ids.fromfile(file, size)
+            draws.fromfile(file, size)
+    except (FileNotFoundError, EOFError, struct.error):
+        return None
+    if sys.byteorder == "big":
+        ids.byteswap()
+        draws.byteswap()
+    return ids, draws
+
+
+class _Segment:
+    """메모리 매핑된 세그먼트 하나"""
+
+    def __init__(self, record_path: str, index_path: str) -> None:
+        with open(record_path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = len(self._mmap) // RECORD.size
+        self.records = memoryview(self._mmap)[: self.count * RECORD.size]
+        self.sparse_ids, self.sparse_draws = _read_sparse_index(index_path, self.count) or _sparse_index(
+            self.records, self.count
+        )
+        self.first_id = self.sparse_ids[0]
+        self.last_draw = self.draw_at(self.count - 1)
+
+    def id_at(self, position: int) -> int:
+        return RECORD.unpack_from(self.records, position * RECORD.size)[0]
+
+    def draw_at(self, position: int) -> int:
+        return RECORD.unpack_from(self.records, position * RECORD.size)[1]
+
+    def record(self, position: int) -> ArchivedTicket:
+        ticket_id, draw_no, combination, terminal_id = RECORD.unpack_from(self.records, position * RECORD.size)
+        return ArchivedTicket(ticket_id=ticket_id, draw_no=draw_no, combination=combination, terminal_id=terminal_id)
+
+    def find(self, ticket_id: int) -> int | None:
+        block = bisect_right(self.sparse_ids, ticket_id) - 1
+        if block < 0:
+            return None
+        low = block * SPARSE_STRIDE
+        high = min(low + SPARSE_STRIDE, self.count)
+        position = bisect_left(range(self.count), ticket_id, low, high, key=self.id_at)
+        return position if position < high and self.id_at(position) == ticket_id else None
+
+    def first_of_draw(self, draw_no: int) -> int:
+        """draw_no 이상인 첫 레코드 위치"""
+        block = bisect_left(self.sparse_draws, draw_no)
+        low = max(block - 1, 0) * SPARSE_STRIDE
+        high = min(block * SPARSE_STRIDE + 1, self.count)
+        return bisect_left(range(self.count), draw_no, low, high, key=self.draw_at)
+
+    def close(self) -> None:
+        self.records.release()
+        self._mmap.close()
+
+
+class TicketArchive:
+    """보관소 읽기 (열었을 때의 내용 기준)"""
+
+    def __init__(self, directory: str) -> None:
+        self._segments = [
+            _Segment(record_path, index_path)
+            for record_path, index_path in _segment_paths(directory)
+            if os.path.getsize(record_path) >= RECORD.size
+        ]
+        self._first_ids = [segment.first_id for segment in self._segments]
+
+    def __len__(self) -> int:
+        return sum(segment.count for segment in self._segments)
+
+    def get(self, ticket_id: int) -> ArchivedTicket | None:
+        index = bisect_right(self._first_ids, ticket_id) - 1
+        if index < 0:
+            return None
+        segment = self._segments[index]
+        position = segment.find(ticket_id)
+        return segment.record(position) if position is not None else None
+
+    def scan_draw(self, draw_no: int) -> Iterator[ArchivedTicket]:
+        """회차의 티켓을 저장 순서대로 (세그먼트를 순차로 읽음)"""
+        for segment in self._segments:
+            if segment.last_draw < draw_no:
+                continue
+            if segment.sparse_draws[0] > draw_no:
+                return
+            # 조각 뷰를 만들지 않고 위치로 읽음 (순회를 중간에 멈춘 채 close()해도 매핑을 닫을 수 있음)
+            for position in range(segment.first_of_draw(draw_no), segment.count):
+                ticket_id, record_draw_no, combination, terminal_id = RECORD.unpack_from(
+                    segment.records, position * RECORD.size
+                )
+                if record_draw_no != draw_no:
+                    return
+                # 파일에서 읽은 값이므로 검증 생략
+                yield ArchivedTicket.model_construct(
+                    ticket_id=ticket_id, draw_no=draw_no, combination=combination, terminal_id=terminal_id
+                )
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+
+    def __enter__(self) -> "TicketArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class TicketArchiveWriter:
+    """보관소 추가 기록 (segment_records개마다 새 세그먼트)"""
+
+    def __init__(self, directory: str, segment_records: int = DEFAULT_SEGMENT_RECORDS) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_records = segment_records
+        self.last_id = 0
+        self.last_draw = 0
+
+        segments = _segment_paths(directory)
+        self._segment_number = int(os.path.basename(segments[-1][0])[len(_SEGMENT_PREFIX) : -4]) if segments else 0
+        self._file = None
+        self._count = 0
+        if segments:
+            record_path, index_path = segments[-1]
+            count = os.path.getsize(record_path) // RECORD.size
+            with open(record_path, "r+b") as file:
+                # 중간에 끊긴 마지막 레코드는 버림
+                file.truncate(count * RECORD.size)
+                if count:
+                    file.seek((count - 1) * RECORD.size)
+                    self.last_id, self.last_draw, _, _ = RECORD.unpack(file.read(RECORD.size))
+            if not os.path.exists(index_path) and count < segment_records:
+                self._file = open(record_path, "ab")
+                self._count = count
+
+    def append(self, ticket_id: int, draw_no: int, combination: int, terminal_id: int = 0) -> None:
+        self._check_order(ticket_id, draw_no)
+        self._write(RECORD.pack(ticket_id, draw_no, combination, terminal_id), 1)
+        self.last_id, self.last_draw = ticket_id, draw_no
+
+    def append_batch(self, draw_no: int, batch: TicketBatch, terminal_id: int = 0) -> None:
+        """파싱된 티켓 묶음을 배치의 티켓 id 그대로 추가합니다 (id는 증가 순서여야 함)."""
+        if not len(batch):
+            return
+        self._check_order(batch.ids[0], draw_no)
+        if any(previous >= current for previous, current in zip(batch.ids, batch.ids[1:])):
+            raise ValueError("티켓 id는 증가 순서여야 합니다.")
+
+        ranks = combination_rank_masks(batch.masks)
+        records = list(map(RECORD.pack, batch.ids, repeat(draw_no), ranks, repeat(terminal_id)))
+        start = 0
+        while start < len(records):
+            size = min(len(records) - start, self.segment_records - self._count)
+            self._write(b"".join(records[start : start + size]), size)
+            start += size
+        self.last_id, self.last_draw = batch.ids[-1], draw_no
+
+    def _check_order(self, ticket_id: int, draw_no: int) -> None:
+        if ticket_id <= self.last_id:
+            raise ValueError(f"티켓 id는 증가해야 합니다: {ticket_id} <= {self.last_id}")
+        if draw_no < self.last_draw:
+            raise ValueError(f"회차는 감소할 수 없습니다: {draw_no} < {self.last_draw}")
+
+    def _write(self, data: bytes, count: int) -> None:
+        """현재 세그먼트에 레코드 count개를 씁니다 (세그먼트 남은 칸을 넘지 않아야 함)."""
+        if self._file is None:
+            self._segment_number += 1
+            self._file = open(_segment_path(self.directory, self._segment_number), "ab")
+            self._count = 0
+        self._file.write(data)
+        self._count += count
+        if self._count >= self.segment_records:
+            self._seal()
+
+    def _seal(self) -> None:
+        """가득 찬 세그먼트를 닫고 희소 인덱스를 기록합니다."""
+        self._file.close()
+        record_path = _segment_path(self.directory, self._segment_number)
+        with open(record_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as records:
+            with memoryview(records) as view:
+                ids, draws = _sparse_index(view, self._count)
+        _write_sparse_index(record_path[:-4] + ".idx", ids, draws, self._count)
+        self._file = None
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "TicketArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,263 @@
+"""
+판매 티켓 / 당첨 결과 저장소 (SQLite)
+
+티켓 번호는 조합 순위(0 ~ C(45, 6) - 1) 정수 하나로 저장합니다.
+
+- 대량 적재: 호출 한 번 = 트랜잭션 한 번, executemany에 제너레이터를 넘겨 행 목록을 만들지 않음
+- bulk_load(): 적재하는 동안 보조 인덱스를 지웠다가 끝난 뒤 한 번에 다시 만듦
+- 정산: 당첨 조합(3개 이상 일치, 약 19만 개)을 임시 테이블에 넣고 SQL 조인 한 번으로 당첨 결과 기록
+  (낙첨 결과는 저장하지 않음)
+
+조회: 단말기별, 회차별, 등수별, 조합별
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from itertools import chain, combinations, repeat
+from typing import Iterable, Iterator
+
+from src.lottery07.combination import combination_rank, combination_rank_masks, combination_unrank
+from src.lottery07.const import (
+    LOTTO_MAX_NUMBER,
+    LOTTO_MIN_NUMBER,
+    LOTTO_NUMBER_COUNT,
+    RANK_CODE_BY_MATCH_COUNT,
+    RANK_FAIL,
+    RANK_NAMES,
+)
+from src.lottery07.game import rank_name
+from src.lottery07.model import LottoNumbers, LottoResult
+from src.lottery07.ticket import TicketBatch
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS draws (
+    draw_no INTEGER PRIMARY KEY,
+    combination INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tickets (
+    ticket_id INTEGER PRIMARY KEY,
+    draw_no INTEGER NOT NULL,
+    terminal_id INTEGER NOT NULL,
+    combination INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    ticket_id INTEGER PRIMARY KEY,
+    draw_no INTEGER NOT NULL,
+    match_count INTEGER NOT NULL,
+    rank_code INTEGER NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS tickets_draw_combination ON tickets (draw_no, combination);
+CREATE INDEX IF NOT EXISTS tickets_terminal_draw ON tickets (terminal_id, draw_no);
+CREATE INDEX IF NOT EXISTS results_draw_rank ON results (draw_no, rank_code);
+"""
+
+_DROP_INDEXES = """
+DROP INDEX IF EXISTS tickets_draw_combination;
+DROP INDEX IF EXISTS tickets_terminal_draw;
+DROP INDEX IF EXISTS results_draw_rank;
+"""
+
+
+def _numbers(combination: int) -> LottoNumbers:
+    return LottoNumbers(numbers=combination_unrank(combination))
+
+
+def winning_combinations(lotto: LottoNumbers) -> Iterator[tuple[int, int, int]]:
+    """당첨 번호에 대해 등수가 있는 모든 조합의 (조합 순위, 일치 개수, 등수 코드)"""
+    drawn = sorted(lotto.numbers)
+    others = sorted(set(range(LOTTO_MIN_NUMBER, LOTTO_MAX_NUMBER + 1)) - set(drawn))
+    for match_count, code in RANK_CODE_BY_MATCH_COUNT.items():
+        for matched in combinations(drawn, match_count):
+            for rest in combinations(others, LOTTO_NUMBER_COUNT - match_count):
+                yield combination_rank(matched + rest), match_count, code
+
+
+class TicketStore:
+    """판매 티켓 / 당첨 결과 저장소"""
+
+    def __init__(self, path: str) -> None:
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA cache_size=-262144")
+        self._connection.executescript(_SCHEMA + _INDEXES)
+        last_id = self._connection.execute("SELECT MAX(ticket_id) FROM tickets").fetchone()[0]
+        self._next_id = (last_id or 0) + 1
+
+    # ===== 적재 =====
+
+    def add_tickets(self, draw_no: int, tickets: Iterable[LottoNumbers], terminal_id: int = 0) -> range:
+        """티켓을 추가하고 새로 매긴 티켓 id 범위를 반환합니다."""
+        ranks = [combination_rank(ticket.numbers) for ticket in tickets]
+        ids = range(self._next_id, self._next_id + len(ranks))
+        self._insert(zip(ids, repeat(draw_no), repeat(terminal_id), ranks), ids[-1] if ids else 0)
+        return ids
+
+    def add_batch(self, draw_no: int, batch: TicketBatch, terminal_id: int = 0) -> None:
+        """파싱된 티켓 묶음을 배치의 티켓 id 그대로 추가합니다 (대량 적재용)."""
+        self.add_batches([(draw_no, batch, terminal_id)])
+
+    def add_batches(self, batches: Iterable[tuple[int, TicketBatch, int]]) -> None:
+        """(회차, 티켓 묶음, 단말기) 여러 개를 트랜잭션 하나로 추가합니다."""
+        batches = list(batches)
+        rows = chain.from_iterable(
+            zip(batch.ids, repeat(draw_no), repeat(terminal_id), combination_rank_masks(batch.masks))
+            for draw_no, batch, terminal_id in batches
+        )
+        self._insert(rows, max((max(batch.ids, default=0) for _, batch, _ in batches), default=0))
+
+    def _insert(self, rows: Iterable[tuple[int, int, int, int]], last_id: int) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO tickets (ticket_id, draw_no, terminal_id, combination) VALUES (?, ?, ?, ?)", rows
+            )
+        self._next_id = max(self._next_id, last_id + 1)
+
+    @property
+    def next_ticket_id(self) -> int:
+        """add_tickets()가 다음에 매길 티켓 id (저장된 가장 큰 id + 1)"""
+        return self._next_id
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["TicketStore"]:
+        """
+        대량 적재 구간: 보조 인덱스를 지우고 동기화를 끈 채 적재한 뒤, 끝나면 인덱스를 한 번에 다시 만듭니다.
+
+        행마다 B-트리 여러 개를 갱신하는 것보다 정렬 후 한 번에 만드는 편이 몇 배 빠릅니다.
+        """
+        self._connection.executescript(_DROP_INDEXES)
+        self._connection.execute("PRAGMA synchronous=OFF")
+        try:
+            yield self
+        finally:
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_INDEXES)
+
+    # ===== 정산 =====
+
+    def settle_draw(self, draw_no: int, lotto: LottoNumbers) -> dict[str, int]:
+        """회차 당첨 번호를 기록하고 당첨 결과를 저장한 뒤 등수별 티켓 수를 반환합니다."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO draws (draw_no, combination) VALUES (?, ?)",
+                (draw_no, combination_rank(lotto.numbers)),
+            )
+            self._connection.execute("DELETE FROM results WHERE draw_no = ?", (draw_no,))
+            self._connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS winning "
+                "(combination INTEGER PRIMARY KEY, match_count INTEGER NOT NULL, rank_code INTEGER NOT NULL)"
+            )
+            self._connection.execute("DELETE FROM temp.winning")
+            self._connection.executemany("INSERT INTO temp.winning VALUES (?, ?, ?)", winning_combinations(lotto))
+            self._connection.execute(
+                "INSERT INTO results (ticket_id, draw_no, match_count, rank_code) "
+                "SELECT t.ticket_id, t.draw_no, w.match_count, w.rank_code "
+                "FROM tickets t JOIN temp.winning w ON w.combination = t.combination WHERE t.draw_no = ?",
+                (draw_no,),
+            )
+        return self.rank_counts(draw_no)
+
+    # ===== 조회 =====
+
+    def ticket_count(self, draw_no: int | None = None) -> int:
+        if draw_no is None:
+            return self._connection.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
+        return self._connection.execute("SELECT COUNT(*) FROM tickets WHERE draw_no = ?", (draw_no,)).fetchone()[0]
+
+    def draw_numbers(self, draw_no: int) -> LottoNumbers | None:
+        row = self._connection.execute("SELECT combination FROM draws WHERE draw_no = ?", (draw_no,)).fetchone()
+        return _numbers(row[0]) if row else None
+
+    def tickets_by_draw(self, draw_no: int) -> Iterator[tuple[int, LottoNumbers]]:
+        """(티켓 id, 번호), 티켓 id 순"""
+        rows = self._connection.execute(
+            "SELECT ticket_id, combination FROM tickets WHERE draw_no = ? ORDER BY ticket_id", (draw_no,)
+        )
+        for ticket_id, combination in rows:
+            yield ticket_id, _numbers(combination)
+
+    def tickets_by_terminal(self, terminal_id: int, draw_no: int | None = None) -> Iterator[tuple[int, LottoNumbers]]:
+        """단말기가 판매한 (티켓 id, 번호), draw_no를 주면 그 회차만"""
+        if draw_no is None:
+            rows = self._connection.execute(
+                "SELECT ticket_id, combination FROM tickets WHERE terminal_id = ? ORDER BY ticket_id", (terminal_id,)
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT ticket_id, combination FROM tickets WHERE terminal_id = ? AND draw_no = ? ORDER BY ticket_id",
+                (terminal_id, draw_no),
+            )
+        for ticket_id, combination in rows:
+            yield ticket_id, _numbers(combination)
+
+    def tickets_by_combination(self, draw_no: int, numbers: LottoNumbers) -> list[int]:
+        """회차에서 같은 번호 조합을 산 티켓 id들"""
+        rows = self._connection.execute(
+            "SELECT ticket_id FROM tickets WHERE draw_no = ? AND combination = ? ORDER BY ticket_id",
+            (draw_no, combination_rank(numbers.numbers)),
+        )
+        return [ticket_id for (ticket_id,) in rows]
+
+    def results_by_rank(self, draw_no: int, rank: str) -> Iterator[tuple[int, LottoResult]]:
+        """회차의 해당 등수 (티켓 id, 결과), 티켓 id 순 (낙첨은 저장하지 않으므로 조회 불가)"""
+        if rank == RANK_FAIL or rank not in RANK_NAMES:
+            raise ValueError(f"당첨 등수만 조회할 수 있습니다: {rank}")
+        lotto = self.draw_numbers(draw_no)
+        if lotto is None:
+            return
+        rows = self._connection.execute(
+            "SELECT r.ticket_id, t.combination, r.match_count FROM results r JOIN tickets t USING (ticket_id) "
+            "WHERE r.draw_no = ? AND r.rank_code = ? ORDER BY r.ticket_id",
+            (draw_no, RANK_NAMES.index(rank)),
+        )
+        for ticket_id, combination, match_count in rows:
+            yield (
+                ticket_id,
+                LottoResult(
+                    lotto_numbers=lotto, user_numbers=_numbers(combination), match_count=match_count, rank=rank
+                ),
+            )
+
+    def result(self, ticket_id: int) -> LottoResult | None:
+        """티켓 한 장의 결과 (티켓이 없거나 아직 정산 전이면 None)"""
+        row = self._connection.execute(
+            "SELECT t.combination, d.combination, r.match_count, r.rank_code "
+            "FROM tickets t JOIN draws d USING (draw_no) LEFT JOIN results r USING (ticket_id) "
+            "WHERE t.ticket_id = ?",
+            (ticket_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        combination, draw_combination, match_count, rank_code = row
+        user_numbers, lotto_numbers = _numbers(combination), _numbers(draw_combination)
+        if match_count is None:
+            match_count = len(set(user_numbers.numbers) & set(lotto_numbers.numbers))
+        return LottoResult(
+            lotto_numbers=lotto_numbers,
+            user_numbers=user_numbers,
+            match_count=match_count,
+            rank=rank_name(rank_code or 0),
+        )
+
+    def rank_counts(self, draw_no: int) -> dict[str, int]:
+        """회차의 등수별 티켓 수 (낙첨 = 전체 - 당첨)"""
+        counts = dict.fromkeys(RANK_NAMES, 0)
+        rows = self._connection.execute(
+            "SELECT rank_code, COUNT(*) FROM results WHERE draw_no = ? GROUP BY rank_code", (draw_no,)
+        )
+        for code, count in rows:
+            counts[RANK_NAMES[code]] = count
+        counts[RANK_FAIL] = self.ticket_count(draw_no) - sum(counts.values())
+        return counts
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "TicketStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,430 @@
+"""
+휠(wheel) / 커버링 디자인
+
+번호 v개(풀) 중 drawn개가 당첨 번호에 들어 있으면, 티켓 중 적어도 한 장은
+guarantee개 이상 맞도록 보장하는 티켓 묶음을 만듭니다.
+예) 풀 20개, guarantee=3, drawn=3 -> 풀에서 3개가 나오면 반드시 3개 일치 티켓이 있음
+
+- 풀 번호는 1~v 로컬 번호로 풀고, 결과를 실제 풀 번호에 대응시킵니다.
+- 덮어야 할 대상(drawn개 부분집합)을 colex 순위 비트로, 후보 티켓이 덮는 대상을 정수 비트셋으로 표현
+- 지연(lazy) 탐욕 집합 덮개로 티켓을 고른 뒤, 다른 티켓만으로 덮이는 티켓을 지워(가지치기) 줄임
+- 이어서 국소 탐색으로 더 줄임 (_local_search)
+    - 2-for-1: 두 장을 빼고 남는 대상을 한 장으로 모두 덮을 수 있으면 그 한 장으로 교체
+    - 1-for-1: 한 장을 빼고, 티켓 한 장의 번호 하나를 바꾸는 교체를 swaps번까지 해서 빈 대상을 다시 덮어 봄
+      (다시 덮이면 한 장이 줄어든 것이고, 못 덮으면 빼기 전 덮개를 씀)
+- 무작위 동점 처리로 attempts번 시도해 가장 작은 결과를 씀
+- 후보 덮개 계산, 탐욕 덮개, 국소 탐색, 남은 시도는 time_limit초(기본 DEFAULT_TIME_LIMIT)가 지나면 멈추고,
+  그때까지 덮지 못한 대상은 그 대상을 포함하는 티켓으로 채움 (멈춘 시점의 결과도 보장 조건은 만족)
+- 대상 수 C(풀 크기, drawn)가 MAX_TARGETS를 넘으면 거부 (부분집합별 대상 비트셋 표는 멈출 수 없는 단계라
+  크기를 제한해 시간 예산의 일부로 묶어 둠, 풀 20개/drawn=6이 38,760개)
+- (풀 크기, drawn, guarantee, max_candidates, attempts, time_limit)별 결과는 메모리와 디스크에 캐시
+"""
+
+import heapq
+import random
+import time
+from array import array
+from itertools import combinations
+from math import comb, exp
+from typing import Callable, Sequence
+
+from src.lottery07.combination import cached_ranks, combination_rank, combination_unrank
+from src.lottery07.const import LOTTO_MAX_NUMBER, LOTTO_MIN_NUMBER, LOTTO_NUMBER_COUNT
+from src.lottery07.model import LottoNumbers, require_unique
+
+DEFAULT_MAX_CANDIDATES = 50_000
+DEFAULT_ATTEMPTS = 3
+DEFAULT_SWAPS = 1_000
+DEFAULT_TIME_LIMIT = 3.0
+MAX_TARGETS = 40_000
+_START_TEMPERATURE = 1.0
+
+_wheels: dict[tuple[int, int, int, int, int, float], list[tuple[int, ...]]] = {}
+
+
+def _subset_covers(pool_size: int, drawn: int, guarantee: int) -> dict[tuple[int, ...], int]:
+    """guarantee개 부분집합 -> 그 부분집합을 포함하는 drawn개 대상 비트셋"""
+    target_count = comb(pool_size, drawn)
+    covers = {subset: bytearray((target_count + 7) // 8) for subset in combinations(range(1, pool_size + 1), guarantee)}
+    # 큰 번호부터 고른 조합은 colex 순위가 큰 것부터 나오므로 순위를 따로 계산하지 않음
+    for index, descending in enumerate(combinations(range(pool_size, 0, -1), drawn)):
+        target_rank = target_count - 1 - index
+        offset, bit = target_rank >> 3, 1 << (target_rank & 7)
+        for subset in combinations(descending[::-1], guarantee):
+            covers[subset][offset] |= bit
+    return {subset: int.from_bytes(cover, "little") for subset, cover in covers.items()}
+
+
+def _candidates(pool_size: int, max_candidates: int, rng: random.Random) -> list[tuple[int, ...]]:
+    if comb(pool_size, LOTTO_NUMBER_COUNT) <= max_candidates:
+        return list(combinations(range(1, pool_size + 1), LOTTO_NUMBER_COUNT))
+    sampled = set()
+    while len(sampled) < max_candidates:
+        sampled.add(tuple(sorted(rng.sample(range(1, pool_size + 1), LOTTO_NUMBER_COUNT))))
+    return list(sampled)
+
+
+def _greedy_cover(
+    coverages: list[int], all_targets: int, deadline: float, rng: random.Random
+) -> tuple[list[int], int]:
+    """지연 탐욕 집합 덮개 (고른 후보 인덱스, 남은 대상 비트셋), deadline이 지나면 그때까지 고른 것만"""
+    heap = [(-coverage.bit_count(), rng.random(), index) for index, coverage in enumerate(coverages)]
+    heapq.heapify(heap)
+    uncovered = all_targets
+    chosen: list[int] = []
+    while uncovered and heap and time.monotonic() <= deadline:
+        _, tiebreak, index = heapq.heappop(heap)
+        gain = (coverages[index] & uncovered).bit_count()
+        if not gain:
+            continue
+        if heap and gain < -heap[0][0]:
+            heapq.heappush(heap, (-gain, tiebreak, index))
+            continue
+        chosen.append(index)
+        uncovered &= ~coverages[index]
+    return chosen, uncovered
+
+
+def _prune(coverages: list[int], all_targets: int) -> list[int]:
+    """다른 티켓만으로 모두 덮이는 티켓을 하나씩 지웁니다 (남는 인덱스 목록)."""
+    kept = list(range(len(coverages)))
+    removed = True
+    while removed:
+        removed = False
+        prefix = [0]
+        for index in kept:
+            prefix.append(prefix[-1] | coverages[index])
+        suffix = 0
+        for position in range(len(kept) - 1, -1, -1):
+            if prefix[position] | suffix == all_targets:
+                del kept[position]
+                removed = True
+                break
+            suffix |= coverages[kept[position]]
+    return kept
+
+
+def _set_bits(bits: int) -> list[int]:
+    """비트셋에서 켜진 비트 위치 목록 (바이트 단위로 훑어 큰 정수도 한 번에 처리)"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return [offset * 8 + bit for offset, byte in enumerate(data) if byte for bit in range(8) if byte >> bit & 1]
+
+
+def _coverage_layers(coverages: list[int]) -> tuple[int, int, int]:
+    """(한 장에만 덮인 대상, 정확히 두 장에 덮인 대상, 세 장 이상에 덮인 대상) 비트셋"""
+    once = twice = many = 0
+    for coverage in coverages:
+        once, twice, many = (
+            (once & ~coverage) | (coverage & ~(once | twice | many)),
+            (twice & ~coverage) | (once & coverage),
+            many | (twice & coverage),
+        )
+    return once, twice, many
+
+
+def _merge_pairs(
+    tickets: list[tuple[int, ...]],
+    coverage_of: Callable[[tuple[int, ...]], int],
+    covering: Callable[[int], frozenset[tuple[int, ...]]],
+    deadline: float,
+    changed: int = -1,
+) -> list[tuple[int, ...]]:
+    """
+    2-for-1 교체: 두 장을 빼고 남는 대상을 한 장으로 모두 덮을 수 있으면 그 한 장으로 바꿉니다.
+
+    changed는 마지막으로 본 뒤 한 장/두 장에 덮인 상태가 바뀐 대상이며, 여기에 걸친 티켓이 낀 쌍만 다시 봅니다.
+    (나머지 쌍은 이미 합칠 수 없다고 확인된 것)
+    deadline(time.monotonic 기준)이 지나면 그때까지 줄인 덮개를 돌려줍니다.
+    """
+    max_gain = coverage_of(tickets[0]).bit_count()
+    while True:
+        coverages = [coverage_of(ticket) for ticket in tickets]
+        once, twice, _ = _coverage_layers(coverages)
+        # first, second를 빼면 (한쪽에만 덮인 대상) + (정확히 두 장에 덮인 대상)이 남음
+        gains = [(once & coverage).bit_count() for coverage in coverages]
+        order = sorted(range(len(tickets)), key=gains.__getitem__)
+        merged = None
+        # changed에 걸친 티켓을 first로 두면 changed에 걸친 쌍을 모두 봄
+        for first in order:
+            if gains[first] + gains[order[0]] > max_gain or time.monotonic() > deadline:
+                break
+            if not coverages[first] & changed:
+                continue
+            # 합친 티켓은 first만 덮던 대상을 모두 덮어야 하므로 후보를 first마다 한 번만 구함
+            alone = once & coverages[first]
+            if alone:
+                options = covering((alone & -alone).bit_length() - 1) & covering(alone.bit_length() - 1)
+                candidates = [
+                    (ticket, coverage_of(ticket)) for ticket in sorted(options) if coverage_of(ticket) & alone == alone
+                ]
+                if not candidates:
+                    continue
+                reachable = 0
+                for _, coverage in candidates:
+                    reachable |= coverage
+            for second in order:
+                if gains[first] + gains[second] > max_gain:
+                    break
+                if second == first:
+                    continue
+                uncovered = (once & (coverages[first] | coverages[second])) | (
+                    twice & coverages[first] & coverages[second]
+                )
+                if uncovered.bit_count() > max_gain:
+                    continue
+                if not uncovered:
+                    # 두 장 모두 다른 티켓들로 덮이면 한 장만 남김
+                    merged = tickets[first]
+                    break
+                if alone:
+                    if uncovered & ~reachable:
+                        continue
+                    merged = next(
+                        (ticket for ticket, coverage in candidates if coverage & uncovered == uncovered), None
+                    )
+                else:
+                    # 가장 낮은/높은 대상을 모두 덮는 티켓 중에서 찾음
+                    options = covering((uncovered & -uncovered).bit_length() - 1) & covering(uncovered.bit_length() - 1)
+                    merged = min(
+                        (ticket for ticket in options if coverage_of(ticket) & uncovered == uncovered), default=None
+                    )
+                if merged is not None:
+                    break
+            if merged is not None:
+                break
+        if merged is None:
+            return tickets
+        changed = coverages[first] | coverages[second] | coverage_of(merged)
+        tickets = [ticket for index, ticket in enumerate(tickets) if index not in (first, second)] + [merged]
+
+
+def _drop_and_repair(
+    tickets: list[tuple[int, ...]],
+    coverage_of: Callable[[tuple[int, ...]], int],
+    covering: Callable[[int], frozenset[tuple[int, ...]]],
+    guarantee: int,
+    drawn: int,
+    all_targets: int,
+    swaps: int,
+    deadline: float,
+    rng: random.Random,
+) -> tuple[list[tuple[int, ...]] | None, int]:
+    """
+    혼자 덮는 대상이 가장 적은 티켓을 빼고, 1-for-1 교체로 빈 대상을 다시 덮어 봅니다.
+
+    교체는 덮이지 않은 대상 하나를 골라, 그 대상을 덮는 티켓(covering) 중 지금 티켓 한 장에서 번호 하나만
+    바꾼 것으로 바꾸는 것 중 덮이지 않은 대상 수가 가장 많이 줄어드는(또는 가장 적게 늘어나는) 것입니다.
+    (한 장 적은 덮개 또는 None, 쓴 교체 수)
+    """
+    coverages = [coverage_of(ticket) for ticket in tickets]
+    once, _, _ = _coverage_layers(coverages)
+    dropped = min(((once & coverage).bit_count(), rng.random(), index) for index, coverage in enumerate(coverages))[2]
+    tickets = tickets[:dropped] + tickets[dropped + 1 :]
+    for used in range(1, swaps + 1):
+        if time.monotonic() > deadline:
+            return None, used - 1
+        coverages = [coverage_of(ticket) for ticket in tickets]
+        once, twice, many = _coverage_layers(coverages)
+        uncovered = all_targets & ~(once | twice | many)
+        if not uncovered:
+            return tickets, used - 1
+        target_rank = rng.choice(_set_bits(uncovered))
+        target = set(combination_unrank(target_rank, drawn))
+        options = covering(target_rank)
+
+        best: tuple[int, float, int, tuple[int, ...]] | None = None
+        for index, ticket in enumerate(tickets):
+            # 번호 하나를 바꿔 options에 들 수 있는 티켓은 대상과 guarantee-1개 겹치는 티켓뿐
+            if len(target.intersection(ticket)) != guarantee - 1:
+                continue
+            lost = once & coverages[index]
+            for added in target.difference(ticket):
+                for removed in set(ticket).difference(target):
+                    swapped = tuple(sorted({*ticket, added} - {removed}))
+                    if swapped not in options:
+                        continue
+                    coverage = coverage_of(swapped)
+                    delta = (lost & ~coverage).bit_count() - (uncovered & coverage).bit_count()
+                    move = (delta, rng.random(), index, swapped)
+                    if best is None or move < best:
+                        best = move
+        if best is None:
+            continue
+        # 나빠지는 교체는 담금질(annealing)처럼 처음엔 자주, 갈수록 드물게 받아들임
+        temperature = _START_TEMPERATURE * (1 - used / swaps) + 0.01
+        if best[0] <= 0 or rng.random() < exp(-best[0] / temperature):
+            tickets[best[2]] = best[3]
+    return None, swaps
+
+
+def _local_search(
+    tickets: list[tuple[int, ...]],
+    coverage_of: Callable[[tuple[int, ...]], int],
+    covering: Callable[[int], frozenset[tuple[int, ...]]],
+    guarantee: int,
+    drawn: int,
+    all_targets: int,
+    swaps: int,
+    deadline: float,
+    rng: random.Random,
+) -> list[tuple[int, ...]]:
+    """
+    가지치기까지 끝난 덮개를 2-for-1 교체와 한 장 빼고 다시 덮기(1-for-1 교체 swaps번까지)로 줄입니다.
+
+    덮개 조건은 항상 유지되고 장수는 늘지 않습니다. 교체 티켓은 후보 표본에 없어도 됩니다.
+    deadline이 지나면 그때까지 줄인 덮개를 씁니다.
+    """
+    changed = -1
+    while True:
+        tickets = _merge_pairs(tickets, coverage_of, covering, deadline, changed)
+        if swaps <= 0 or len(tickets) == 1 or time.monotonic() > deadline:
+            return tickets
+        smaller, used = _drop_and_repair(
+            list(tickets), coverage_of, covering, guarantee, drawn, all_targets, swaps, deadline, rng
+        )
+        swaps -= used
+        if smaller is None:
+            return tickets
+        kept = _prune([coverage_of(ticket) for ticket in smaller], all_targets)
+        before = _coverage_layers([coverage_of(ticket) for ticket in tickets])
+        tickets = [smaller[index] for index in kept]
+        after = _coverage_layers([coverage_of(ticket) for ticket in tickets])
+        changed = (before[0] ^ after[0]) | (before[1] ^ after[1])
+
+
+def _search_wheel(
+    pool_size: int,
+    drawn: int,
+    guarantee: int,
+    max_candidates: int,
+    attempts: int,
+    swaps: int = DEFAULT_SWAPS,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+) -> list[tuple[int, ...]]:
+    """
+    탐욕 덮개 + 국소 탐색을 attempts번 해서 가장 작은 휠
+
+    time_limit초가 지나면 후보 덮개 계산, 탐욕 덮개, 국소 탐색, 남은 시도를 멈추고
+    덮지 못한 대상은 그 대상을 포함하는 티켓으로 채웁니다.
+    """
+    deadline = time.monotonic() + time_limit
+    rng = random.Random(pool_size * 100 + drawn * 10 + guarantee)
+    subset_covers = _subset_covers(pool_size, drawn, guarantee)
+    all_targets = (1 << comb(pool_size, drawn)) - 1
+    coverage_cache: dict[tuple[int, ...], int] = {}
+    covering_cache: dict[int, frozenset[tuple[int, ...]]] = {}
+
+    def coverage_of(ticket: tuple[int, ...]) -> int:
+        coverage = coverage_cache.get(ticket)
+        if coverage is None:
+            coverage = 0
+            for subset in combinations(ticket, guarantee):
+                coverage |= subset_covers[subset]
+            coverage_cache[ticket] = coverage
+        return coverage
+
+    def covering(target_rank: int) -> frozenset[tuple[int, ...]]:
+        """대상과 guarantee개 이상 겹치는 모든 티켓"""
+        if target_rank not in covering_cache:
+            target = combination_unrank(target_rank, drawn)
+            found = set()
+            for subset in combinations(target, guarantee):
+                rest = [number for number in range(1, pool_size + 1) if number not in subset]
+                for others in combinations(rest, LOTTO_NUMBER_COUNT - guarantee):
+                    found.add(tuple(sorted(subset + others)))
+            covering_cache[target_rank] = frozenset(found)
+        return covering_cache[target_rank]
+
+    # 후보를 모두 쓸 수 있으면 한 번만 계산하고, 시도마다 동점 처리 순서만 바꿈
+    exhaustive = comb(pool_size, LOTTO_NUMBER_COUNT) <= max_candidates
+    best: list[tuple[int, ...]] | None = None
+    for attempt in range(attempts):
+        if best is not None and time.monotonic() > deadline:
+            break
+        if attempt == 0 or not exhaustive:
+            candidates = _candidates(pool_size, max_candidates, rng)
+            coverages = []
+            for candidate in candidates:
+                if time.monotonic() > deadline:
+                    break
+                coverages.append(coverage_of(candidate))
+            candidates = candidates[: len(coverages)]
+        chosen, uncovered = _greedy_cover(coverages, all_targets, deadline, rng)
+        tickets = [candidates[index] for index in chosen]
+
+        # 표본 후보만으로 (또는 시간 안에) 덮지 못한 대상은 그 대상을 포함하는 티켓으로 채움
+        while uncovered:
+            target_rank = (uncovered & -uncovered).bit_length() - 1
+            target = combination_unrank(target_rank, drawn)
+            rest = [number for number in range(1, pool_size + 1) if number not in target]
+            tickets.append(tuple(sorted(target + rng.sample(rest, LOTTO_NUMBER_COUNT - drawn))))
+            uncovered &= ~coverage_of(tickets[-1])
+
+        kept = _prune([coverage_of(ticket) for ticket in tickets], all_targets)
+        tickets = _local_search(
+            [tickets[index] for index in kept],
+            coverage_of,
+            covering,
+            guarantee,
+            drawn,
+            all_targets,
+            swaps,
+            deadline,
+            rng,
+        )
+        if best is None or len(tickets) < len(best):
+            best = tickets
+    return sorted(best)
+
+
+def build_wheel(
+    pool_size: int,
+    guarantee: int = 3,
+    drawn: int | None = None,
+    cache_dir: str | None = None,
+    max_candidates: int = DEFAULT_MAX_CANDIDATES,
+    attempts: int = DEFAULT_ATTEMPTS,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+) -> list[tuple[int, ...]]:
+    """
+    1~pool_size 로컬 번호로 된 휠 티켓 목록
+
+    drawn을 생략하면 guarantee와 같습니다 (풀에서 guarantee개가 나오면 guarantee개 일치 보장).
+    탐색은 대략 time_limit초 안에 멈추며, 멈춘 시점의 결과도 보장 조건은 항상 만족합니다.
+    덮어야 할 대상 수 C(pool_size, drawn)는 MAX_TARGETS개까지입니다.
+    같은 인자는 메모리 캐시를, cache_dir이 있으면 디스크 캐시를 재사용합니다 (반환값은 캐시의 복사본).
+    """
+    drawn = guarantee if drawn is None else drawn
+    if not LOTTO_NUMBER_COUNT <= pool_size <= LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER + 1:
+        raise ValueError(f"풀 크기는 {LOTTO_NUMBER_COUNT}~{LOTTO_MAX_NUMBER - LOTTO_MIN_NUMBER + 1}개여야 합니다.")
+    if not 1 <= guarantee <= drawn <= LOTTO_NUMBER_COUNT:
+        raise ValueError(f"1 <= guarantee <= drawn <= {LOTTO_NUMBER_COUNT} 조건을 만족해야 합니다.")
+    if comb(pool_size, drawn) > MAX_TARGETS:
+        raise ValueError(f"덮어야 할 대상 수 C({pool_size}, {drawn})가 {MAX_TARGETS}개를 넘습니다.")
+    if time_limit <= 0:
+        raise ValueError("time_limit은 0보다 커야 합니다.")
+
+    key = (pool_size, drawn, guarantee, max_candidates, attempts, time_limit)
+    if key in _wheels:
+        return list(_wheels[key])
+
+    def search() -> array:
+        tickets = _search_wheel(pool_size, drawn, guarantee, max_candidates, attempts, time_limit=time_limit)
+        return array("I", map(combination_rank, tickets))
+
+    file_name = f"wheel-{pool_size}-{drawn}-{guarantee}-{max_candidates}-{attempts}-{time_limit:g}.ranks"
+    tickets = [tuple(combination_unrank(rank)) for rank in cached_ranks(cache_dir, file_name, search)]
+    _wheels[key] = tickets
+    return list(tickets)
+
+
+def wheel_tickets(
+    pool: Sequence[int], guarantee: int = 3, drawn: int | None = None, cache_dir: str | None = None
+) -> list[LottoNumbers]:
+    """실제 풀 번호로 된 휠 티켓 목록"""
+    pool = sorted(pool)
+    require_unique(pool)
+    return [
+        LottoNumbers(numbers=[pool[number - 1] for number in ticket])
+        for ticket in build_wheel(len(pool), guarantee, drawn, cache_dir)
+    ]
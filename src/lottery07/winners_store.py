@@ -0,0 +1,96 @@
+"""
+당첨 티켓 조회 저장소 (읽기 전용, 메모리 매핑)
+
+정산이 끝난 뒤 "티켓 X가 당첨됐나?" 조회를 count_match 재계산 없이 처리합니다.
+
+파일 구조 (little-endian):
+    헤더  : magic(4) + 예약(4) + 당첨 티켓 수 n(8)
+    id 열 : 정렬된 티켓 id uint64 x n
+    등수 열: 등수 코드 uint8 x n (RANK_NAMES 인덱스)
+
+여러 프로세스가 같은 파일을 mmap으로 열면 OS 페이지 캐시를 복사 없이 공유합니다.
+조회는 id 열 이진 탐색(O(log n))입니다.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, TextIO
+
+from src.lottery07.const import RANK_NAMES
+
+_FILE_MAGIC = b"LWIN"
+_FILE_HEADER = struct.Struct("<4sIQ")
+
+
+def build_winners_store(path: str, ticket_ids: Iterable[int], rank_codes: Iterable[int]) -> int:
+    """(티켓 id, 등수 코드) 목록으로 저장소 파일을 만들고 당첨 티켓 수를 반환합니다."""
+    winners = sorted(zip(ticket_ids, rank_codes))
+    ids = array("Q", (ticket_id for ticket_id, _ in winners))
+    if sys.byteorder == "big":
+        ids.byteswap()
+
+    with open(path, "wb") as file:
+        file.write(_FILE_HEADER.pack(_FILE_MAGIC, 0, len(winners)))
+        ids.tofile(file)
+        file.write(bytes(code for _, code in winners))
+    return len(winners)
+
+
+def read_winner_csv(winner_csv: TextIO) -> tuple[array, bytearray]:
+    """settle_stream()이 기록한 당첨 CSV에서 (티켓 id 열, 등수 코드 열)을 읽습니다."""
+    ids = array("Q")
+    rank_codes = bytearray()
+    next(winner_csv, None)  # 헤더
+    for line in winner_csv:
+        ticket_id, _, _, rank = line.rstrip("\n").split(",")
+        ids.append(int(ticket_id))
+        rank_codes.append(RANK_NAMES.index(rank))
+    return ids, rank_codes
+
+
+class WinnersStore:
+    """메모리 매핑된 당첨 티켓 저장소"""
+
+    def __init__(self, path: str) -> None:
+        if sys.byteorder != "little":
+            raise OSError("WinnersStore는 little-endian 플랫폼에서만 메모리 매핑할 수 있습니다.")
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, _, count = _FILE_HEADER.unpack_from(self._mmap)
+        if magic != _FILE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"당첨 저장소 파일이 아닙니다: {path}")
+
+        ids_end = _FILE_HEADER.size + 8 * count
+        view = memoryview(self._mmap)
+        self._ids = view[_FILE_HEADER.size : ids_end].cast("Q")
+        self._rank_codes = view[ids_end : ids_end + count]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def rank_code(self, ticket_id: int) -> int:
+        """당첨 등수 코드 (당첨되지 않은 티켓은 0)"""
+        index = bisect_left(self._ids, ticket_id)
+        if index < len(self._ids) and self._ids[index] == ticket_id:
+            return self._rank_codes[index]
+        return 0
+
+    def rank(self, ticket_id: int) -> str:
+        return RANK_NAMES[self.rank_code(ticket_id)]
+
+    def close(self) -> None:
+        self._ids.release()
+        self._rank_codes.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "WinnersStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,80 @@
+"""
+lottery07 비대화형 일괄 게임 테스트
+"""
+
+import io
+import json
+
+import pytest
+
+from src.lottery07.batch import play_batch, read_binary_results
+from src.lottery07.generator import FixedLottoGenerator
+from src.lottery07.model import LottoNumbers
+
+LOTTO = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+
+TICKETS = [
+    "1, 2, 3, 4, 5, 6\n",  # 1등
+    "1, 2, 3, 4, 5, 7\n",  # 2등
+    "\n",
+    "1, 2, 3, 40, 41, 42\n",  # 4등
+    "1, 2, 3, 4\n",  # 거부
+    "10, 11, 12, 13, 14, 15\n",  # 낙첨
+]
+
+
+class TestPlayBatch:
+    """일괄 게임 테스트"""
+
+    def test_csv(self):
+        """모든 티켓의 결과를 줄 번호와 함께 기록"""
+        out = io.StringIO()
+
+        report = play_batch(TICKETS, LOTTO, out, "csv", chunk_size=2)
+
+        assert out.getvalue().splitlines() == [
+            "ticket_id,numbers,match_count,rank",
+            "1,1 2 3 4 5 6,6,1st",
+            "2,1 2 3 4 5 7,5,2nd",
+            "4,1 2 3 40 41 42,3,4th",
+            "6,10 11 12 13 14 15,0,fail",
+        ]
+        assert report.ticket_count == 4
+        assert report.rejected_count == 1
+        assert report.rank_counts == {"fail": 1, "1st": 1, "2nd": 1, "3rd": 0, "4th": 1}
+
+    def test_ndjson(self):
+        """한 줄에 JSON 객체 하나"""
+        out = io.StringIO()
+
+        play_batch(TICKETS, LOTTO, out, "ndjson", chunk_size=4)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert records[1] == {"ticket_id": 2, "numbers": [1, 2, 3, 4, 5, 7], "match_count": 5, "rank": "2nd"}
+        assert [record["ticket_id"] for record in records] == [1, 2, 4, 6]
+
+    def test_binary_round_trip(self):
+        """binary 결과를 다시 읽으면 같은 내용"""
+        out = io.BytesIO()
+
+        play_batch(TICKETS, LOTTO, out, "binary", chunk_size=2)
+        lotto, chunks = read_binary_results(io.BytesIO(out.getvalue()))
+
+        rows = [
+            (ticket_id, mask.bit_count(), match_count, code)
+            for batch, match_counts, rank_codes in chunks
+            for ticket_id, mask, match_count, code in zip(batch.ids, batch.masks, match_counts, rank_codes)
+        ]
+        assert lotto == LOTTO
+        assert rows == [(1, 6, 6, 1), (2, 6, 5, 2), (4, 6, 3, 4), (6, 6, 0, 0)]
+
+    def test_generator_draw(self):
+        """생성 전략으로 당첨 번호를 한 번 만듦"""
+        report = play_batch(TICKETS, FixedLottoGenerator([1, 2, 3, 4, 5, 6]), io.StringIO())
+
+        assert report.lotto_numbers == LOTTO
+
+    def test_unknown_format(self):
+        """지원하지 않는 출력 형식"""
+        with pytest.raises(ValueError):
+            play_batch(TICKETS, LOTTO, io.StringIO(), "xml")
@@ -0,0 +1,17 @@
+"""
+lottery07 성능 측정 테스트
+"""
+
+from src.lottery07.bench import format_benchmarks, run_benchmarks
+
+
+class TestRunBenchmarks:
+    """성능 측정 모음 테스트"""
+
+    def test_all_benchmarks_report_throughput(self):
+        """모든 측정 항목이 처리량을 보고"""
+        results = run_benchmarks(size=2_000)
+
+        assert [stage.name for stage in results][:4] == ["quickpick", "parse", "match+rank", "settle"]
+        assert all(stage.items > 0 and stage.seconds > 0 for stage in results)
+        assert format_benchmarks(results).count("\n") == len(results) - 1
@@ -0,0 +1,141 @@
+"""
+lottery07 통합 명령행 도구 테스트
+"""
+
+import io
+import json
+
+import pytest
+
+from src.lottery07.cli import _map_chunks, generate, main, simulate
+from src.lottery07.ticket import parse_ticket_line
+
+
+class TestGenerate:
+    """generate 명령 테스트"""
+
+    def test_text_is_ticket_file_format(self):
+        """text 형식은 정산에서 읽는 티켓 줄 형식"""
+        out = io.StringIO()
+
+        generate(100, seed=7, out=out)
+
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 100
+        assert all(parse_ticket_line(line).bit_count() == 6 for line in lines)
+
+    def test_ndjson(self):
+        """ndjson 형식"""
+        out = io.StringIO()
+
+        generate(3, seed=7, out=out, fmt="ndjson")
+
+        assert [len(json.loads(line)["numbers"]) for line in out.getvalue().splitlines()] == [6, 6, 6]
+
+    def test_same_seed_same_output_regardless_of_workers(self, monkeypatch):
+        """같은 시드면 워커 수와 관계없이 같은 결과"""
+        monkeypatch.setattr("src.lottery07.cli.CHUNK_SIZE", 100)
+        serial, parallel = io.StringIO(), io.StringIO()
+
+        generate(350, seed=3, out=serial)
+        generate(350, seed=3, out=parallel, workers=2)
+
+        assert serial.getvalue() == parallel.getvalue()
+
+
+class TestSimulate:
+    """simulate 명령 테스트"""
+
+    def test_histogram_total(self):
+        """모든 게임이 집계됨"""
+        assert sum(simulate(5_000, seed=1)) == 5_000
+
+
+class TestMapChunks:
+    """청크 작업 실행 테스트"""
+
+    def test_bounded_in_flight(self):
+        """결과를 하나 꺼낼 때까지 제출하는 청크는 workers * 2개까지"""
+        consumed = []
+
+        def arguments():
+            for chunk in range(20):
+                consumed.append(chunk)
+                yield chunk, 2
+
+        results = _map_chunks(pow, arguments(), workers=2)
+
+        assert next(results) == 0
+        assert len(consumed) <= 4
+        assert list(results) == [chunk**2 for chunk in range(1, 20)]
+
+
+class TestMain:
+    """하위 명령 실행 테스트"""
+
+    def test_generate_then_settle(self, tmp_path, capsys):
+        """generate로 만든 파일을 settle로 정산"""
+        tickets = tmp_path / "tickets.txt"
+        winners = tmp_path / "winners.csv"
+
+        main(["generate", "--count", "500", "--seed", "1", "--out", str(tickets)])
+        main(["settle", "--draw", "1,2,3,4,5,6", str(tickets), "--out", str(winners), "--workers", "2"])
+
+        output = capsys.readouterr().out
+        assert "tickets:  500" in output
+        assert winners.read_text(encoding="utf-8").startswith("ticket_id,numbers,match_count,rank")
+
+    def test_settle_stdin_rejects_workers(self, capsys):
+        """stdin 정산에 --workers를 주면 명령행 오류"""
+        with pytest.raises(SystemExit):
+            main(["settle", "--draw", "1,2,3,4,5,6", "-", "--workers", "2"])
+        assert "--workers" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("draw", ["1,2,3,4,5", "1,2,3,4,5,x", "1,2,3,4,5,46"])
+    def test_settle_invalid_draw_is_usage_error(self, tmp_path, capsys, draw):
+        """당첨 번호가 잘못되면 트레이스백 대신 명령행 오류"""
+        tickets = tmp_path / "tickets.txt"
+        tickets.write_text("1, 2, 3, 4, 5, 6\n", encoding="utf-8")
+
+        with pytest.raises(SystemExit) as raised:
+            main(["settle", "--draw", draw, str(tickets)])
+        assert raised.value.code == 2
+        assert "error:" in capsys.readouterr().err
+
+    def test_settle_missing_file_is_usage_error(self, tmp_path, capsys):
+        """티켓 파일이 없으면 명령행 오류"""
+        with pytest.raises(SystemExit) as raised:
+            main(["settle", "--draw", "1,2,3,4,5,6", str(tmp_path / "missing.txt")])
+        assert raised.value.code == 2
+        assert "missing.txt" in capsys.readouterr().err
+
+    def test_play_writes_output_file(self, tmp_path, capsys):
+        """play는 티켓마다 결과를 파일에 쓰고 요약 출력"""
+        tickets = tmp_path / "tickets.txt"
+        tickets.write_text("1, 2, 3, 4, 5, 6\n1, 2, 3, 4, 5, 7\n\n1, 2, 3, 4\n", encoding="utf-8")
+        out = tmp_path / "results.ndjson"
+
+        main(["play", "--draw", "1,2,3,4,5,6", str(tickets), "--out", str(out), "--format", "ndjson"])
+
+        results = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert [result["rank"] for result in results] == ["1st", "2nd"]
+        assert "tickets:  2" in capsys.readouterr().out
+
+    def test_play_seeded_draw_is_reproducible(self, tmp_path):
+        """--draw 없이 같은 --seed면 같은 당첨 번호로 정산"""
+        tickets = tmp_path / "tickets.txt"
+        tickets.write_text("1, 2, 3, 4, 5, 6\n", encoding="utf-8")
+        first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+
+        main(["play", "--seed", "3", str(tickets), "--out", str(first)])
+        main(["play", "--seed", "3", str(tickets), "--out", str(second)])
+
+        assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+
+    def test_simulate(self, capsys):
+        """시뮬레이션 결과와 정확한 확률 출력"""
+        main(["simulate", "--games", "1000", "--seed", "1"])
+
+        output = capsys.readouterr().out
+        assert output.startswith("games: 1000")
+        assert "exact" in output
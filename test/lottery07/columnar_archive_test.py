@@ -0,0 +1,123 @@
+"""
+lottery07 압축 열 보관 테스트
+"""
+
+import random
+from array import array
+
+import pytest
+
+from src.lottery07.columnar_archive import ColumnarArchive, ColumnarArchiveWriter, decode_ranks, encode_ranks
+from src.lottery07.combination import COMBINATION_COUNT, combination_rank
+from src.lottery07.game import count_match, get_rank
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import TicketBatch, to_mask
+
+
+def _draws(count: int = 4, tickets: int = 2_500, seed: int = 1) -> list[tuple[int, LottoNumbers, list[list[int]]]]:
+    rng = random.Random(seed)
+    return [
+        (
+            draw_no,
+            LottoNumbers(numbers=sorted(rng.sample(range(1, 46), 6))),
+            [sorted(rng.sample(range(1, 46), 6)) for _ in range(tickets)],
+        )
+        for draw_no in range(10, 10 + count)
+    ]
+
+
+def _write(path: str, draws, codec: str = "zlib") -> None:
+    with ColumnarArchiveWriter(path, codec=codec, chunk_tickets=1_000) as writer:
+        for draw_no, lotto, tickets in draws:
+            writer.add_draw(draw_no, lotto, (combination_rank(numbers) for numbers in tickets))
+
+
+class TestRankEncoding:
+    """델타 + 바이트 재배치 인코딩 테스트"""
+
+    def test_round_trip(self):
+        """중복 / 0 / 최댓값 포함 왕복"""
+        rng = random.Random(2)
+        ranks = array(
+            "I", sorted([0, 0, COMBINATION_COUNT - 1] + [rng.randrange(COMBINATION_COUNT) for _ in range(999)])
+        )
+        assert decode_ranks(encode_ranks(ranks)) == ranks
+        assert decode_ranks(encode_ranks(array("I"))) == array("I")
+
+
+class TestColumnarArchive:
+    """보관 파일 작성 / 읽기 테스트"""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_round_trip(self, tmp_path, codec):
+        """회차별 정렬된 조합 순위와 당첨 번호 복원"""
+        path = str(tmp_path / "sales.lcol")
+        draws = _draws()
+        _write(path, draws, codec)
+
+        with ColumnarArchive(path) as archive:
+            assert archive.codec == codec
+            assert archive.draws == [10, 11, 12, 13]
+            for draw_no, lotto, tickets in draws:
+                assert archive.draw_numbers(draw_no) == lotto
+                assert archive.ticket_count(draw_no) == len(tickets)
+                ranks = [rank for _, chunk in archive.iter_ranks(draw_no, draw_no) for rank in chunk]
+                assert ranks == sorted(combination_rank(numbers) for numbers in tickets)
+
+    def test_select_skips_other_draws(self, tmp_path):
+        """회차 범위 밖 청크는 고르지 않음 (2,500장 / 1,000장 청크 = 회차당 3개)"""
+        path = str(tmp_path / "sales.lcol")
+        _write(path, _draws())
+        with ColumnarArchive(path) as archive:
+            assert len(archive.chunks) == 12
+            assert {chunk.draw_no for chunk in archive.select(11, 12)} == {11, 12}
+            assert len(archive.select(11, 12)) == 6
+            assert archive.select(14) == []
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_masks_and_rank_counts(self, tmp_path, workers):
+        """병렬로 읽은 마스크와 등수 집계가 티켓별 계산과 같음"""
+        path = str(tmp_path / "sales.lcol")
+        draws = _draws()
+        _write(path, draws)
+
+        with ColumnarArchive(path) as archive:
+            masks = [mask for _, chunk in archive.iter_masks(11, 11, workers=workers) for mask in chunk]
+            assert sorted(masks) == sorted(to_mask(numbers) for numbers in draws[1][2])
+
+            counts = archive.rank_counts(11, 12, workers=workers)
+        assert list(counts) == [11, 12]
+        for draw_no, lotto, tickets in draws[1:3]:
+            expected = dict.fromkeys(counts[draw_no], 0)
+            for numbers in tickets:
+                expected[get_rank(count_match(lotto, LottoNumbers(numbers=numbers)))] += 1
+            assert counts[draw_no] == expected
+
+    def test_add_draw_batch_and_order(self, tmp_path):
+        """파싱된 배치로 추가, 회차는 증가 순서만"""
+        path = str(tmp_path / "sales.lcol")
+        lotto = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+        batch = TicketBatch(array("Q", [1, 2]), array("Q", [to_mask([1, 2, 3, 4, 5, 6]), to_mask([1, 2, 3, 4, 5, 7])]))
+        with ColumnarArchiveWriter(path) as writer:
+            writer.add_draw_batch(1, lotto, batch)
+            with pytest.raises(ValueError):
+                writer.add_draw(1, lotto, [])
+            writer.add_draw(2, lotto, [])
+
+        with ColumnarArchive(path) as archive:
+            assert archive.rank_counts() == {
+                1: {"fail": 0, "1st": 1, "2nd": 1, "3rd": 0, "4th": 0},
+                2: {"fail": 0, "1st": 0, "2nd": 0, "3rd": 0, "4th": 0},
+            }
+
+    def test_failed_write_leaves_no_file(self, tmp_path):
+        """작성 중 예외가 나면 보관 파일을 만들지 않음"""
+        path = tmp_path / "sales.lcol"
+        with pytest.raises(RuntimeError):
+            with ColumnarArchiveWriter(str(path)):
+                raise RuntimeError
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unknown_codec(self, tmp_path):
+        with pytest.raises(ValueError):
+            ColumnarArchiveWriter(str(tmp_path / "sales.lcol"), codec="zstd")
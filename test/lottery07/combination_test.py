@@ -0,0 +1,59 @@
+"""
+lottery07 조합 번호 테스트
+"""
+
+import random
+
+from src.lottery07.combination import (
+    COMBINATION_COUNT,
+    combination_masks,
+    combination_rank,
+    combination_rank_masks,
+    combination_unrank,
+    subset_ranks,
+)
+
+
+class TestCombinationRank:
+    """조합 순위 변환 테스트"""
+
+    def test_first_and_last_rank(self):
+        """첫 조합은 0, 마지막 조합은 C(45, 6) - 1"""
+        assert combination_rank([1, 2, 3, 4, 5, 6]) == 0
+        assert combination_rank([40, 41, 42, 43, 44, 45]) == COMBINATION_COUNT - 1
+
+    def test_round_trip(self):
+        """순위 -> 번호 -> 순위"""
+        rng = random.Random(1)
+        for _ in range(200):
+            numbers = sorted(rng.sample(range(1, 46), 6))
+            assert combination_unrank(combination_rank(numbers)) == numbers
+
+    def test_subset_ranks(self):
+        """부분 조합 순위는 부분 조합의 combination_rank와 같음"""
+        ranks = list(subset_ranks([5, 1, 9], 2))
+
+        assert ranks == [combination_rank([1, 5]), combination_rank([1, 9]), combination_rank([5, 9])]
+
+
+class TestCombinationRankMasks:
+    """마스크 -> 조합 순위 표 계산 테스트"""
+
+    def test_matches_combination_rank(self):
+        """번호 목록으로 계산한 순위와 같음"""
+        rng = random.Random(3)
+        tickets = [rng.sample(range(1, 46), 6) for _ in range(500)] + [[1, 2, 3, 4, 5, 6], [40, 41, 42, 43, 44, 45]]
+        masks = [sum(1 << number for number in ticket) for ticket in tickets]
+        assert list(combination_rank_masks(masks)) == [combination_rank(ticket) for ticket in tickets]
+
+
+class TestCombinationMasks:
+    """조합 순위 -> 마스크 변환 테스트"""
+
+    def test_matches_unrank(self):
+        """정렬된 순위 / 섞인 순위 모두 combination_unrank()와 같음"""
+        rng = random.Random(4)
+        ranks = [0, COMBINATION_COUNT - 1] + [rng.randrange(COMBINATION_COUNT) for _ in range(2_000)]
+        for ordered in (ranks, sorted(ranks)):
+            expected = [sum(1 << number for number in combination_unrank(rank)) for rank in ordered]
+            assert list(combination_masks(ordered)) == expected
@@ -0,0 +1,25 @@
+"""
+lottery07 테스트 공용 fixture
+"""
+
+import pytest
+
+DRAW_FILE_HEADER = "draw_no,n1,n2,n3,n4,n5,n6,bonus"
+
+
+def _write_draw_file(path, rows: list[str]) -> str:
+    path.write_text(DRAW_FILE_HEADER + "\n" + "\n".join(rows) + "\n\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    """두 회차짜리 추첨 기록 CSV (헤더와 빈 줄 포함)"""
+    return _write_draw_file(tmp_path / "draws.csv", ["1,1,2,3,4,5,6,7", "2,1,10,20,30,40,45,2"])
+
+
+@pytest.fixture
+def skewed_history_file(tmp_path):
+    """1~5번이 50회차 모두 나온 추첨 기록 CSV (가중치 전략 테스트용)"""
+    rows = [f"{draw_no},1,2,3,4,5,{6 + draw_no % 2},45" for draw_no in range(1, 51)]
+    return _write_draw_file(tmp_path / "skewed-draws.csv", rows)
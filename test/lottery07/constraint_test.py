@@ -0,0 +1,104 @@
+"""
+lottery07 제약 조건 컴파일 테스트
+"""
+
+import os
+
+import pytest
+
+from src.lottery07 import constraint
+from src.lottery07.combination import combination_unrank
+from src.lottery07.constraint import PickConstraints, compile_constraints
+
+
+class TestPickConstraints:
+    """제약 조건 검사 테스트"""
+
+    def test_accepts(self):
+        """합계/홀짝/연속 번호 조건"""
+        constraints = PickConstraints(min_sum=100, max_sum=175, odd_count=3, max_consecutive=2)
+
+        assert constraints.accepts((7, 12, 21, 30, 33, 40))
+        assert not constraints.accepts((1, 2, 3, 4, 5, 6))  # 합계 미달
+        assert not constraints.accepts((7, 13, 21, 31, 33, 40))  # 홀수 5개
+        assert not constraints.accepts((7, 20, 21, 22, 33, 40))  # 3개 연속
+
+    def test_accepts_required_and_excluded(self):
+        """필수 번호가 빠지거나 제외 번호가 들어 있으면 거부"""
+        constraints = PickConstraints(required_numbers=(7,), excluded_numbers=(45,))
+
+        assert constraints.accepts((1, 2, 3, 4, 5, 7))
+        assert not constraints.accepts((1, 2, 3, 4, 5, 6))
+        assert not constraints.accepts((1, 2, 3, 4, 7, 45))
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"required_numbers": (0,)},
+            {"required_numbers": (50,)},
+            {"excluded_numbers": (3, 3)},
+            {"required_numbers": (7,), "excluded_numbers": (7,)},
+            {"required_numbers": (1, 2, 3, 4, 5, 6, 7)},
+        ],
+    )
+    def test_invalid_numbers(self, fields):
+        """범위 밖 / 중복 / 필수와 제외가 겹치는 번호는 에러"""
+        with pytest.raises(ValueError):
+            PickConstraints(**fields)
+
+    def test_numbers_are_sorted(self):
+        """순서만 다른 번호는 같은 제약 조건"""
+        constraints = PickConstraints(required_numbers=(7, 3))
+
+        assert constraints.required_numbers == (3, 7)
+        assert constraints == PickConstraints(required_numbers=(3, 7))
+        assert constraints.cache_key() == PickConstraints(required_numbers=(3, 7)).cache_key()
+
+
+class TestCompileConstraints:
+    """조건을 만족하는 조합 목록 테스트"""
+
+    def test_all_compiled_combinations_satisfy_constraints(self):
+        """목록의 모든 조합은 필수 번호를 포함하고 조건을 만족"""
+        constraints = PickConstraints(required_numbers=(7, 8, 9, 10), odd_count=2, excluded_numbers=(45,))
+
+        ranks = compile_constraints(constraints)
+
+        # 필수 번호 4개 + 나머지 40개 중 홀수 0개/짝수 2개 (7, 9가 이미 홀수)
+        assert len(ranks) == 190
+        for rank in ranks:
+            numbers = combination_unrank(rank)
+            assert {7, 8, 9, 10} <= set(numbers)
+            assert 45 not in numbers
+            assert constraints.accepts(tuple(numbers))
+
+    def test_disk_cache(self, tmp_path):
+        """디스크 캐시 파일을 만들고 다시 읽음"""
+        constraints = PickConstraints(required_numbers=(1, 2, 3, 4, 5), min_sum=40)
+        cache_dir = str(tmp_path / "cache")
+
+        ranks = compile_constraints(constraints, cache_dir)
+        path = os.path.join(cache_dir, f"constraints-{constraints.cache_key()}.ranks")
+
+        assert os.path.getsize(path) == 4 * len(ranks)
+
+        constraint._compiled.cache_clear()
+        assert compile_constraints(constraints, cache_dir) == ranks
+
+    def test_shared_ranks_are_read_only(self):
+        """캐시된 목록을 공유하므로 호출자가 바꿀 수 없음"""
+        constraints = PickConstraints(required_numbers=(1, 2, 3, 4, 5))
+        ranks = compile_constraints(constraints)
+
+        with pytest.raises(TypeError):
+            ranks[0] = 0
+        assert compile_constraints(constraints) == ranks
+        assert len(ranks) == 40
+
+    def test_memory_cache_is_bounded(self):
+        """메모리 캐시는 COMPILED_CACHE_SIZE개까지만 보관"""
+        constraint._compiled.cache_clear()
+        for excluded in range(1, constraint.COMPILED_CACHE_SIZE + 3):
+            compile_constraints(PickConstraints(required_numbers=(40, 41, 42, 43, 44), excluded_numbers=(excluded,)))
+
+        assert constraint._compiled.cache_info().currsize == constraint.COMPILED_CACHE_SIZE
@@ -0,0 +1,102 @@
+"""
+lottery07 노출 인덱스 테스트
+"""
+
+import random
+
+import pytest
+
+from src.lottery07.exposure import ExposureIndex
+from src.lottery07.game import count_match, get_rank
+from src.lottery07.model import LottoNumbers
+
+
+@pytest.fixture(scope="module")
+def tickets():
+    rng = random.Random(3)
+    draw = [3, 9, 17, 25, 33, 41]
+    # 당첨 티켓이 충분히 나오도록 추첨 번호 일부를 섞어 만든다
+    result = [rng.sample(range(1, 46), 6) for _ in range(300)]
+    for keep in (6, 5, 5, 4, 4, 4, 3, 3, 3, 3):
+        rest = rng.sample([n for n in range(1, 46) if n not in draw], 6 - keep)
+        result.append(rng.sample(draw, keep) + rest)
+    return result
+
+
+def expected_rank_counts(tickets, lotto):
+    counts = {"fail": 0, "1st": 0, "2nd": 0, "3rd": 0, "4th": 0}
+    for numbers in tickets:
+        counts[get_rank(count_match(lotto, LottoNumbers(numbers=numbers)))] += 1
+    return counts
+
+
+class TestExposureIndex:
+    """노출 인덱스 테스트"""
+
+    def test_rank_counts_equal_full_scan(self, tickets):
+        """티켓 전체를 count_match로 훑은 결과와 같음"""
+        lotto = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+        index = ExposureIndex()
+        index.add_many(tickets)
+
+        assert index.rank_counts(lotto) == expected_rank_counts(tickets, lotto)
+
+    def test_add_packed_equals_add_many(self, tickets):
+        """정렬된 6바이트 열로 한꺼번에 더해도 add_many와 같음"""
+        expected, index = ExposureIndex(), ExposureIndex()
+        expected.add_many(tickets)
+        index.add_packed(b"".join(bytes(sorted(numbers)) for numbers in tickets))
+
+        assert index.ticket_count == expected.ticket_count
+        assert index.counters == expected.counters
+
+    @pytest.mark.parametrize(
+        "numbers",
+        [[1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 6, 7], [0, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 46], [1, 2, 3, 4, 5, 5]],
+    )
+    def test_add_rejects_invalid_ticket(self, numbers):
+        """번호 6개, 1~45 범위, 중복 검사를 통과하지 못하면 카운터를 건드리지 않음"""
+        index = ExposureIndex()
+
+        with pytest.raises(ValueError):
+            index.add(numbers)
+        assert index.ticket_count == 0
+        assert not any(any(counter) for counter in index.counters.values())
+
+    @pytest.mark.parametrize(
+        "packed",
+        [bytes([1, 2, 3, 4, 5]), bytes([1, 2, 3, 4, 5, 46]), bytes([1, 2, 3, 4, 6, 5]), bytes([1, 2, 3, 4, 5, 5])],
+    )
+    def test_add_packed_rejects_invalid_records(self, packed):
+        """길이, 범위, 정렬/중복 검사를 통과하지 못하면 카운터를 건드리지 않음"""
+        index = ExposureIndex()
+
+        with pytest.raises(ValueError):
+            index.add_packed(bytes([7, 8, 9, 10, 11, 12]) + packed)
+        assert index.ticket_count == 0
+        assert not any(any(counter) for counter in index.counters.values())
+
+    def test_merge(self, tickets):
+        """단말기별 인덱스를 합치면 전체 인덱스와 같음"""
+        lotto = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+        first, second = ExposureIndex(), ExposureIndex()
+        first.add_many(tickets[:150])
+        second.add_many(tickets[150:])
+
+        first.merge(second)
+
+        assert first.ticket_count == len(tickets)
+        assert first.rank_counts(lotto) == expected_rank_counts(tickets, lotto)
+
+    def test_save_and_load(self, tickets, tmp_path):
+        """저장 후 불러와도 같은 결과"""
+        lotto = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+        index = ExposureIndex()
+        index.add_many(tickets[:50])
+        path = str(tmp_path / "exposure.bin")
+
+        index.save(path)
+        loaded = ExposureIndex.load(path)
+
+        assert loaded.ticket_count == 50
+        assert loaded.rank_counts(lotto) == index.rank_counts(lotto)
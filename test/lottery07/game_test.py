@@ -3,9 +3,20 @@ lottery07 게임 로직 테스트
 Generator 주입을 사용한 게임 로직 테스트
 """
 
+import random
+from array import array
 from unittest.mock import Mock
 
-from src.lottery07.game import count_match, get_rank, play_game, read_user_numbers
+from src.lottery07.game import (
+    count_match,
+    count_ranks,
+    get_rank,
+    get_rank_many,
+    play_game,
+    rank_name,
+    read_user_numbers,
+    simulate_games,
+)
 from src.lottery07.generator import AutoLottoGenerator, FixedLottoGenerator
 from src.lottery07.model import LottoNumbers
 
@@ -54,6 +65,50 @@ class TestGetRank:
         assert get_rank(2) == "fail"
 
 
+class TestGetRankMany:
+    """배열 기반 등수 코드 변환 테스트"""
+
+    def test_codes_round_trip_to_rank_strings(self):
+        """등수 코드를 다시 문자열로 바꾸면 get_rank와 같음"""
+        match_counts = bytes(range(7))
+
+        codes = get_rank_many(match_counts)
+
+        assert [rank_name(code) for code in codes] == [get_rank(count) for count in range(7)]
+
+    def test_accepts_uint8_array(self):
+        """array('B') 입력도 처리"""
+        codes = get_rank_many(array("B", [6, 0, 3, 3]))
+
+        assert isinstance(codes, bytes)
+        assert [rank_name(code) for code in codes] == ["1st", "fail", "4th", "4th"]
+
+    def test_wider_array_converted_per_element(self):
+        """array('I') 등 다른 typecode도 값 단위로 처리 (버퍼 바이트로 읽지 않음)"""
+        codes = get_rank_many(array("I", [6, 0, 3, 5]))
+
+        assert [rank_name(code) for code in codes] == ["1st", "fail", "4th", "2nd"]
+
+    def test_count_ranks(self):
+        """등수 코드별 개수 집계"""
+        codes = get_rank_many(bytes([6, 5, 3, 3, 2, 0]))
+
+        assert count_ranks(codes) == [2, 1, 1, 0, 2]
+
+
+class TestSimulateGames:
+    """무작위 게임 시뮬레이션 테스트"""
+
+    def test_histogram(self):
+        """모든 판이 한 등수에 집계되고, 같은 시드면 같은 결과"""
+        histogram = simulate_games(20_000, random.Random(1))
+
+        assert sum(histogram) == 20_000
+        assert histogram == simulate_games(20_000, random.Random(1))
+        # 4등 확률 약 2.24%
+        assert 300 < histogram[4] < 600
+
+
 class TestPlayGameWithGenerator:
     """Generator 주입을 사용한 게임 테스트"""
 
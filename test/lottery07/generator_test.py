@@ -3,16 +3,24 @@ lottery07 생성 전략 테스트
 Strategy Pattern for Lotto Generator
 """
 
+import random
 from unittest.mock import Mock
 
 import pytest
 
+from src.lottery07.constraint import PickConstraints
 from src.lottery07.generator import (
+    AntiPopularLottoGenerator,
     AutoLottoGenerator,
+    ConstrainedLottoGenerator,
     FixedLottoGenerator,
     ManualLottoGenerator,
+    WeightedLottoGenerator,
+    WheelLottoGenerator,
 )
+from src.lottery07.history import DrawHistory
 from src.lottery07.model import LottoNumbers
+from src.lottery07.popularity import PopularityTracker
 
 
 class TestAutoLottoGenerator:
@@ -150,6 +158,137 @@ class TestManualLottoGenerator:
         assert any("추가됨" in str(call) for call in calls)
 
 
+class TestAntiPopularLottoGenerator:
+    """비인기 조합 생성 전략 테스트"""
+
+    def test_generate_returns_valid_numbers(self):
+        """판매 기록이 없어도 유효한 번호 생성"""
+        generator = AntiPopularLottoGenerator(PopularityTracker(), rng=random.Random(0))
+
+        result = generator.generate()
+
+        assert isinstance(result, LottoNumbers)
+        assert len(set(result.numbers)) == 6
+
+    def test_prefers_unpopular_numbers(self):
+        """많이 팔린 번호는 덜 고름"""
+        tracker = PopularityTracker()
+        tracker.update([[1, 2, 3, 4, 5, 6]] * 1000)
+        generator = AntiPopularLottoGenerator(tracker, rng=random.Random(0))
+
+        picks = [number for _ in range(500) for number in generator.generate().numbers]
+
+        assert sum(number <= 6 for number in picks) < len(picks) * 0.01
+
+    def test_rebuilds_after_more_sales(self):
+        """판매 수가 rebuild_every 이상 늘면 가중치를 다시 계산"""
+        tracker = PopularityTracker()
+        generator = AntiPopularLottoGenerator(tracker, rebuild_every=100, rng=random.Random(0))
+        generator.generate()
+
+        tracker.update([[40, 41, 42, 43, 44, 45]] * 100)
+        picks = [number for _ in range(300) for number in generator.generate().numbers]
+
+        assert sum(number >= 40 for number in picks) < len(picks) * 0.01
+
+
+class TestWeightedLottoGenerator:
+    """과거 출현 빈도 가중치 생성 전략 테스트"""
+
+    def test_hot_strategy_prefers_frequent_numbers(self, skewed_history_file):
+        """hot: 자주 나온 번호를 더 자주 고름"""
+        generator = WeightedLottoGenerator.from_history(skewed_history_file, "hot", rng=random.Random(0))
+
+        picks = [number for result in generator.generate_batch(300) for number in result.numbers]
+
+        assert sum(number <= 5 for number in picks) > len(picks) * 0.5
+
+    def test_cold_strategy_avoids_frequent_numbers(self, skewed_history_file):
+        """cold: 자주 나온 번호를 덜 고름"""
+        generator = WeightedLottoGenerator.from_history(skewed_history_file, "cold", rng=random.Random(0))
+
+        picks = [number for result in generator.generate_batch(300) for number in result.numbers]
+
+        assert sum(number <= 5 for number in picks) < len(picks) * 0.01
+
+    def test_from_draw_history(self, skewed_history_file):
+        """파일 경로 대신 DrawHistory를 넘겨도 같은 가중치"""
+        from_path = WeightedLottoGenerator.from_history(skewed_history_file, "hot", rng=random.Random(0))
+        from_history = WeightedLottoGenerator.from_history(
+            DrawHistory.load(skewed_history_file), "hot", rng=random.Random(0)
+        )
+
+        assert from_path.generate_batch(20) == from_history.generate_batch(20)
+
+    def test_skewed_weights_follow_sequential_draw(self):
+        """가중치가 한쪽에 몰려도 다시 뽑지 않고, 순차 비복원 추출과 같은 확률로 고름"""
+        # 번호 1~5는 가중치 1e9, 6은 2, 7은 1, 나머지는 0 -> 1~5는 항상, 6은 2/3 확률로 뽑힘
+        weights = [0.0] + [1e9] * 5 + [2.0, 1.0] + [0.0] * 38
+        generator = WeightedLottoGenerator(weights, rng=random.Random(0))
+
+        results = generator.generate_batch(3_000)
+
+        assert all(result.numbers[:5] == [1, 2, 3, 4, 5] for result in results)
+        assert 0.63 < sum(result.numbers[5] == 6 for result in results) / len(results) < 0.70
+
+    def test_generate_batch_returns_valid_numbers(self):
+        """일괄 생성 결과는 모두 LottoNumbers"""
+        generator = WeightedLottoGenerator([1.0] * 46, rng=random.Random(0))
+
+        results = generator.generate_batch(20)
+
+        assert len(results) == 20
+        assert all(isinstance(result, LottoNumbers) for result in results)
+
+    def test_invalid_arguments(self, skewed_history_file):
+        """가중치 개수나 전략 이름이 잘못되면 에러"""
+        with pytest.raises(ValueError):
+            WeightedLottoGenerator([1.0] * 45)
+        with pytest.raises(ValueError):
+            WeightedLottoGenerator([0.0] * 41 + [1.0] * 5)
+        with pytest.raises(ValueError):
+            WeightedLottoGenerator.from_history(skewed_history_file, "lucky")
+
+
+class TestConstrainedLottoGenerator:
+    """제약 조건 생성 전략 테스트"""
+
+    def test_generated_numbers_satisfy_constraints(self):
+        """생성된 번호는 항상 조건을 만족"""
+        constraints = PickConstraints(required_numbers=(7, 14, 21), min_sum=100, odd_count=3)
+        generator = ConstrainedLottoGenerator(constraints, rng=random.Random(0))
+
+        for _ in range(50):
+            numbers = generator.generate().numbers
+            assert {7, 14, 21} <= set(numbers)
+            assert constraints.accepts(tuple(numbers))
+
+    def test_impossible_constraints(self):
+        """만족하는 조합이 없으면 에러"""
+        with pytest.raises(ValueError):
+            ConstrainedLottoGenerator(PickConstraints(required_numbers=(1, 2, 3, 4, 5, 6), min_sum=100))
+
+
+class TestWheelLottoGenerator:
+    """휠 생성 전략 테스트"""
+
+    def test_generate_cycles_through_wheel(self):
+        """휠 티켓을 차례로 돌려주고 끝나면 처음부터 반복"""
+        generator = WheelLottoGenerator([3, 7, 12, 18, 24, 30, 33, 41, 44], guarantee=3)
+        tickets = generator.generate_batch()
+
+        assert generator.generate() == tickets[0]
+        assert len(set(tuple(ticket.numbers) for ticket in tickets)) == len(tickets)
+
+    def test_ticket_batch(self):
+        """일괄 정산용 묶음으로 변환"""
+        generator = WheelLottoGenerator(range(1, 11), guarantee=3)
+        batch = generator.ticket_batch()
+
+        assert list(batch.ids) == list(range(1, len(generator.tickets) + 1))
+        assert all(mask.bit_count() == 6 for mask in batch.masks)
+
+
 class TestGeneratorStrategy:
     """생성 전략 교체 테스트 (Strategy Pattern)"""
 
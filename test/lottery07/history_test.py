@@ -0,0 +1,158 @@
+"""
+lottery07 과거 추첨 기록 테스트
+"""
+
+import random
+import struct
+from itertools import combinations
+
+import pytest
+
+from src.lottery07.history import DrawHistory, number_frequencies, read_draw_file
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import to_mask
+
+
+class TestReadDrawFile:
+    """추첨 기록 파일 읽기 테스트"""
+
+    def test_read_draws(self, history_file):
+        """헤더와 빈 줄은 건너뜀"""
+        assert read_draw_file(history_file) == [(1, [1, 2, 3, 4, 5, 6], 7), (2, [1, 10, 20, 30, 40, 45], 2)]
+
+    def test_number_frequencies(self, history_file):
+        """보너스 번호는 세지 않음"""
+        frequencies = number_frequencies(history_file)
+
+        assert frequencies[1] == 2
+        assert frequencies[2] == 1
+        assert frequencies[7] == 0
+
+    def test_invalid_row(self, tmp_path):
+        """칸 수가 맞지 않으면 에러"""
+        path = tmp_path / "draws.csv"
+        path.write_text("1,1,2,3\n", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            read_draw_file(str(path))
+
+
+def _random_draws(count: int, seed: int = 1) -> list[tuple[int, list[int], int]]:
+    rng = random.Random(seed)
+    draws = []
+    for draw_no in range(1, count + 1):
+        *numbers, bonus = rng.sample(range(1, 46), 7)
+        draws.append((draw_no, sorted(numbers), bonus))
+    return draws
+
+
+def _expected_stats(draws, window: int) -> tuple[list[int], list[int], list[list[int]], list[int]]:
+    """한 회차씩 직접 센 (출현 횟수, 미출현 회차 수, 동반 출현 횟수, 최근 window회차 출현 횟수)"""
+    frequencies = [0] * 46
+    gaps = [0] + [len(draws)] * 45
+    pairs = [[0] * 46 for _ in range(46)]
+    rolling = [0] * 46
+    for index, (_, numbers, _) in enumerate(draws):
+        for number in numbers:
+            frequencies[number] += 1
+            gaps[number] = len(draws) - 1 - index
+            if index >= len(draws) - window:
+                rolling[number] += 1
+        for first, second in combinations(numbers, 2):
+            pairs[first][second] += 1
+            pairs[second][first] += 1
+    return frequencies, gaps, pairs, rolling
+
+
+class TestDrawHistory:
+    """추첨 기록 통계 테스트"""
+
+    def test_statistics(self):
+        """통계가 회차별로 직접 센 값과 같음"""
+        draws = _random_draws(300)
+        history = DrawHistory.from_draws(draws)
+
+        frequencies, gaps, pairs, rolling = _expected_stats(draws, 50)
+        assert history.frequencies() == frequencies
+        assert history.gaps() == gaps
+        assert history.pair_counts() == pairs
+        assert history.rolling_frequencies(50) == rolling
+
+    def test_incremental_append(self):
+        """계산해 둔 통계를 새 회차만 반영해 갱신해도 처음부터 계산한 값과 같음"""
+        draws = _random_draws(120, seed=2)
+        history = DrawHistory.from_draws(draws[:100])
+        history.frequencies()
+        history.gaps()
+        history.pair_counts()
+        history.rolling_frequencies(7)
+        history.rolling_frequencies(500)
+
+        for draw_no, numbers, bonus in draws[100:]:
+            history.append(draw_no, LottoNumbers(numbers=numbers), bonus)
+
+        assert history.version == 120
+        frequencies, gaps, pairs, rolling = _expected_stats(draws, 7)
+        assert history.frequencies() == frequencies
+        assert history.gaps() == gaps
+        assert history.pair_counts() == pairs
+        assert history.rolling_frequencies(7) == rolling
+        assert history.rolling_frequencies(500) == frequencies
+
+    def test_returned_lists_are_copies(self):
+        """반환값을 고쳐도 캐시는 그대로"""
+        history = DrawHistory.from_draws(_random_draws(10))
+        history.frequencies()[1] = -1
+        assert history.frequencies() == _expected_stats(_random_draws(10), 1)[0]
+
+    def test_load_csv_and_binary(self, history_file, tmp_path):
+        """CSV와 바이너리 파일 모두 읽고, 바이너리 저장 후 같은 기록"""
+        history = DrawHistory.load(history_file)
+        path = str(tmp_path / "draws.bin")
+        history.save(path)
+        loaded = DrawHistory.load(path)
+
+        assert list(loaded.draw_nos) == [1, 2]
+        assert loaded.draw(-1) == (2, LottoNumbers(numbers=[1, 10, 20, 30, 40, 45]), 2)
+        assert list(loaded.masks()) == [to_mask([1, 2, 3, 4, 5, 6]), to_mask([1, 10, 20, 30, 40, 45])]
+        assert loaded.frequencies() == history.frequencies()
+
+    @pytest.mark.parametrize(
+        "draw_nos, numbers, bonuses",
+        [
+            ([1], [1, 2, 3, 4, 5, 46], [7]),
+            ([1], [0, 2, 3, 4, 5, 6], [7]),
+            ([1], [1, 2, 3, 3, 5, 6], [7]),
+            ([1], [1, 2, 3, 4, 5, 6], [6]),
+            ([1], [1, 2, 3, 4, 5, 6], [0]),
+            ([2, 1], [1, 2, 3, 4, 5, 6] * 2, [7, 7]),
+        ],
+    )
+    def test_load_rejects_corrupt_binary(self, tmp_path, draw_nos, numbers, bonuses):
+        """범위 밖 / 중복 번호, 잘못된 보너스, 감소하는 회차가 있는 바이너리 파일은 에러"""
+        path = tmp_path / "draws.bin"
+        path.write_bytes(
+            struct.pack("<4sI", b"LHIS", len(draw_nos))
+            + struct.pack(f"<{len(draw_nos)}I", *draw_nos)
+            + bytes(numbers)
+            + bytes(bonuses)
+        )
+
+        with pytest.raises(ValueError):
+            DrawHistory.load(str(path))
+
+    def test_load_truncated_binary(self, tmp_path):
+        """헤더의 회차 수보다 파일이 짧으면 ValueError"""
+        path = tmp_path / "draws.bin"
+        path.write_bytes(struct.pack("<4sI", b"LHIS", 10) + struct.pack("<I", 1))
+
+        with pytest.raises(ValueError):
+            DrawHistory.load(str(path))
+
+    def test_invalid_append(self):
+        """회차는 증가, 보너스는 당첨 번호와 달라야 함"""
+        history = DrawHistory.from_draws([(5, [1, 2, 3, 4, 5, 6], 7)])
+        with pytest.raises(ValueError):
+            history.append(5, LottoNumbers(numbers=[1, 2, 3, 4, 5, 6]), 7)
+        with pytest.raises(ValueError):
+            history.append(6, LottoNumbers(numbers=[1, 2, 3, 4, 5, 6]), 6)
@@ -0,0 +1,150 @@
+"""
+lottery07 티켓 수집 서버 테스트
+"""
+
+import asyncio
+import random
+
+from src.lottery07.exposure import ExposureIndex
+from src.lottery07.game import count_match, get_rank
+from src.lottery07.ingest import (
+    FRAME_HEADER,
+    STATUS_INVALID,
+    STATUS_OK,
+    IngestServer,
+    encode_batch,
+    read_ack,
+    start_ingest_server,
+    start_ingest_unix_server,
+)
+from src.lottery07.model import LottoNumbers
+from src.lottery07.popularity import PopularityTracker
+from src.lottery07.ticket_store import TicketStore
+
+LOTTO = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+
+
+def _random_tickets(count: int, seed: int = 1) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [rng.sample(range(1, 46), 6) for _ in range(count)]
+
+
+async def send_batches(ingest: IngestServer, frames: list[bytes], unix_path: str | None = None) -> list:
+    """서버를 띄우고 프레임을 한꺼번에(파이프라이닝) 보낸 뒤 응답을 프레임 수만큼 읽음"""
+    if unix_path is None:
+        server = await start_ingest_server(ingest, "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+    else:
+        server = await start_ingest_unix_server(ingest, unix_path)
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    try:
+        writer.write(b"".join(frames))
+        await writer.drain()
+        acks = [await asyncio.wait_for(read_ack(reader), timeout=10) for _ in frames]
+        writer.close()
+        await writer.wait_closed()
+        return acks
+    finally:
+        server.close()
+        await server.wait_closed()
+        await ingest.stop()
+
+
+class TestIngestServer:
+    """수집 서버 테스트"""
+
+    def test_store_and_exposure_updated(self, tmp_path):
+        """통과한 티켓은 저장소와 회차별 노출 카운터에 반영되고, 거부된 티켓은 위치로 알려 줌"""
+        first, second = _random_tickets(20), _random_tickets(5, seed=2)
+        second[1] = [1, 1, 2, 3, 4, 5]
+        second[3] = [0, 2, 3, 4, 5, 6]
+        path = str(tmp_path / "tickets.db")
+        ingest = IngestServer(path)
+
+        acks = asyncio.run(send_batches(ingest, [encode_batch(1, 7, 100, first), encode_batch(2, 7, 200, second)]))
+
+        assert [(ack.batch_id, ack.status, ack.accepted) for ack in acks] == [(1, STATUS_OK, 20), (2, STATUS_OK, 3)]
+        assert acks[0].first_ticket_id == 1
+        assert acks[1].first_ticket_id == 21
+        assert acks[1].rejected == [1, 3]
+
+        accepted = first + [second[0], second[2], second[4]]
+        expected = dict.fromkeys(["fail", "1st", "2nd", "3rd", "4th"], 0)
+        for numbers in accepted:
+            expected[get_rank(count_match(LOTTO, LottoNumbers(numbers=numbers)))] += 1
+        assert ingest.exposures[7].rank_counts(LOTTO) == expected
+        popularity = PopularityTracker()
+        popularity.update(accepted)
+        assert ingest.popularities[7].ticket_count == 23
+        assert ingest.popularities[7].pair_counts == popularity.pair_counts
+
+        with TicketStore(path) as store:
+            assert store.ticket_count(7) == 23
+            assert [ticket_id for ticket_id, _ in store.tickets_by_terminal(200)] == [21, 23, 25]
+            assert store.tickets_by_combination(7, LottoNumbers(numbers=second[2])) == [23]
+
+    def test_trailing_rejected_id_not_reused(self, tmp_path):
+        """끝부분 티켓이 거부된 묶음 다음 묶음도 거부된 티켓의 id를 건너뛰고 매김"""
+        path = str(tmp_path / "tickets.db")
+        ingest = IngestServer(path, max_group=1)
+        frames = [
+            encode_batch(1, 1, 0, [[1, 2, 3, 4, 5, 6], [1, 1, 1, 1, 1, 1]]),
+            encode_batch(2, 1, 0, [[7, 8, 9, 10, 11, 12]]),
+        ]
+
+        acks = asyncio.run(send_batches(ingest, frames))
+
+        assert [(ack.first_ticket_id, ack.rejected) for ack in acks] == [(1, [1]), (3, [])]
+        with TicketStore(path) as store:
+            assert [ticket_id for ticket_id, _ in store.tickets_by_draw(1)] == [1, 3]
+
+    def test_exposure_error_still_acks_stored_batch(self, tmp_path, monkeypatch):
+        """저장 후 노출 카운터 갱신이 실패해도 저장된 묶음은 STATUS_OK, 실패는 통계로 알림"""
+
+        def fail(self, numbers):
+            raise RuntimeError("exposure")
+
+        monkeypatch.setattr(ExposureIndex, "add_packed", fail)
+        path = str(tmp_path / "tickets.db")
+        ingest = IngestServer(path)
+
+        (ack,) = asyncio.run(send_batches(ingest, [encode_batch(1, 1, 0, _random_tickets(3))]))
+
+        assert (ack.status, ack.accepted) == (STATUS_OK, 3)
+        assert ingest.stats().exposure_errors == 1
+        with TicketStore(path) as store:
+            assert store.ticket_count(1) == 3
+
+    def test_pipelined_acks_in_order(self, tmp_path):
+        """대기열이 작아도 많은 묶음을 한꺼번에 보내면 받은 순서대로 모두 응답"""
+        frames = [encode_batch(batch_id, 1, 0, _random_tickets(50, seed=batch_id)) for batch_id in range(40)]
+        ingest = IngestServer(str(tmp_path / "tickets.db"), queue_size=2, max_in_flight=2, max_group=4)
+
+        acks = asyncio.run(send_batches(ingest, frames))
+
+        assert [ack.batch_id for ack in acks] == list(range(40))
+        assert [ack.first_ticket_id for ack in acks] == list(range(1, 2_001, 50))
+        stats = ingest.stats()
+        assert (stats.batches, stats.tickets, stats.rejected) == (40, 2_000, 0)
+        assert 0 <= stats.latency_ms["p50"] <= stats.latency_ms["p90"] <= stats.latency_ms["p99"]
+        assert stats.latency_ms["p99"] <= stats.latency_ms["max"]
+
+    def test_unix_socket(self, tmp_path):
+        """Unix 소켓으로도 같은 프레임을 받음"""
+        ingest = IngestServer(str(tmp_path / "tickets.db"), track_exposure=False, track_popularity=False)
+
+        (ack,) = asyncio.run(send_batches(ingest, [encode_batch(5, 1, 0, _random_tickets(3))], str(tmp_path / "s")))
+
+        assert (ack.batch_id, ack.status, ack.accepted) == (5, STATUS_OK, 3)
+        assert ingest.exposures == {}
+        assert ingest.popularities == {}
+
+    def test_invalid_frame(self, tmp_path):
+        """magic이 다른 프레임은 STATUS_INVALID로 응답"""
+        ingest = IngestServer(str(tmp_path / "tickets.db"))
+        frame = FRAME_HEADER.pack(b"XXXX", 9, 1, 0, 0)
+
+        (ack,) = asyncio.run(send_batches(ingest, [frame]))
+
+        assert (ack.batch_id, ack.status) == (9, STATUS_INVALID)
+        assert ingest.stats().batches == 0
@@ -0,0 +1,55 @@
+"""
+lottery07 이월 당첨금 원장 테스트
+"""
+
+import pytest
+
+from src.lottery07.ledger import JackpotLedger
+
+SALES = 100_000_000
+
+
+class TestJackpotLedger:
+    """원장 기록/재구성 테스트"""
+
+    def test_rollover_adds_to_next_draw(self, tmp_path):
+        """1등 당첨자가 없으면 다음 회차 1등 배분액에 이월"""
+        with JackpotLedger(str(tmp_path / "ledger.db")) as ledger:
+            first = ledger.record_draw(1, SALES, {"2nd": 1})
+            second = ledger.record_draw(2, SALES, {"1st": 2})
+
+        assert first["1st"] == 0
+        assert second["1st"] == (75_000_000 + 75_000_000) // 2
+
+    def test_carryover_cleared_after_win(self, tmp_path):
+        """당첨자가 나오면 이월금 초기화"""
+        with JackpotLedger(str(tmp_path / "ledger.db")) as ledger:
+            ledger.record_draw(1, SALES, {})
+            ledger.record_draw(2, SALES, {})
+            assert ledger.state.carryovers == {"1st": 150_000_000}
+
+            ledger.record_draw(3, SALES, {"1st": 1})
+            assert ledger.state.carryovers == {}
+            assert ledger.state.total_paid == 225_000_000
+
+    def test_balances_rebuilt_from_snapshots(self, tmp_path):
+        """스냅샷 + 이벤트 재생으로 임의 회차 상태 재구성"""
+        path = str(tmp_path / "ledger.db")
+        states = {}
+        with JackpotLedger(path, commit_every=7, snapshot_every=5) as ledger:
+            for draw_no in range(1, 23):
+                winners = {"1st": 1} if draw_no % 4 == 0 else {"3rd": draw_no}
+                ledger.record_draw(draw_no, SALES + draw_no, winners)
+                states[draw_no] = ledger.state
+
+        with JackpotLedger(path) as reopened:
+            assert reopened.state == states[22]
+            for draw_no in (3, 5, 11, 19):
+                assert reopened.balances(draw_no) == states[draw_no]
+
+    def test_draw_no_must_increase(self, tmp_path):
+        """같은 회차를 두 번 기록할 수 없음"""
+        with JackpotLedger(str(tmp_path / "ledger.db")) as ledger:
+            ledger.record_draw(1, SALES, {})
+            with pytest.raises(ValueError):
+                ledger.record_draw(1, SALES, {})
@@ -0,0 +1,84 @@
+"""
+lottery07 지급액 시뮬레이션 테스트
+"""
+
+import random
+
+import pytest
+
+from src.lottery07.exposure import ExposureIndex
+from src.lottery07.game import count_match, get_rank
+from src.lottery07.liability import quantiles_converged, simulate_liability, simulate_payouts
+from src.lottery07.model import LottoNumbers
+from src.lottery07.prize import calculate_payouts, total_payout
+
+
+@pytest.fixture(scope="module")
+def sold():
+    rng = random.Random(11)
+    tickets = [rng.sample(range(1, 46), 6) for _ in range(200)]
+    index = ExposureIndex()
+    index.add_many(tickets)
+    return tickets, index
+
+
+class TestSimulatePayouts:
+    """추첨별 총 지급액 테스트"""
+
+    def test_payout_matches_full_scan(self, sold):
+        """티켓 전체를 count_match로 정산한 지급액과 같음"""
+        tickets, index = sold
+
+        for total, numbers in simulate_payouts(index, 20, seed=5):
+            lotto = LottoNumbers(numbers=numbers)
+            counts = {}
+            for ticket in tickets:
+                rank = get_rank(count_match(lotto, LottoNumbers(numbers=ticket)))
+                counts[rank] = counts.get(rank, 0) + 1
+            assert total == total_payout(calculate_payouts(len(tickets) * 1_000, counts), counts)
+
+
+class TestSimulateLiability:
+    """분포 요약 테스트"""
+
+    def test_report(self, sold):
+        """분위수는 오름차순, 최악 추첨은 지급액 내림차순"""
+        _, index = sold
+
+        report = simulate_liability(index, max_draws=3_000, batch_size=1_000, seed=1, worst=3)
+
+        assert report.draws == 3_000
+        assert report.quantiles["p50"] <= report.quantiles["p99"] <= report.quantiles["p99.9"]
+        payouts = [total for _, total in report.worst_draws]
+        assert payouts == sorted(payouts, reverse=True)
+        assert payouts[0] >= report.quantiles["p99.9"]
+
+    def test_early_stop(self, sold):
+        """신뢰구간이 충분히 좁으면 max_draws 전에 멈춤"""
+        _, index = sold
+
+        report = simulate_liability(index, max_draws=50_000, batch_size=2_000, seed=1, tolerance=1e9)
+
+        assert report.converged
+        assert report.draws < 50_000
+
+    def test_early_stop_independent_of_workers(self, sold):
+        """조기 종료해도 workers 수와 관계없이 같은 결과"""
+        _, index = sold
+
+        single = simulate_liability(index, max_draws=20_000, batch_size=1_000, seed=3, tolerance=1e9)
+        parallel = simulate_liability(index, max_draws=20_000, batch_size=1_000, workers=4, seed=3, tolerance=1e9)
+
+        assert single == parallel
+
+    @pytest.mark.parametrize("option", [{"batch_size": 0}, {"workers": 0}, {"max_draws": 0}])
+    def test_invalid_options(self, sold, option):
+        """0 이하의 추첨 수 / 묶음 크기 / 워커 수는 에러 (무한 반복 방지)"""
+        _, index = sold
+
+        with pytest.raises(ValueError):
+            simulate_liability(index, **option)
+
+    def test_converged_needs_enough_samples(self):
+        """표본이 적으면 꼬리 분위수 신뢰구간을 만들 수 없음"""
+        assert not quantiles_converged(list(range(100)), tolerance=1e9)
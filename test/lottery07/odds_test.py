@@ -0,0 +1,69 @@
+"""
+lottery07 당첨 확률/기대값 테스트
+"""
+
+from fractions import Fraction
+from itertools import combinations
+
+from src.lottery07.odds import RankRule, RuleSet, expected_value, rank_combination_counts, rank_probabilities
+
+
+class TestRankProbabilities:
+    """등수별 확률 테스트"""
+
+    def test_default_rule_set(self):
+        """기본 규칙(일치 개수만)의 조합 수"""
+        counts = rank_combination_counts()
+
+        assert counts["1st"] == 1
+        assert counts["2nd"] == 6 * 39
+        assert counts["3rd"] == 15 * 741
+        assert counts["4th"] == 20 * 9139
+        assert sum(counts.values()) == 8_145_060
+
+    def test_bonus_splits_five_match(self):
+        """5개 일치를 보너스 포함/미포함으로 나눔"""
+        rule_set = RuleSet(
+            ranks=(
+                RankRule(rank="1st", match_count=6),
+                RankRule(rank="2nd", match_count=5, bonus=True),
+                RankRule(rank="3rd", match_count=5, bonus=False),
+            )
+        )
+
+        probabilities = rank_probabilities(rule_set)
+
+        assert probabilities["2nd"] == Fraction(6, 8_145_060)
+        assert probabilities["3rd"] == Fraction(228, 8_145_060)
+        assert sum(probabilities.values()) == 1
+
+    def test_matches_brute_force_on_small_game(self):
+        """작은 게임(10개 중 3개)에서 전수 조사와 같음"""
+        rule_set = RuleSet(
+            number_count=10,
+            pick_count=3,
+            ranks=(RankRule(rank="1st", match_count=3), RankRule(rank="2nd", match_count=2)),
+        )
+        draw = {1, 2, 3}
+        tickets = list(combinations(range(1, 11), 3))
+
+        counts = rank_combination_counts(rule_set)
+
+        assert counts["1st"] == sum(len(draw & set(t)) == 3 for t in tickets)
+        assert counts["2nd"] == sum(len(draw & set(t)) == 2 for t in tickets)
+
+    def test_cached_per_rule_set(self):
+        """같은 규칙 묶음은 한 번만 계산"""
+        assert rank_probabilities(RuleSet()) is rank_probabilities(RuleSet())
+
+
+class TestExpectedValue:
+    """기대값 테스트"""
+
+    def test_expected_value(self):
+        """sum(확률 x 당첨금)"""
+        payouts = {"3rd": 1_500_000, "4th": 50_000}
+
+        expected = Fraction(15 * 741 * 1_500_000 + 20 * 9139 * 50_000, 8_145_060)
+
+        assert expected_value(payouts) == expected
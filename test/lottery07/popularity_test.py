@@ -0,0 +1,129 @@
+"""
+lottery07 인기도 집계 테스트
+"""
+
+import random
+
+import pytest
+
+from src.lottery07.combination import combination_rank
+from src.lottery07.popularity import CountMinSketch, HyperLogLog, PopularityTracker, SpaceSaving
+
+
+class TestExactCounters:
+    """번호/쌍/세 개 묶음 카운터 테스트"""
+
+    def test_counts(self):
+        """티켓에 포함된 번호, 쌍, 세 개 묶음 집계"""
+        tracker = PopularityTracker()
+
+        tracker.update([[1, 2, 3, 4, 5, 6], [1, 2, 3, 40, 41, 42]])
+
+        assert tracker.number_counts[1] == 2
+        assert tracker.number_counts[40] == 1
+        assert tracker.pair_count(1, 2) == 2
+        assert tracker.pair_count(4, 40) == 0
+        assert tracker.triple_count(1, 2, 3) == 2
+        assert tracker.triple_count(40, 41, 42) == 1
+
+    def test_merge(self):
+        """단말기별 집계를 합치면 전체 집계와 같음"""
+        rng = random.Random(5)
+        tickets = [rng.sample(range(1, 46), 6) for _ in range(300)]
+        total, first, second = PopularityTracker(), PopularityTracker(), PopularityTracker()
+        total.update(tickets)
+        first.update(tickets[:100])
+        second.update(tickets[100:])
+
+        first.merge(second)
+
+        assert first.ticket_count == 300
+        assert first.number_counts == total.number_counts
+        assert first.pair_counts == total.pair_counts
+        assert first.triple_counts == total.triple_counts
+
+    def test_update_packed_matches_update(self):
+        """정렬된 6바이트 레코드 열을 한꺼번에 반영해도 티켓마다 반영한 결과와 같음"""
+        rng = random.Random(7)
+        tickets = [sorted(rng.sample(range(1, 46), 6)) for _ in range(500)] + [[1, 2, 3, 4, 5, 6]] * 20
+        looped, packed = PopularityTracker(top_capacity=10), PopularityTracker(top_capacity=10)
+        looped.update(tickets)
+
+        packed.update_packed(b"".join(bytes(numbers) for numbers in tickets))
+
+        assert packed.ticket_count == looped.ticket_count == 520
+        assert packed.number_counts == looped.number_counts
+        assert packed.pair_counts == looped.pair_counts
+        assert packed.triple_counts == looped.triple_counts
+        assert packed.top_combinations.top() == looped.top_combinations.top()
+        assert packed.combination_sketch.rows == looped.combination_sketch.rows
+        assert packed.distinct_combinations.registers == looped.distinct_combinations.registers
+
+    @pytest.mark.parametrize("numbers", [[1, 2, 3, 4, 5], [0, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 46], [1, 2, 3, 4, 5, 5]])
+    def test_update_rejects_invalid_ticket(self, numbers):
+        """번호 6개, 1~45 범위, 중복 검사를 통과하지 못하면 묶음 전체를 반영하지 않음"""
+        tracker = PopularityTracker()
+
+        with pytest.raises(ValueError):
+            tracker.update([[7, 8, 9, 10, 11, 12], numbers])
+        assert tracker.ticket_count == 0
+        assert not any(tracker.number_counts)
+        assert not any(tracker.distinct_combinations.registers)
+
+    @pytest.mark.parametrize(
+        "record",
+        [bytes([1, 2, 3, 4, 5]), bytes([1, 2, 3, 4, 5, 46]), bytes([1, 2, 3, 4, 6, 5]), bytes([1, 2, 3, 4, 5, 5])],
+    )
+    def test_update_packed_rejects_invalid_records(self, record):
+        """길이, 범위, 정렬/중복 검사를 통과하지 못하면 열 전체를 반영하지 않음"""
+        tracker = PopularityTracker()
+
+        with pytest.raises(ValueError):
+            tracker.update_packed(bytes([7, 8, 9, 10, 11, 12]) + record)
+        assert tracker.ticket_count == 0
+        assert not any(tracker.number_counts)
+        assert not any(tracker.distinct_combinations.registers)
+
+
+class TestSketches:
+    """근사 구조 테스트"""
+
+    def test_space_saving_finds_heavy_hitters(self):
+        """자주 나온 항목이 상위에 남음"""
+        summary = SpaceSaving(capacity=10)
+        rng = random.Random(1)
+        for _ in range(2000):
+            summary.add(rng.randrange(10_000))
+        summary.add(7, 500)
+        summary.add(8, 300)
+
+        assert [key for key, _ in summary.top(2)] == [7, 8]
+
+    def test_count_min_never_underestimates(self):
+        """추정값은 실제값 이상"""
+        sketch = CountMinSketch(width=64, depth=4)
+        for key in range(500):
+            sketch.add(key, key % 7 + 1)
+
+        assert all(sketch.estimate(key) >= key % 7 + 1 for key in range(500))
+
+    def test_hyperloglog_estimate(self):
+        """서로 다른 항목 수를 2% 이내로 추정"""
+        first, second = HyperLogLog(), HyperLogLog()
+        for key in range(30_000):
+            first.add(key)
+        for key in range(20_000, 50_000):
+            second.add(key)
+
+        first.merge(second)
+
+        assert abs(first.count() - 50_000) < 1_000
+
+    def test_tracker_top_combinations(self):
+        """가장 많이 팔린 조합"""
+        tracker = PopularityTracker(top_capacity=5)
+        tracker.update([[1, 2, 3, 4, 5, 6]] * 10 + [[7, 8, 9, 10, 11, 12]] * 3)
+
+        assert tracker.top_combinations.top(1) == [(combination_rank([1, 2, 3, 4, 5, 6]), 10)]
+        assert tracker.combination_sketch.estimate(combination_rank([7, 8, 9, 10, 11, 12])) >= 3
+        assert tracker.distinct_combinations.count() == 2
@@ -0,0 +1,54 @@
+"""
+lottery07 당첨금 계산 테스트
+"""
+
+from decimal import Decimal
+
+from src.lottery07.prize import PrizeRule, calculate_payouts, calculate_payouts_many, total_payout
+
+
+class TestCalculatePayouts:
+    """등수별 당첨금 계산 테스트"""
+
+    def test_default_rule_matches_calculate_winning_amount(self):
+        """08.comment.py 규칙과 같은 결과 (판매액 1억원)"""
+        payouts = calculate_payouts(100_000_000, {"1st": 3, "2nd": 7, "3rd": 100, "4th": 5000})
+
+        assert payouts == {"1st": 25_000_000, "2nd": 1_785_000, "3rd": 1_500_000, "4th": 50_000}
+
+    def test_no_winner_pays_nothing(self):
+        """당첨자가 없으면 배분 등수 당첨금은 0"""
+        payouts = calculate_payouts(100_000_000, {"2nd": 1})
+
+        assert payouts["1st"] == 0
+        assert payouts["2nd"] == 12_500_000
+
+    def test_exact_integer_arithmetic(self):
+        """float 오차 없이 천원 단위 버림"""
+        rule = PrizeRule(pool_shares={"1st": Decimal("0.7")}, fixed_prizes={})
+
+        # 0.7 * 30,000,000,000,000,001 을 float으로 계산하면 오차 발생
+        payouts = calculate_payouts(30_000_000_000_000_001, {"1st": 1}, rule)
+
+        assert payouts == {"1st": 21_000_000_000_000_000}
+
+    def test_total_payout(self):
+        """전체 지급액"""
+        counts = {"1st": 1, "3rd": 2}
+
+        assert total_payout(calculate_payouts(100_000_000, counts), counts) == 75_000_000 + 3_000_000
+
+
+class TestCalculatePayoutsMany:
+    """시나리오 일괄 계산 테스트"""
+
+    def test_columns_match_single_calls(self):
+        """시나리오별 단건 계산과 같은 결과"""
+        sales = [100_000_000, 250_000_000, 7_000_000_000]
+        winners = {"1st": [1, 0, 4], "2nd": [3, 2, 9], "3rd": [10, 20, 30], "4th": [0, 0, 0]}
+
+        columns = calculate_payouts_many(sales, winners)
+
+        for index, total_sales in enumerate(sales):
+            single = calculate_payouts(total_sales, {rank: counts[index] for rank, counts in winners.items()})
+            assert {rank: column[index] for rank, column in columns.items()} == single
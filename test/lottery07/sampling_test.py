@@ -0,0 +1,33 @@
+"""
+lottery07 alias 샘플링 테스트
+"""
+
+import random
+
+import pytest
+
+from src.lottery07.sampling import AliasTable
+
+
+class TestAliasTable:
+    """alias 테이블 테스트"""
+
+    def test_sample_follows_weights(self):
+        """뽑힌 비율이 가중치 비율과 비슷함"""
+        table = AliasTable([1, 2, 0, 7])
+        rng = random.Random(0)
+
+        counts = [0] * 4
+        for _ in range(20_000):
+            counts[table.sample(rng)] += 1
+
+        assert counts[2] == 0
+        assert counts[0] / 20_000 == pytest.approx(0.1, abs=0.01)
+        assert counts[3] / 20_000 == pytest.approx(0.7, abs=0.01)
+
+    def test_invalid_weights(self):
+        """빈 가중치 또는 합이 0이면 에러"""
+        with pytest.raises(ValueError):
+            AliasTable([])
+        with pytest.raises(ValueError):
+            AliasTable([0, 0])
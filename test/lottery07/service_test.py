@@ -0,0 +1,168 @@
+"""
+lottery07 HTTP 서비스 테스트
+"""
+
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+
+import pytest
+
+from src.lottery07 import service as service_module
+from src.lottery07.generator import FixedLottoGenerator
+from src.lottery07.model import LottoNumbers
+from src.lottery07.service import LottoService, QuickPickPool, start_server
+
+DRAW = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+
+
+@pytest.fixture
+def service():
+    return LottoService(QuickPickPool(FixedLottoGenerator([6, 5, 4, 3, 2, 1]), size=10), DRAW)
+
+
+def get_json(service, target, method="GET", body=b""):
+    status, payload = service.handle(method, target, body)
+    return status, json.loads(payload)
+
+
+class TestQuickPickPool:
+    """자동 번호 풀 테스트"""
+
+    def test_take_refills_when_short(self):
+        """풀보다 많이 요청하면 필요한 만큼 채움"""
+        pool = QuickPickPool(FixedLottoGenerator([6, 5, 4, 3, 2, 1]), size=4)
+
+        tickets = pool.take(6)
+
+        assert tickets == [b"[1,2,3,4,5,6]"] * 6
+        assert pool.needs_refill
+
+    def test_refill_off_event_loop(self):
+        """백그라운드 채우기는 이벤트 루프가 아닌 스레드에서 번호를 생성"""
+        threads = []
+
+        class RecordingGenerator(FixedLottoGenerator):
+            def generate(self) -> LottoNumbers:
+                threads.append(threading.current_thread())
+                return super().generate()
+
+        pool = QuickPickPool(RecordingGenerator([1, 2, 3, 4, 5, 6]), size=4)
+        pool.take(4)
+        threads.clear()
+
+        async def refill() -> None:
+            pool.refill_in_background()
+            await pool._refilling
+
+        asyncio.run(refill())
+
+        assert len(pool) == 4
+        assert threads and threading.main_thread() not in threads
+
+
+class TestLottoService:
+    """엔드포인트 테스트"""
+
+    def test_health(self, service):
+        """상태와 풀 크기"""
+        assert get_json(service, "/health") == (HTTPStatus.OK, {"status": "ok", "pool": 10})
+
+    def test_quickpick(self, service):
+        """자동 번호 한 장 / 여러 장"""
+        assert get_json(service, "/quickpick") == (HTTPStatus.OK, {"numbers": [1, 2, 3, 4, 5, 6]})
+        status, payload = get_json(service, "/quickpick?count=3")
+        assert status == HTTPStatus.OK
+        assert payload == {"tickets": [[1, 2, 3, 4, 5, 6]] * 3}
+
+    @pytest.mark.parametrize("count", ["0", "1001", "x"])
+    def test_quickpick_invalid_count(self, service, count):
+        """count 범위/형식 오류는 400"""
+        assert get_json(service, f"/quickpick?count={count}")[0] == HTTPStatus.BAD_REQUEST
+
+    def test_check(self, service):
+        """서버의 현재 추첨 또는 요청의 draw와 비교"""
+        assert get_json(service, "/check?numbers=1,2,3,10,11,12") == (
+            HTTPStatus.OK,
+            {"match_count": 3, "rank": "4th"},
+        )
+        assert get_json(service, "/check?numbers=1,2,3,10,11,12&draw=10,11,12,13,14,15")[1]["rank"] == "4th"
+        assert get_json(service, "/check?numbers=1,2,3")[0] == HTTPStatus.BAD_REQUEST
+
+    def test_ticket_checks_keep_draw_cache(self, service):
+        """티켓 번호 문자열이 많아도 추첨 번호 캐시는 밀려나지 않음"""
+        service_module._draw_numbers_mask.cache_clear()
+        get_json(service, "/check?numbers=1,2,3,4,5,6&draw=10,11,12,13,14,15")
+        for first in range(1, 40):
+            for second in range(first + 1, 41):
+                get_json(service, f"/check?numbers={first},{second},41,42,43,44")
+
+        get_json(service, "/check?numbers=1,2,3,4,5,6&draw=10,11,12,13,14,15")
+
+        assert service_module._draw_numbers_mask.cache_info().hits == 1
+
+    def test_check_batch(self, service):
+        """여러 장을 한 번에 확인"""
+        body = json.dumps({"tickets": [[1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 7], [40, 41, 42, 43, 44, 45]]})
+
+        status, payload = get_json(service, "/check", "POST", body.encode())
+
+        assert status == HTTPStatus.OK
+        assert payload["results"] == [
+            {"match_count": 6, "rank": "1st"},
+            {"match_count": 5, "rank": "2nd"},
+            {"match_count": 0, "rank": "fail"},
+        ]
+
+    def test_check_batch_invalid_body(self, service):
+        """본문 형식 오류는 400"""
+        assert get_json(service, "/check", "POST", b"[1, 2]")[0] == HTTPStatus.BAD_REQUEST
+        assert get_json(service, "/check", "POST", b'{"tickets": [[1, 1, 2, 3, 4, 5]]}')[0] == HTTPStatus.BAD_REQUEST
+
+    def test_unknown_route(self, service):
+        """없는 경로는 404, 허용하지 않는 메서드는 405"""
+        assert get_json(service, "/nope")[0] == HTTPStatus.NOT_FOUND
+        assert get_json(service, "/health", "POST")[0] == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+async def exchange(service, raw: bytes) -> bytes:
+    """서버를 띄우고 raw를 보낸 뒤 연결이 닫힐 때까지 응답을 읽음"""
+    server = await start_server(service, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        response = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        return response
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+class TestHttpProtocol:
+    """HTTP/1.1 연결 테스트"""
+
+    def test_pipelined_requests_on_keep_alive(self, service):
+        """한 연결에 이어 보낸 요청에 순서대로 응답하고 Connection: close에서 닫음"""
+        body = json.dumps({"tickets": [[1, 2, 3, 4, 5, 6]]}).encode()
+        raw = (
+            b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+            + b"POST /check HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n" % len(body)
+            + body
+            + b"GET /quickpick HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        )
+
+        response = asyncio.run(exchange(service, raw))
+
+        assert response.count(b"HTTP/1.1 200 OK") == 3
+        assert response.index(b'"status":"ok"') < response.index(b'"rank":"1st"') < response.index(b'"numbers"')
+        assert response.endswith(b'{"numbers":[1,2,3,4,5,6]}')
+
+    def test_malformed_request_closes_connection(self, service):
+        """잘못된 요청 줄은 400 후 연결 종료"""
+        response = asyncio.run(exchange(service, b"garbage\r\n\r\n"))
+
+        assert response.startswith(b"HTTP/1.1 400 Bad Request")
+        assert b"Connection: close" in response
@@ -0,0 +1,73 @@
+"""
+lottery07 스트리밍 정산 테스트
+"""
+
+import io
+
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import WINNER_HEADER, settle_stream
+from src.lottery07.system_ticket import SystemTicket, settle_system_entries
+
+TICKETS = [
+    "1, 2, 3, 4, 5, 6\n",  # 1등
+    "1, 2, 3, 4, 5, 7\n",  # 2등
+    "\n",
+    "1, 2, 3, 40, 41, 42\n",  # 4등
+    "1, 2, 3, 4\n",  # 거부
+    "10, 11, 12, 13, 14, 15\n",  # 낙첨
+]
+
+
+class TestSettleStream:
+    """스트리밍 정산 테스트"""
+
+    def test_rank_counts(self):
+        """등수별 집계"""
+        lotto = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+
+        report = settle_stream(TICKETS, lotto, chunk_size=2)
+
+        assert report.ticket_count == 4
+        assert report.rejected_count == 1
+        assert report.rank_counts == {"fail": 1, "1st": 1, "2nd": 1, "3rd": 0, "4th": 1}
+
+    def test_system_entries_added_to_rank_counts(self):
+        """시스템 티켓의 하위 티켓은 펼치지 않고 등수별 집계와 티켓 수에만 더함"""
+        lotto = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+        entries = [SystemTicket(numbers=[1, 2, 3, 4, 5, 6, 7]), SystemTicket(numbers=[1, 2, 3, 20, 21, 22, 23, 24])]
+        out = io.StringIO()
+
+        report = settle_stream(TICKETS, lotto, out, chunk_size=2, system_entries=entries)
+
+        system_counts = settle_system_entries(entries, lotto)
+        assert report.system_entry_count == 2
+        assert report.ticket_count == 4 + 7 + 28
+        assert report.rank_counts == {
+            rank: count + system_counts[rank]
+            for rank, count in {"fail": 1, "1st": 1, "2nd": 1, "3rd": 0, "4th": 1}.items()
+        }
+        assert len(out.getvalue().splitlines()) == 4
+
+    def test_writes_winner_records(self):
+        """당첨 티켓만 줄 번호와 함께 기록"""
+        lotto = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+        out = io.StringIO()
+
+        settle_stream(TICKETS, lotto, out, chunk_size=4)
+
+        assert out.getvalue().splitlines() == [
+            WINNER_HEADER.strip(),
+            "1,1 2 3 4 5 6,6,1st",
+            "2,1 2 3 4 5 7,5,2nd",
+            "4,1 2 3 40 41 42,3,4th",
+        ]
+
+    def test_reports_stage_throughput(self):
+        """단계별 처리 개수 보고"""
+        lotto = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+
+        report = settle_stream(TICKETS, lotto)
+
+        assert [stage.name for stage in report.stages] == ["read", "validate", "settle", "aggregate"]
+        assert report.stages[0].items == len(TICKETS)
+        assert report.stages[-1].items == 4
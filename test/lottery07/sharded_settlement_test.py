@@ -0,0 +1,55 @@
+"""
+lottery07 병렬 정산 테스트
+"""
+
+import io
+import random
+
+import pytest
+
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import settle_stream
+from src.lottery07.sharded_settlement import read_lines, settle_sharded, split_shards
+
+
+@pytest.fixture
+def ticket_file(tmp_path):
+    rng = random.Random(7)
+    lines = [", ".join(str(n) for n in rng.sample(range(1, 46), 6)) for _ in range(3000)]
+    lines[10] = "1, 2, 3"  # 거부되는 줄
+    lines[20] = ""
+    path = tmp_path / "tickets.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+class TestSplitShards:
+    """샤드 분할 테스트"""
+
+    def test_shards_cover_file_on_line_boundaries(self, ticket_file):
+        """샤드를 이어 붙이면 원래 줄과 같음"""
+        shards = split_shards(ticket_file, 4)
+
+        lines = [line for start, end in shards for line in read_lines(ticket_file, start, end)]
+
+        with open(ticket_file, encoding="utf-8") as file:
+            assert lines == file.read().splitlines()
+
+
+class TestSettleSharded:
+    """병렬 정산 테스트"""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_output_identical_to_serial(self, ticket_file, workers):
+        """직렬 정산과 같은 결과"""
+        lotto = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+        serial_out, sharded_out = io.StringIO(), io.StringIO()
+
+        with open(ticket_file, encoding="utf-8", newline="\n") as tickets:
+            serial = settle_stream(tickets, lotto, serial_out, chunk_size=500)
+        sharded = settle_sharded(ticket_file, lotto, sharded_out, workers=workers, chunk_size=500)
+
+        assert sharded.rank_counts == serial.rank_counts
+        assert sharded.ticket_count == serial.ticket_count == 2998
+        assert sharded.rejected_count == serial.rejected_count == 1
+        assert sharded_out.getvalue() == serial_out.getvalue()
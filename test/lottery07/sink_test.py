@@ -0,0 +1,154 @@
+"""
+lottery07 출력 싱크 테스트
+"""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+
+from src.lottery07.game import play_game, read_user_numbers
+from src.lottery07.generator import FixedLottoGenerator
+from src.lottery07.sink import BufferedTextSink, CallableSink, NullSink, OutputSink, RecordSink, as_sink
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _play(sink, user_input: str = "1, 2, 3, 10, 11, 12"):
+    generator = FixedLottoGenerator([1, 2, 3, 4, 5, 6])
+    return play_game(generator, input_func=Mock(return_value=user_input), print_func=sink)
+
+
+class TestAsSink:
+    """print_func 호환 테스트"""
+
+    def test_wraps_callable(self):
+        """함수는 CallableSink로 감싸 한 줄씩 호출"""
+        mock_print = Mock()
+        sink = as_sink(mock_print)
+
+        assert isinstance(sink, CallableSink)
+        sink.write_line("hello")
+        mock_print.assert_called_once_with("hello")
+
+    def test_keeps_sink(self):
+        """싱크는 그대로 사용"""
+        sink = NullSink()
+        assert as_sink(sink) is sink
+
+    def test_write_line_required(self):
+        """write_line을 구현하지 않은 싱크는 만들 수 없음"""
+
+        class IncompleteSink(OutputSink):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink()
+
+    def test_play_game_with_callable_prints_four_lines(self):
+        """함수를 넘기면 예전처럼 네 줄을 출력"""
+        mock_print = Mock()
+        _play(mock_print)
+
+        lines = [call.args[0] for call in mock_print.call_args_list]
+        assert [line.split(":")[0] for line in lines] == ["result", "mine", "match", "rank"]
+
+
+class TestBufferedTextSink:
+    """버퍼 텍스트 싱크 테스트"""
+
+    def test_buffers_until_flush(self):
+        """기준을 넘기 전에는 쓰지 않음"""
+        out = io.StringIO()
+        sink = BufferedTextSink(out, clock=FakeClock())
+
+        sink.write_line("a")
+        sink.write_line("b")
+        assert out.getvalue() == ""
+
+        sink.flush()
+        assert out.getvalue() == "a\nb\n"
+
+    def test_flushes_on_size(self):
+        """buffer_size를 넘으면 한 번에 씀"""
+        out = Mock()
+        sink = BufferedTextSink(out, buffer_size=10, clock=FakeClock())
+
+        sink.write_line("12345")
+        out.write.assert_not_called()
+        sink.write_line("67890")
+        out.write.assert_called_once_with("12345\n67890\n")
+
+    def test_flushes_on_interval(self):
+        """첫 대기 줄부터 flush_interval이 지나면 다음 쓰기에서 씀"""
+        out = io.StringIO()
+        clock = FakeClock()
+        sink = BufferedTextSink(out, flush_interval=1.0, clock=clock)
+
+        sink.write_line("a")
+        clock.now = 0.5
+        sink.write_line("b")
+        assert out.getvalue() == ""
+
+        clock.now = 1.0
+        sink.write_line("c")
+        assert out.getvalue() == "a\nb\nc\n"
+
+    def test_close_flushes(self):
+        """with 블록을 나가면 남은 내용을 씀"""
+        out = io.StringIO()
+        with BufferedTextSink(out, clock=FakeClock()) as sink:
+            _play(sink)
+        assert out.getvalue().splitlines() == [
+            "result: [1, 2, 3, 4, 5, 6]",
+            "mine:   [1, 2, 3, 10, 11, 12]",
+            "match:  3",
+            "rank:   4th",
+        ]
+
+    def test_many_games_single_write(self):
+        """여러 게임의 결과를 write 한 번으로 모음"""
+        out = Mock()
+        sink = BufferedTextSink(out, clock=FakeClock())
+        for _ in range(100):
+            _play(sink)
+        sink.flush()
+
+        out.write.assert_called_once()
+        assert out.write.call_args.args[0].count("rank:   4th\n") == 100
+
+
+class TestRecordSink:
+    """구조화 레코드 싱크 테스트"""
+
+    def test_keeps_results_and_messages(self):
+        """결과는 모델 그대로, 오류 메시지는 문자열로 보관"""
+        sink = RecordSink()
+        generator = FixedLottoGenerator([1, 2, 3, 4, 5, 6])
+        inputs = Mock(side_effect=["a, b", "1, 2, 3, 4, 5, 6"])
+
+        result = play_game(generator, input_func=inputs, print_func=sink)
+
+        assert sink.results == [result]
+        assert result.rank == "1st"
+        assert sink.messages == ["숫자만 입력해 주세요."]
+
+
+class TestNullSink:
+    """출력 없는 싱크 테스트"""
+
+    def test_discards(self):
+        """결과는 그대로 반환되고 출력은 버림"""
+        result = _play(NullSink())
+        assert result.match_count == 3
+
+    def test_read_user_numbers(self):
+        """read_user_numbers에도 싱크를 넘길 수 있음"""
+        numbers = read_user_numbers(input_func=Mock(return_value="1,2,3,4,5,6"), print_func=NullSink())
+        assert numbers.numbers == [1, 2, 3, 4, 5, 6]
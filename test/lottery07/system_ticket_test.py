@@ -0,0 +1,127 @@
+"""
+lottery07 시스템 티켓 테스트
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+from pydantic import ValidationError
+
+from src.lottery07.const import RANK_NAMES
+from src.lottery07.game import count_match, get_rank
+from src.lottery07.model import LottoNumbers
+from src.lottery07.odds import RankRule, RuleSet
+from src.lottery07.system_ticket import (
+    SystemTicket,
+    settle_system_entries,
+    system_rank_counts,
+    system_rank_histogram,
+)
+from src.lottery07.ticket import to_mask
+
+LOTTO = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+BONUS = 12
+
+BONUS_RULE_SET = RuleSet(
+    ranks=(
+        RankRule(rank="1st", match_count=6),
+        RankRule(rank="2nd", match_count=5, bonus=True),
+        RankRule(rank="3rd", match_count=5, bonus=False),
+        RankRule(rank="4th", match_count=4),
+        RankRule(rank="5th", match_count=3),
+    )
+)
+
+
+def expand_rank_counts(numbers, rule_set=None):
+    """하위 티켓을 모두 펼쳐 센 등수별 개수"""
+    counts = {}
+    for sub_ticket in combinations(numbers, 6):
+        match_count = count_match(LOTTO, LottoNumbers(numbers=list(sub_ticket)))
+        if rule_set is None:
+            rank = get_rank(match_count)
+        else:
+            rank = next(
+                (
+                    rule.rank
+                    for rule in rule_set.ranks
+                    if rule.match_count == match_count and rule.bonus in (None, BONUS in sub_ticket)
+                ),
+                "fail",
+            )
+        counts[rank] = counts.get(rank, 0) + 1
+    return counts
+
+
+@pytest.fixture(scope="module")
+def entries():
+    rng = random.Random(5)
+    result = []
+    for size in range(7, 13):
+        for keep in range(7):
+            rest = rng.sample([n for n in range(1, 46) if n not in LOTTO.numbers], size - keep)
+            result.append(SystemTicket(numbers=rng.sample(LOTTO.numbers, keep) + rest))
+    return result
+
+
+class TestSystemTicket:
+    """SystemTicket 모델 테스트"""
+
+    def test_ticket_count(self):
+        """포함된 하위 티켓 수는 C(m, 6)"""
+        assert SystemTicket(numbers=list(range(1, 8))).ticket_count == 7
+        assert SystemTicket(numbers=list(range(1, 13))).ticket_count == 924
+
+    @pytest.mark.parametrize(
+        "numbers", [list(range(1, 7)), list(range(1, 14)), [1, 1, 2, 3, 4, 5, 6], [0, *range(1, 7)]]
+    )
+    def test_invalid_numbers(self, numbers):
+        """번호 개수, 중복, 범위 오류 거부"""
+        with pytest.raises(ValidationError):
+            SystemTicket(numbers=numbers)
+
+
+class TestSystemRankCounts:
+    """시스템 티켓 닫힌 식 정산 테스트"""
+
+    def test_matches_expansion(self, entries):
+        """하위 티켓을 펼쳐 센 결과와 같음"""
+        for entry in entries:
+            counts = {rank: count for rank, count in system_rank_counts(entry, LOTTO).items() if count}
+            assert counts == expand_rank_counts(entry.numbers)
+
+    @pytest.mark.parametrize("with_bonus", [True, False])
+    def test_bonus_rules_match_expansion(self, entries, with_bonus):
+        """보너스 조건이 있는 등수 규칙도 펼친 결과와 같음 (보너스 번호를 고른 티켓/고르지 않은 티켓)"""
+        for entry in entries:
+            if with_bonus:
+                numbers = entry.numbers if BONUS in entry.numbers else [*entry.numbers[:-1], BONUS]
+            else:
+                spare = next(n for n in range(1, 46) if n not in entry.numbers and n not in (BONUS, *LOTTO.numbers))
+                numbers = [spare if number == BONUS else number for number in entry.numbers]
+            entry = SystemTicket(numbers=numbers)
+            counts = system_rank_counts(entry, LOTTO, BONUS, BONUS_RULE_SET)
+            assert {rank: count for rank, count in counts.items() if count} == expand_rank_counts(
+                numbers, BONUS_RULE_SET
+            )
+
+    def test_bonus_required(self, entries):
+        """보너스 조건 규칙에 보너스 번호가 없으면 오류"""
+        with pytest.raises(ValueError):
+            system_rank_counts(entries[0], LOTTO, rule_set=BONUS_RULE_SET)
+
+    def test_bonus_in_draw_rejected(self, entries):
+        """당첨 번호와 겹치는 보너스 번호는 오류"""
+        with pytest.raises(ValueError):
+            system_rank_counts(entries[0], LOTTO, LOTTO.numbers[0], BONUS_RULE_SET)
+
+
+class TestSystemSettlement:
+    """시스템 티켓 일괄 정산 테스트"""
+
+    def test_histogram_matches_settle(self, entries):
+        """비트마스크 히스토그램과 모델 기반 합계가 같음"""
+        histogram = system_rank_histogram((to_mask(entry.numbers) for entry in entries), LOTTO)
+        assert dict(zip(RANK_NAMES, histogram)) == settle_system_entries(entries, LOTTO)
+        assert sum(histogram) == sum(entry.ticket_count for entry in entries)
@@ -0,0 +1,103 @@
+"""
+lottery07 판매 티켓 보관소 테스트
+"""
+
+import os
+import random
+from array import array
+
+import pytest
+
+from src.lottery07.combination import combination_rank
+from src.lottery07.ticket import TicketBatch, to_mask
+from src.lottery07.ticket_archive import RECORD, TicketArchive, TicketArchiveWriter
+
+
+def _batch(first_id: int, count: int, seed: int, step: int = 3) -> tuple[TicketBatch, list[list[int]]]:
+    rng = random.Random(seed)
+    tickets = [sorted(rng.sample(range(1, 46), 6)) for _ in range(count)]
+    ids = array("Q", range(first_id, first_id + count * step, step))
+    return TicketBatch(ids, array("Q", (to_mask(numbers) for numbers in tickets))), tickets
+
+
+def _write_draws(directory: str, draws: int = 5, per_draw: int = 700, segment_records: int = 1_000) -> dict:
+    """회차마다 per_draw장, id는 3씩 건너뜀 -> {티켓 id: (회차, 번호)}"""
+    expected = {}
+    with TicketArchiveWriter(directory, segment_records=segment_records) as writer:
+        for draw_no in range(1, draws + 1):
+            batch, tickets = _batch(1 + (draw_no - 1) * per_draw * 3, per_draw, seed=draw_no)
+            writer.append_batch(draw_no, batch, terminal_id=draw_no * 10)
+            expected.update((ticket_id, (draw_no, numbers)) for ticket_id, numbers in zip(batch.ids, tickets))
+    return expected
+
+
+class TestTicketArchive:
+    """보관소 기록 / 조회 테스트"""
+
+    def test_get_by_id(self, tmp_path):
+        """여러 세그먼트에 걸친 id 조회 + 없는 id"""
+        expected = _write_draws(str(tmp_path))
+        with TicketArchive(str(tmp_path)) as archive:
+            assert len(archive) == len(expected)
+            for ticket_id, (draw_no, numbers) in expected.items():
+                record = archive.get(ticket_id)
+                assert (record.ticket_id, record.draw_no, record.terminal_id) == (ticket_id, draw_no, draw_no * 10)
+                assert record.combination == combination_rank(numbers)
+                assert record.numbers().numbers == numbers
+            assert archive.get(0) is None
+            assert archive.get(2) is None
+            assert archive.get(max(expected) + 1) is None
+
+    def test_sealed_segments_have_sparse_index(self, tmp_path):
+        """가득 찬 세그먼트만 희소 인덱스 파일이 있음"""
+        _write_draws(str(tmp_path))
+        names = sorted(os.listdir(tmp_path))
+        assert [name for name in names if name.endswith(".rec")] == [f"segment-{n:08d}.rec" for n in range(1, 5)]
+        assert [name for name in names if name.endswith(".idx")] == [f"segment-{n:08d}.idx" for n in range(1, 4)]
+
+    def test_scan_draw(self, tmp_path):
+        """회차 조회는 세그먼트 경계를 넘어 그 회차 티켓만 순서대로"""
+        expected = _write_draws(str(tmp_path))
+        with TicketArchive(str(tmp_path)) as archive:
+            for draw_no in range(1, 6):
+                ids = [record.ticket_id for record in archive.scan_draw(draw_no)]
+                assert ids == [ticket_id for ticket_id, (draw, _) in expected.items() if draw == draw_no]
+            assert list(archive.scan_draw(6)) == []
+
+    def test_close_after_abandoned_scan(self, tmp_path):
+        """회차 순회를 중간에 멈춘 채로도 보관소를 닫을 수 있음"""
+        _write_draws(str(tmp_path))
+        archive = TicketArchive(str(tmp_path))
+        records = archive.scan_draw(2)
+        next(records)
+
+        archive.close()
+
+    def test_reopen_appends_and_drops_partial_record(self, tmp_path):
+        """다시 열면 마지막 세그먼트에 이어 쓰고, 끊긴 레코드는 버림"""
+        directory = str(tmp_path)
+        with TicketArchiveWriter(directory, segment_records=1_000) as writer:
+            writer.append(1, 1, 0)
+        with open(tmp_path / "segment-00000001.rec", "ab") as file:
+            file.write(b"\x00" * (RECORD.size - 1))
+
+        with TicketArchiveWriter(directory, segment_records=1_000) as writer:
+            assert writer.last_id == 1
+            writer.append(5, 2, combination_rank([1, 2, 3, 4, 5, 6]), terminal_id=3)
+
+        assert os.path.getsize(tmp_path / "segment-00000001.rec") == 2 * RECORD.size
+        with TicketArchive(directory) as archive:
+            assert archive.get(5).numbers().numbers == [1, 2, 3, 4, 5, 6]
+            assert [record.ticket_id for record in archive.scan_draw(2)] == [5]
+
+    def test_order_enforced(self, tmp_path):
+        """id는 증가, 회차는 감소 불가"""
+        with TicketArchiveWriter(str(tmp_path)) as writer:
+            writer.append(10, 2, 0)
+            with pytest.raises(ValueError):
+                writer.append(10, 2, 0)
+            with pytest.raises(ValueError):
+                writer.append(11, 1, 0)
+            batch, _ = _batch(20, 3, seed=1, step=-1)
+            with pytest.raises(ValueError):
+                writer.append_batch(2, batch)
@@ -0,0 +1,129 @@
+"""
+lottery07 티켓 / 결과 저장소 테스트
+"""
+
+import random
+from array import array
+
+import pytest
+
+from src.lottery07.game import count_match, get_rank
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import TicketBatch, to_mask
+from src.lottery07.ticket_store import TicketStore, winning_combinations
+
+LOTTO = LottoNumbers(numbers=[3, 9, 17, 25, 33, 41])
+
+
+def _random_tickets(count: int, seed: int = 1) -> list[LottoNumbers]:
+    rng = random.Random(seed)
+    return [LottoNumbers(numbers=sorted(rng.sample(range(1, 46), 6))) for _ in range(count)]
+
+
+class TestWinningCombinations:
+    """당첨 조합 열거 테스트"""
+
+    def test_counts_per_match(self):
+        """일치 개수별 조합 수 = C(6, k) * C(39, 6 - k)"""
+        counts = {}
+        for _, match_count, _ in winning_combinations(LOTTO):
+            counts[match_count] = counts.get(match_count, 0) + 1
+        assert counts == {6: 1, 5: 234, 4: 11_115, 3: 182_780}
+
+
+class TestTicketStore:
+    """저장소 적재 / 정산 / 조회 테스트"""
+
+    def test_add_tickets_assigns_ids(self, tmp_path):
+        """id는 1부터 이어서 매김"""
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            first = store.add_tickets(1, _random_tickets(3))
+            second = store.add_tickets(1, _random_tickets(2, seed=2))
+        assert first == range(1, 4)
+        assert second == range(4, 6)
+
+    def test_reopen_continues_ids(self, tmp_path):
+        """다시 열어도 마지막 id 다음부터"""
+        path = str(tmp_path / "tickets.db")
+        with TicketStore(path) as store:
+            store.add_tickets(1, _random_tickets(3))
+        with TicketStore(path) as store:
+            assert store.add_tickets(2, _random_tickets(1)) == range(4, 5)
+            assert store.ticket_count() == 4
+            assert store.ticket_count(2) == 1
+
+    def test_add_batches_in_one_call(self, tmp_path):
+        """여러 회차 / 단말기의 묶음을 한 번에 추가하고 다음 id는 가장 큰 id + 1"""
+        tickets = _random_tickets(5)
+        masks = array("Q", (to_mask(ticket.numbers) for ticket in tickets))
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            store.add_batches(
+                [
+                    (1, TicketBatch(array("Q", [1, 2, 3]), masks[:3]), 7),
+                    (2, TicketBatch(array("Q", [10, 11]), masks[3:]), 8),
+                ]
+            )
+            assert store.next_ticket_id == 12
+            assert [numbers for _, numbers in store.tickets_by_terminal(7)] == tickets[:3]
+            assert [ticket_id for ticket_id, _ in store.tickets_by_draw(2)] == [10, 11]
+
+    def test_settle_matches_count_match(self, tmp_path):
+        """저장된 결과가 count_match / get_rank와 같음"""
+        tickets = _random_tickets(3_000) + [LOTTO, LottoNumbers(numbers=[3, 9, 17, 25, 33, 45])]
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            ids = store.add_tickets(1, tickets)
+            counts = store.settle_draw(1, LOTTO)
+
+            expected = dict.fromkeys(counts, 0)
+            for ticket_id, ticket in zip(ids, tickets):
+                match_count = count_match(LOTTO, ticket)
+                expected[get_rank(match_count)] += 1
+                result = store.result(ticket_id)
+                assert result.user_numbers.numbers == ticket.numbers
+                assert result.match_count == match_count
+                assert result.rank == get_rank(match_count)
+            assert counts == expected
+
+            (ticket_id, first), *_ = store.results_by_rank(1, "1st")
+            assert ticket_id == ids[-2]
+            assert first.lotto_numbers.numbers == LOTTO.numbers
+            assert [result.rank for _, result in store.results_by_rank(1, "2nd")] == ["2nd"] * counts["2nd"]
+
+    def test_settle_again_replaces_results(self, tmp_path):
+        """같은 회차를 다시 정산하면 이전 결과를 대체"""
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            store.add_tickets(1, [LOTTO])
+            store.settle_draw(1, LottoNumbers(numbers=[1, 2, 3, 4, 5, 6]))
+            assert store.settle_draw(1, LOTTO)["1st"] == 1
+            assert store.rank_counts(1)["fail"] == 0
+
+    def test_queries(self, tmp_path):
+        """단말기 / 회차 / 조합별 조회"""
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            store.add_tickets(1, [LOTTO, LOTTO], terminal_id=7)
+            store.add_tickets(2, _random_tickets(5), terminal_id=7)
+            store.add_tickets(1, _random_tickets(4, seed=3), terminal_id=8)
+
+            assert [ticket_id for ticket_id, _ in store.tickets_by_terminal(7)] == list(range(1, 8))
+            assert [ticket_id for ticket_id, _ in store.tickets_by_terminal(7, draw_no=1)] == [1, 2]
+            assert [ticket_id for ticket_id, _ in store.tickets_by_draw(1)] == [1, 2, 8, 9, 10, 11]
+            assert store.tickets_by_combination(1, LOTTO) == [1, 2]
+            assert store.tickets_by_combination(2, LOTTO) == []
+            assert store.result(1) is None  # 정산 전
+
+    def test_bulk_load_batch(self, tmp_path):
+        """bulk_load 안에서 파싱된 배치를 적재해도 인덱스 조회가 동작"""
+        tickets = _random_tickets(1_000)
+        batch = TicketBatch(array("Q", range(101, 1_101)), array("Q", (to_mask(t.numbers) for t in tickets)))
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            with store.bulk_load():
+                store.add_batch(3, batch, terminal_id=2)
+            assert store.ticket_count(3) == 1_000
+            assert store.tickets_by_combination(3, tickets[10])[0] == 111
+            assert store.add_tickets(3, [LOTTO]) == range(1_101, 1_102)
+
+    def test_fail_rank_not_queryable(self, tmp_path):
+        """낙첨은 저장하지 않으므로 등수 조회 불가"""
+        with TicketStore(str(tmp_path / "tickets.db")) as store:
+            with pytest.raises(ValueError):
+                list(store.results_by_rank(1, "fail"))
@@ -0,0 +1,212 @@
+"""
+lottery07 티켓 비트마스크 테스트
+"""
+
+import io
+import random
+
+import pytest
+
+from src.lottery07.game import count_match, count_match_many, read_user_numbers
+from src.lottery07.model import LottoNumbers
+from src.lottery07.ticket import (
+    TicketBatch,
+    mask_to_numbers,
+    parse_ticket_buffer,
+    parse_ticket_file,
+    parse_ticket_line,
+    parse_ticket_records,
+    to_mask,
+)
+
+# 한 줄씩 검사하는 경로로 넘어가야 하는 줄들
+IRREGULAR_LINES = [
+    "1 2, 3, 4, 5, 6, 7",  # 숫자 사이 공백
+    "1, 1, 2, 3, 4, 5",  # 중복
+    "",
+    "   \t",
+    "+3, 4, 5, 6, 7, 8",  # int()는 허용
+    "46, 1, 2, 3, 4, 5",  # 범위 초과
+    "a, b",
+    "1, 2, 3, 4, 5",  # 개수 부족
+    "01,02,03,04,05,06\r",  # 앞자리 0, CRLF
+    "\uff13, 4, 5, 6, 7, 8",  # 전각 숫자 (int()는 허용)
+    "1_0, 2, 3, 4, 5, 6",  # int()는 밑줄 허용
+]
+
+
+def parse_line_by_line(lines):
+    """parse_ticket_line()을 한 줄씩 적용한 기준 결과"""
+    ids, masks, errors = [], [], []
+    for ticket_id, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            masks.append(parse_ticket_line(line))
+            ids.append(ticket_id)
+        except ValueError as error:
+            errors.append((ticket_id, str(error)))
+    return ids, masks, errors
+
+
+def read_like_game(line):
+    """read_user_numbers() + LottoNumbers 기준 마스크 (거부하면 None)"""
+    inputs = iter([line])
+
+    def input_func(prompt):
+        try:
+            return next(inputs)
+        except StopIteration:
+            raise EOFError from None
+
+    try:
+        return to_mask(read_user_numbers(input_func, lambda text: None).numbers)
+    except EOFError:
+        return None
+
+
+@pytest.fixture(scope="module")
+def mixed_lines():
+    rng = random.Random(11)
+    lines = [", ".join(map(str, rng.sample(range(1, 46), 6))) for _ in range(5_000)]
+    for _ in range(60):
+        lines[rng.randrange(len(lines))] = rng.choice(IRREGULAR_LINES)
+    return lines
+
+
+class TestTicketMask:
+    """비트마스크 변환 테스트"""
+
+    def test_mask_round_trip(self):
+        """마스크 -> 번호 복원"""
+        assert mask_to_numbers(to_mask([45, 1, 20, 30, 40, 10])) == [1, 10, 20, 30, 40, 45]
+
+    def test_count_match_many_equals_count_match(self):
+        """count_match와 같은 결과"""
+        lotto = LottoNumbers(numbers=[1, 10, 20, 30, 40, 45])
+        users = [[1, 10, 20, 25, 35, 44], [1, 10, 20, 30, 40, 45], [2, 3, 4, 5, 6, 7]]
+
+        counts = count_match_many([to_mask(numbers) for numbers in users], lotto)
+
+        assert list(counts) == [count_match(lotto, LottoNumbers(numbers=numbers)) for numbers in users]
+
+
+class TestParseTicketLine:
+    """티켓 한 줄 파싱 테스트"""
+
+    def test_valid_line(self):
+        """공백이 섞인 정상 입력"""
+        assert parse_ticket_line(" 3, 11,19 , 27, 38, 44\n") == to_mask([3, 11, 19, 27, 38, 44])
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "1, 2, 3, 4, 5",  # 개수 부족
+            "1, 2, 3, 4, 5, 6, 7",  # 개수 초과
+            "0, 2, 3, 4, 5, 6",  # 범위 미만
+            "1, 2, 3, 4, 5, 46",  # 범위 초과
+            "1, 1, 3, 4, 5, 6",  # 중복
+            "a, 2, 3, 4, 5, 6",  # 숫자 아님
+            "",
+        ],
+    )
+    def test_invalid_lines_rejected(self, line):
+        """read_user_numbers가 거부하는 입력은 모두 거부"""
+        with pytest.raises(ValueError):
+            parse_ticket_line(line)
+
+    @pytest.mark.parametrize("pad", [" ", "\t", "\v", "\f", "\x1c", "\x1d", "\x1e", "\x1f", "\x85", "\xa0", "\u3000"])
+    def test_padding_matches_read_user_numbers(self, pad):
+        """str.strip()이 지우는 공백으로 둘러싼 줄은 한 줄 파싱, 대량 파싱, read_user_numbers 모두 같은 결과"""
+        line = f"{pad}3{pad},11,{pad}19, 27{pad},38,44{pad}"
+        expected = read_like_game(line)
+
+        batch, errors = parse_ticket_buffer(f"{line}\n".encode("utf-8"))
+
+        assert expected == to_mask([3, 11, 19, 27, 38, 44])
+        assert parse_ticket_line(line) == expected
+        assert (list(batch.masks), errors) == ([expected], [])
+
+
+class TestParseTicketBuffer:
+    """대량 파싱 테스트"""
+
+    def test_matches_line_by_line(self, mixed_lines):
+        """한 줄씩 파싱한 결과와 id/마스크/거부 사유가 모두 같음"""
+        batch, errors = parse_ticket_buffer("\n".join(mixed_lines).encode("utf-8"))
+
+        assert (list(batch.ids), list(batch.masks), errors) == parse_line_by_line(mixed_lines)
+
+    @pytest.mark.parametrize("line", IRREGULAR_LINES)
+    def test_irregular_line(self, line):
+        """불규칙한 줄 하나도 같은 기준으로 처리"""
+        lines = ["1, 2, 3, 4, 5, 6", line, "7, 8, 9, 10, 11, 12"]
+        batch, errors = parse_ticket_buffer(("\n".join(lines) + "\n").encode("utf-8"))
+
+        assert (list(batch.ids), list(batch.masks), errors) == parse_line_by_line(lines)
+
+    def test_first_id(self):
+        """티켓 id는 first_id부터 시작하는 줄 번호"""
+        batch, errors = parse_ticket_buffer(b"1,2,3,4,5,6\n\n1,2,3\n7,8,9,10,11,12", first_id=100)
+
+        assert list(batch.ids) == [100, 103]
+        assert [ticket_id for ticket_id, _ in errors] == [102]
+
+
+class TestParseTicketFile:
+    """청크 단위 파일 파싱 테스트"""
+
+    def test_blocks_keep_line_ids(self, mixed_lines):
+        """작은 블록으로 나눠 읽어도 한 번에 파싱한 결과와 같음"""
+        file = io.BytesIO("\n".join(mixed_lines).encode("utf-8"))
+
+        ids, masks, errors = [], [], []
+        for batch, block_errors in parse_ticket_file(file, block_size=1_000):
+            ids += batch.ids
+            masks += batch.masks
+            errors += block_errors
+
+        assert (ids, masks, errors) == parse_line_by_line(mixed_lines)
+
+
+class TestTicketBatch:
+    """티켓 배치 테스트"""
+
+    def test_append(self):
+        """id와 마스크를 열 단위로 저장"""
+        batch = TicketBatch()
+        batch.append(7, to_mask([1, 2, 3, 4, 5, 6]))
+
+        assert len(batch) == 1
+        assert batch.ids[0] == 7
+        assert mask_to_numbers(batch.masks[0]) == [1, 2, 3, 4, 5, 6]
+
+
+class TestParseTicketRecords:
+    """바이너리 티켓 레코드 파싱 테스트"""
+
+    def test_valid_records(self):
+        """정렬되지 않은 티켓도 받고, 번호는 정렬해 6바이트씩 돌려줌"""
+        data = bytes([1, 2, 3, 4, 5, 6, 45, 7, 30, 8, 9, 10])
+        batch, packed, errors = parse_ticket_records(data, first_id=10)
+
+        assert list(batch.ids) == [10, 11]
+        assert list(batch.masks) == [to_mask([1, 2, 3, 4, 5, 6]), to_mask([7, 8, 9, 10, 30, 45])]
+        assert packed == bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 30, 45])
+        assert errors == []
+
+    def test_invalid_records(self):
+        """범위 밖 / 중복 번호 티켓은 사유와 함께 거부하고 나머지는 통과"""
+        data = bytes([1, 2, 3, 4, 5, 46, 1, 1, 2, 3, 4, 5, 0, 2, 3, 4, 5, 6, 40, 41, 42, 43, 44, 45])
+        batch, packed, errors = parse_ticket_records(data)
+
+        assert list(batch.ids) == [4]
+        assert packed == bytes([40, 41, 42, 43, 44, 45])
+        assert [ticket_id for ticket_id, _ in errors] == [1, 2, 3]
+        assert "중복" in errors[1][1]
+        assert "범위" in errors[0][1] and "범위" in errors[2][1]
+
+    def test_invalid_length(self):
+        """길이가 6의 배수가 아니면 에러"""
+        with pytest.raises(ValueError):
+            parse_ticket_records(bytes(7))
@@ -0,0 +1,135 @@
+"""
+lottery07 휠(커버링 디자인) 테스트
+"""
+
+import math
+import os
+from itertools import combinations, count
+from types import SimpleNamespace
+
+import pytest
+
+from src.lottery07 import wheel
+from src.lottery07.wheel import build_wheel, wheel_tickets
+
+
+def is_covering(tickets, pool_size, guarantee, drawn):
+    """풀에서 drawn개가 나오는 모든 경우에 guarantee개 이상 맞는 티켓이 있는지"""
+    return all(
+        any(len(set(ticket) & set(target)) >= guarantee for ticket in tickets)
+        for target in combinations(range(1, pool_size + 1), drawn)
+    )
+
+
+class TestBuildWheel:
+    """휠 탐색 테스트"""
+
+    @pytest.mark.parametrize("pool_size, guarantee, drawn", [(6, 3, 3), (10, 3, 3), (12, 3, 4), (12, 4, 4)])
+    def test_guarantee_holds(self, pool_size, guarantee, drawn):
+        """모든 drawn개 경우를 덮음"""
+        tickets = build_wheel(pool_size, guarantee, drawn)
+
+        assert is_covering(tickets, pool_size, guarantee, drawn)
+        assert all(len(set(ticket)) == 6 and set(ticket) <= set(range(1, pool_size + 1)) for ticket in tickets)
+
+    def test_pool_of_six_needs_one_ticket(self):
+        """풀이 6개면 티켓 한 장"""
+        assert build_wheel(6, 3) == [(1, 2, 3, 4, 5, 6)]
+
+    def test_known_small_covering(self):
+        """C(10, 6, 3)는 탐욕+국소 탐색으로 알려진 크기(10장)에 근접"""
+        assert len(build_wheel(10, 3)) <= 12
+
+    @pytest.mark.parametrize("guarantee", [3, 4])
+    def test_local_search_does_not_grow_wheel(self, guarantee):
+        """풀 20개: 국소 탐색 결과는 탐욕+가지치기 결과보다 크지 않고 보장도 유지"""
+        greedy = wheel._search_wheel(20, guarantee, guarantee, 2_000, 1, swaps=0)
+        searched = wheel._search_wheel(20, guarantee, guarantee, 2_000, 1)
+
+        assert len(searched) <= len(greedy)
+        assert is_covering(searched, 20, guarantee, guarantee)
+
+    def test_local_search_shrinks_greedy_wheel(self):
+        """C(11, 6, 3): 탐욕 결과를 국소 탐색이 줄임"""
+        greedy = wheel._search_wheel(11, 3, 3, 50_000, 1, swaps=0)
+        searched = wheel._search_wheel(11, 3, 3, 50_000, 1)
+
+        assert len(searched) < len(greedy)
+        assert is_covering(searched, 11, 3, 3)
+
+    @pytest.mark.parametrize("guarantee, max_tickets", [(3, 40), (4, 155)])
+    def test_pool_of_twenty_drawn_six_stops_at_deadline(self, monkeypatch, guarantee, max_tickets):
+        """풀 20개, drawn=6: 시작하자마자 시간 예산이 지나도 덮이지 않은 대상이 없음"""
+        calls = count()
+        # 첫 호출(deadline 계산) 뒤로는 항상 시간 예산이 지난 시계
+        monkeypatch.setattr(wheel, "time", SimpleNamespace(monotonic=lambda: 0.0 if next(calls) == 0 else math.inf))
+
+        tickets = wheel._search_wheel(20, 6, guarantee, wheel.DEFAULT_MAX_CANDIDATES, wheel.DEFAULT_ATTEMPTS)
+
+        assert len(tickets) <= max_tickets
+        assert is_covering(tickets, 20, guarantee, 6)
+
+    def test_sampled_candidates(self):
+        """후보를 표본으로만 뽑아도 보장은 유지"""
+        tickets = build_wheel(14, 3, max_candidates=200)
+
+        assert is_covering(tickets, 14, 3, 3)
+
+    def test_cache_key_includes_search_options(self):
+        """탐색 옵션이 다르면 캐시를 따로 쓰고, 반환 목록을 고쳐도 캐시는 그대로"""
+        sampled = build_wheel(14, 3, max_candidates=200, attempts=1)
+        wider = build_wheel(14, 3, max_candidates=300, attempts=1)
+
+        assert (14, 3, 3, 200, 1, wheel.DEFAULT_TIME_LIMIT) in wheel._wheels
+        assert (14, 3, 3, 300, 1, wheel.DEFAULT_TIME_LIMIT) in wheel._wheels
+        assert is_covering(wider, 14, 3, 3)
+
+        expected = list(sampled)
+        sampled.clear()
+        assert build_wheel(14, 3, max_candidates=200, attempts=1) == expected
+
+    @pytest.mark.parametrize(
+        "pool_size, guarantee, drawn",
+        [(5, 3, 3), (10, 0, 3), (10, 4, 3), (10, 3, 7), (25, 3, 6), (45, 4, 6)],
+    )
+    def test_invalid_arguments(self, pool_size, guarantee, drawn):
+        """풀 크기, 보장 조건, 대상 수(MAX_TARGETS) 오류"""
+        with pytest.raises(ValueError):
+            build_wheel(pool_size, guarantee, drawn)
+
+    def test_invalid_time_limit(self):
+        """시간 예산은 양수"""
+        with pytest.raises(ValueError):
+            build_wheel(10, 3, time_limit=0)
+
+    def test_disk_cache(self, tmp_path):
+        """디스크 캐시 파일을 만들고 다시 읽음"""
+        cache_dir = str(tmp_path / "cache")
+        wheel._wheels.clear()
+
+        tickets = build_wheel(11, 3, cache_dir=cache_dir)
+        path = os.path.join(cache_dir, "wheel-11-3-3-50000-3-3.ranks")
+
+        assert os.path.getsize(path) == 4 * len(tickets)
+
+        wheel._wheels.clear()
+        assert build_wheel(11, 3, cache_dir=cache_dir) == tickets
+
+
+class TestWheelTickets:
+    """실제 풀 번호 대응 테스트"""
+
+    def test_maps_to_pool_numbers(self):
+        """티켓 번호는 모두 풀 번호"""
+        pool = [2, 8, 13, 17, 22, 29, 31, 36, 40, 44]
+        tickets = wheel_tickets(pool, 3)
+
+        assert all(set(ticket.numbers) <= set(pool) for ticket in tickets)
+        assert all(
+            any(len(set(ticket.numbers) & set(target)) >= 3 for ticket in tickets) for target in combinations(pool, 3)
+        )
+
+    def test_duplicate_pool(self):
+        """풀 번호 중복 거부"""
+        with pytest.raises(ValueError):
+            wheel_tickets([1, 1, 2, 3, 4, 5, 6], 3)
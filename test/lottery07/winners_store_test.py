@@ -0,0 +1,47 @@
+"""
+lottery07 당첨 티켓 저장소 테스트
+"""
+
+import io
+
+from src.lottery07.model import LottoNumbers
+from src.lottery07.settlement import settle_stream
+from src.lottery07.winners_store import WinnersStore, build_winners_store, read_winner_csv
+
+
+class TestWinnersStore:
+    """당첨 티켓 조회 테스트"""
+
+    def test_lookup(self, tmp_path):
+        """당첨 티켓은 등수, 그 외는 낙첨"""
+        path = str(tmp_path / "winners.bin")
+        build_winners_store(path, [30, 5, 12], [4, 1, 2])
+
+        with WinnersStore(path) as store:
+            assert len(store) == 3
+            assert store.rank(5) == "1st"
+            assert store.rank(12) == "2nd"
+            assert store.rank(30) == "4th"
+            assert store.rank(6) == "fail"
+            assert store.rank(1000) == "fail"
+
+    def test_empty_store(self, tmp_path):
+        """당첨자가 없어도 조회 가능"""
+        path = str(tmp_path / "winners.bin")
+        build_winners_store(path, [], [])
+
+        with WinnersStore(path) as store:
+            assert store.rank(1) == "fail"
+
+    def test_build_from_settlement_output(self, tmp_path):
+        """정산 당첨 CSV로 저장소 생성"""
+        lotto = LottoNumbers(numbers=[1, 2, 3, 4, 5, 6])
+        winner_csv = io.StringIO()
+        settle_stream(["1, 2, 3, 4, 5, 6\n", "7, 8, 9, 10, 11, 12\n", "1, 2, 3, 4, 44, 45\n"], lotto, winner_csv)
+        winner_csv.seek(0)
+        path = str(tmp_path / "winners.bin")
+
+        build_winners_store(path, *read_winner_csv(winner_csv))
+
+        with WinnersStore(path) as store:
+            assert [store.rank(ticket_id) for ticket_id in (1, 2, 3)] == ["1st", "fail", "3rd"]